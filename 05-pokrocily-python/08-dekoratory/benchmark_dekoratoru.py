@@ -0,0 +1,72 @@
+"""
+Mikrobenchmark: kolik stojí jedno volání přes dekorátor.
+
+Každý obal přidává aspoň jedno volání Python funkce navíc (wrapper) a
+předávání *args/**kwargs. U funkce, která sama běží mikrosekundy, to nevadí;
+u drobné funkce volané milionkrát ano. Měří se nejrychlejší z několika
+opakování (timeit) a od času se odečítá volání bez dekorátoru.
+
+Použití:  python benchmark_dekoratoru.py [--pocet 1000000] [--opakovani 5]
+"""
+
+import argparse
+import functools
+import timeit
+
+from dekoratory import davkovano, pamatuj, profilovano
+
+
+def identita(x):
+    return x
+
+
+def prazdny_dekorator(funkce):
+    @functools.wraps(funkce)
+    def wrapper(*args, **kwargs):
+        return funkce(*args, **kwargs)
+    return wrapper
+
+
+@davkovano(max_davka=1, max_cekani=0)
+def hromadne(polozky):
+    return polozky
+
+
+VARIANTY = {
+    "bez dekorátoru": identita,
+    "prázdný wrapper": prazdny_dekorator(identita),
+    "functools.lru_cache (zásah)": functools.lru_cache(maxsize=1024)(identita),
+    "pamatuj (zásah)": pamatuj()(identita),
+    "pamatuj ttl=60 (zásah)": pamatuj(ttl=60)(identita),
+    "profilovano vypnuto": profilovano(zapnuto=False)(identita),
+    "profilovano kazde=100": profilovano(kazde=100, zapnuto=True)(identita),
+    "profilovano kazde=1": profilovano(kazde=1, zapnuto=True)(identita),
+    "davkovano (1 vlákno)": hromadne,
+}
+
+
+def zmer(funkce, pocet: int, opakovani: int) -> float:
+    """Nejlepší čas jednoho volání v ns."""
+    casy = timeit.repeat("f(1)", globals={"f": funkce}, number=pocet, repeat=opakovani)
+    return min(casy) / pocet * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pocet", type=int, default=1_000_000, help="Volání v jednom opakování")
+    parser.add_argument("--opakovani", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'Varianta':<30} {'ns/volání':>10} {'režie [ns]':>11}")
+    zaklad = None
+    for nazev, funkce in VARIANTY.items():
+        # Dávkování je o řády pomalejší (zámky, Future) - stačí méně volání
+        pocet = args.pocet // 100 if funkce is hromadne else args.pocet
+        ns = zmer(funkce, pocet, args.opakovani)
+        if zaklad is None:
+            zaklad = ns
+        print(f"{nazev:<30} {ns:>10.1f} {ns - zaklad:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Sada užitečných dekorátorů: cache, měření latence a dávkování volání.
+
+@pamatuj(max_polozek, ttl, max_bajtu)  - jako functools.lru_cache, navíc
+    s vypršením platnosti (TTL), limitem velikosti v bajtech a statistikou
+    zásahů/minutí pro každou funkci zvlášť.
+@profilovano(kazde)                     - změří jen každé `kazde`-té volání
+    (vzorkování) a sbírá histogram latencí. Vypnuté (PROFILOVANI=0 v
+    prostředí nebo zapnuto=False) vrátí původní funkci - nulová režie.
+@davkovano(max_davka, max_cekani)       - mnoho souběžných volání s jednou
+    položkou (z různých vláken) spojí do jednoho hromadného volání.
+
+Režii jednotlivých dekorátorů měří benchmark_dekoratoru.py.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import NamedTuple
+
+PROFILOVANI = os.environ.get("PROFILOVANI", "1") != "0"
+
+_ZNACKA = object()  # odděluje v klíči poziční a pojmenované argumenty
+
+
+# ==========================================
+# 1. Cache: LRU + TTL + limit bajtů
+# ==========================================
+
+class StatistikyCache(NamedTuple):
+    zasahy: int
+    minuti: int
+    vyprselo: int
+    vyhozeno: int
+    polozek: int
+    bajtu: int
+
+    @property
+    def uspesnost(self) -> float:
+        celkem = self.zasahy + self.minuti
+        return self.zasahy / celkem if celkem else 0.0
+
+
+def pamatuj(max_polozek: int | None = 1024, ttl: float | None = None,
+            max_bajtu: int | None = None, velikost=sys.getsizeof):
+    """
+    Zapamatuje si výsledky funkce podle argumentů (memoizace).
+
+    max_polozek - nejvýše tolik výsledků; při překročení se vyhodí nejdéle
+                  nepoužitý (LRU). None = bez omezení.
+    ttl         - výsledek starší než `ttl` sekund se počítá znovu.
+    max_bajtu   - limit součtu velikostí výsledků podle funkce `velikost`
+                  (výchozí sys.getsizeof měří jen samotný objekt, ne obsah).
+                  Velikost se měří (jen při minutí) i bez limitu, takže
+                  statistiky().bajtu platí vždy.
+
+    Dekorovaná funkce má navíc .statistiky() a .vymaz(). Argumenty musí být
+    hashovatelné. Dvě vlákna, která minou současně, spočítají výsledek obě
+    (výpočet neběží pod zámkem, aby pomalá funkce neblokovala zásahy).
+    """
+    def dekorator(funkce):
+        cache = OrderedDict()  # klíč -> (výsledek, vyprší v, velikost); pořadí = LRU
+        zamek = threading.Lock()
+        # Čísla v seznamu a metody v lokálních proměnných - zásah je nejčastější
+        # cesta, každé vyhledání atributu nebo klíče ve slovníku je na ní znát
+        pocty = [0, 0, 0, 0, 0]  # zásahy, minutí, vypršelo, vyhozeno, bajtů
+        hledej = cache.get
+        oznac_pouziti = cache.move_to_end
+        ted = time.monotonic
+
+        def vyhod(klic) -> None:
+            _, _, bajtu = cache.pop(klic)
+            pocty[4] -= bajtu
+
+        @functools.wraps(funkce)
+        def wrapper(*args, **kwargs):
+            klic = args if not kwargs else (*args, _ZNACKA, *kwargs.items())
+            with zamek:
+                zaznam = hledej(klic)
+                if zaznam is not None:
+                    if ttl is None or zaznam[1] > ted():
+                        oznac_pouziti(klic)
+                        pocty[0] += 1
+                        return zaznam[0]
+                    vyhod(klic)
+                    pocty[2] += 1
+                pocty[1] += 1
+
+            vysledek = funkce(*args, **kwargs)
+            bajtu = velikost(vysledek)
+            vyprsi = ted() + ttl if ttl is not None else None
+            with zamek:
+                if klic in cache:
+                    vyhod(klic)
+                cache[klic] = (vysledek, vyprsi, bajtu)
+                pocty[4] += bajtu
+                while cache and ((max_polozek is not None and len(cache) > max_polozek)
+                                 or (max_bajtu is not None and pocty[4] > max_bajtu)):
+                    vyhod(next(iter(cache)))  # nejdéle nepoužitý je na začátku
+                    pocty[3] += 1
+            return vysledek
+
+        def statistiky() -> StatistikyCache:
+            with zamek:
+                return StatistikyCache(*pocty[:4], len(cache), pocty[4])
+
+        def vymaz() -> None:
+            with zamek:
+                cache.clear()
+                pocty[4] = 0
+
+        wrapper.statistiky = statistiky
+        wrapper.vymaz = vymaz
+        return wrapper
+    return dekorator
+
+
+# ==========================================
+# 2. Vzorkované měření latence
+# ==========================================
+
+class Histogram:
+    """
+    Histogram latencí s logaritmickými přihrádkami: přihrádka i obsahuje
+    doby od 2**(i-1) do 2**i ns. Přidání je jen bit_length() a přičtení.
+    """
+
+    def __init__(self):
+        self.pocty = [0] * 64
+
+    def pridej(self, ns: int) -> None:
+        self.pocty[ns.bit_length()] += 1
+
+    @property
+    def celkem(self) -> int:
+        return sum(self.pocty)
+
+    def percentil(self, p: float) -> int:
+        """Horní mez přihrádky, do které padne p-tý percentil (v ns)."""
+        hranice = self.celkem * p / 100
+        soucet = 0
+        for i, pocet in enumerate(self.pocty):
+            soucet += pocet
+            if pocet and soucet >= hranice:
+                return 2 ** i
+        return 0
+
+    def vypis(self, sirka: int = 40) -> None:
+        nejvic = max(self.pocty) or 1
+        for i, pocet in enumerate(self.pocty):
+            if pocet:
+                od, do = (2 ** (i - 1) if i else 0), 2 ** i
+                print(f"{od / 1000:>10.1f} - {do / 1000:>10.1f} µs {pocet:>8} {'#' * max(1, pocet * sirka // nejvic)}")
+
+
+def profilovano(kazde: int = 100, zapnuto: bool | None = None):
+    """
+    Měří dobu jen každého `kazde`-tého volání a ukládá ji do histogramu
+    (wrapper.histogram). Ostatní volání stojí jen odečtení a porovnání.
+
+    zapnuto=None se řídí proměnnou prostředí PROFILOVANI (výchozí zapnuto).
+    Vypnuté profilování vrátí původní funkci, takže nestojí vůbec nic.
+    Počítadlo není pod zámkem - z více vláken se může vzorkovat o něco
+    častěji či méně často, na statistice to nevadí.
+    """
+    def dekorator(funkce):
+        if not (PROFILOVANI if zapnuto is None else zapnuto):
+            return funkce
+        histogram = Histogram()
+        zbyva = kazde
+
+        @functools.wraps(funkce)
+        def wrapper(*args, **kwargs):
+            nonlocal zbyva
+            zbyva -= 1
+            if zbyva > 0:
+                return funkce(*args, **kwargs)
+            zbyva = kazde
+            start = time.perf_counter_ns()
+            try:
+                return funkce(*args, **kwargs)
+            finally:
+                histogram.pridej(time.perf_counter_ns() - start)
+
+        wrapper.histogram = histogram
+        return wrapper
+    return dekorator
+
+
+# ==========================================
+# 3. Dávkování souběžných volání
+# ==========================================
+
+def davkovano(max_davka: int = 100, max_cekani: float = 0.002):
+    """
+    Dekoruje HROMADNOU funkci (seznam položek -> seznam výsledků ve stejném
+    pořadí) a vrací funkci pro JEDNU položku.
+
+    Vlákno, které přijde k prázdné dávce, se stane "vedoucím": počká nejvýše
+    `max_cekani` s (nebo než se dávka naplní) a pak zavolá hromadnou funkci
+    za všechna vlákna, která mezitím přidala svou položku. Ostatní čekají
+    na svůj výsledek (Future). Výjimka z hromadné funkce dostane každý z dávky.
+
+    Typické použití: jeden dotaz do databáze / HTTP API pro 100 položek
+    místo 100 dotazů. Hromadná funkce je dostupná jako wrapper.hromadne.
+    """
+    def dekorator(hromadna):
+        zamek = threading.Lock()
+        plna = threading.Event()
+        cekajici = []  # (položka, Future)
+        pocty = {"volani": 0, "davek": 0}
+
+        def proved(davka: list) -> None:
+            polozky = [polozka for polozka, _ in davka]
+            try:
+                vysledky = hromadna(polozky)
+                if len(vysledky) != len(polozky):
+                    raise ValueError(f"{hromadna.__name__} vrátila {len(vysledky)} výsledků pro {len(polozky)} položek")
+            except BaseException as e:
+                for _, budouci in davka:
+                    budouci.set_exception(e)
+                return
+            for (_, budouci), vysledek in zip(davka, vysledky):
+                budouci.set_result(vysledek)
+
+        @functools.wraps(hromadna)
+        def wrapper(polozka):
+            budouci = Future()
+            with zamek:
+                cekajici.append((polozka, budouci))
+                vedouci = len(cekajici) == 1
+                if len(cekajici) >= max_davka:
+                    plna.set()
+            if vedouci:
+                plna.wait(max_cekani)
+                with zamek:
+                    davka = cekajici[:]
+                    cekajici.clear()
+                    plna.clear()
+                    pocty["volani"] += len(davka)
+                    pocty["davek"] += 1
+                # Mezi naplněním a převzetím mohly přibýt další - nepřekročíme max_davka
+                for od in range(0, len(davka), max_davka):
+                    proved(davka[od:od + max_davka])
+            return budouci.result()
+
+        def prumerna_davka() -> float:
+            with zamek:
+                return pocty["volani"] / pocty["davek"] if pocty["davek"] else 0.0
+
+        wrapper.hromadne = hromadna
+        wrapper.prumerna_davka = prumerna_davka
+        return wrapper
+    return dekorator
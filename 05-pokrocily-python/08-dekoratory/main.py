@@ -7,6 +7,9 @@ aniž bychom přímo modifikovali samotnou funkci.
 """
 
 import functools
+import threading
+
+from dekoratory import davkovano, pamatuj, profilovano
 
 # ==========================================
 # 1. Funkce jako objekty (Opakování)
@@ -129,6 +132,42 @@ def ukazka_pokrocila():
     print(f"\nNázev funkce je nyní správně: {scitani.__name__}")
 
 
+# ==========================================
+# 6. Užitečné dekorátory (dekoratory.py)
+# ==========================================
+
+@pamatuj(max_polozek=100, ttl=60)
+def fibonacci(n):
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+@profilovano(kazde=10)
+def pomaly_soucet(x):
+    return sum(x for _ in range(1000))
+
+@davkovano(max_davka=50, max_cekani=0.01)
+def nacti_uzivatele(idcka):
+    # Představte si jeden SQL dotaz "WHERE id IN (...)" místo 50 dotazů
+    return [f"uživatel {i}" for i in idcka]
+
+def ukazka_nastroje():
+    print("--- 6. Cache, profilování a dávkování ---")
+    print(f"fibonacci(80) = {fibonacci(80)}")
+    print(f"Statistika cache: {fibonacci.statistiky()}")
+
+    for i in range(1000):
+        pomaly_soucet(i)
+    print(f"\nZměřeno {pomaly_soucet.histogram.celkem} z 1000 volání, "
+          f"medián do {pomaly_soucet.histogram.percentil(50) / 1000:.1f} µs:")
+    pomaly_soucet.histogram.vypis()
+
+    vlakna = [threading.Thread(target=nacti_uzivatele, args=(i,)) for i in range(200)]
+    for vlakno in vlakna:
+        vlakno.start()
+    for vlakno in vlakna:
+        vlakno.join()
+    print(f"\n200 volání nacti_uzivatele, průměrná dávka: {nacti_uzivatele.prumerna_davka():.1f} položek")
+
+
 # ==========================================
 # Hlavní spouštěcí blok
 # ==========================================
@@ -137,4 +176,6 @@ if __name__ == "__main__":
     ukazka_vnorene_funkce()
     ukazka_rucni_dekorator()
     ukazka_zavinac()
-    ukazka_pokrocila()
\ No newline at end of file
+    ukazka_pokrocila()
+    print()
+    ukazka_nastroje()
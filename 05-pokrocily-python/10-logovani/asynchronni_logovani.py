@@ -0,0 +1,226 @@
+"""
+Asynchronní logování: zápis do souboru mimo vlákno, které loguje.
+
+logging.basicConfig(filename=...) zapisuje synchronně: každé volání
+logging.info() zformátuje zprávu, zapíše ji do souboru a zavolá flush()
+- program čeká na disk. Tady volající jen vloží záznam do fronty
+(QueueHandler) a vše ostatní udělá vlákno na pozadí (QueueListener):
+
+    logging.info(...) -> RychlyQueueHandler -> fronta -> QueueListener
+                                                            -> DavkovyRotujiciHandler -> soubor
+
+DavkovyRotujiciHandler zapisuje přes velký buffer a flush() volá jen
+jednou za `davka` záznamů (nebo po `interval` s, nebo hned u ERROR a výš).
+Soubor rotuje podle velikosti i času: aplikace.log -> aplikace.log.1 -> ...
+
+JsonFormatter zapisuje jeden JSON objekt na řádek (JSON Lines) - logy
+pak jde strojově filtrovat a načítat (jq, pandas.read_json(lines=True)).
+
+Použití:
+    listener = nastav_logovani("aplikace.log", jako_json=True)
+    logging.info("Zpracováno %d položek", pocet)    # %-styl: formátuje se až při zápisu
+    zastav_logovani(listener)                        # dopíše frontu (volá se i při exit)
+"""
+
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import queue
+import time
+
+
+class DavkovyRotujiciHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler, který nevolá flush() po každém záznamu.
+
+    max_bajtu   - rotace, když soubor přeroste tuto velikost (počítají se
+                  znaky, u češtiny je to tedy jen přibližně bajtů)
+    rotace_po   - rotace i po tolika sekundách (None = jen podle velikosti)
+    davka       - flush po tolika záznamech
+    interval    - flush, pokud od posledního uplynulo víc sekund
+                  (kontroluje se při dalším záznamu)
+    rezim       - 'a' připojí na konec, 'w' přepíše soubor při startu
+                  (jako filemode u basicConfig)
+    Záznamy od ERROR výš se zapíší na disk hned.
+    """
+
+    def __init__(self, soubor: str, max_bajtu: int = 10 * 2**20, pocet_zaloh: int = 5,
+                 rotace_po: float | None = None, davka: int = 256, interval: float = 1.0,
+                 encoding: str = "utf-8", velikost_bufferu: int = 2**20, rezim: str = "a"):
+        self.velikost_bufferu = velikost_bufferu
+        self.davka = davka
+        self.interval = interval
+        self.rotace_po = rotace_po
+        self._zapsano = 0
+        self._od_flush = 0
+        self._posledni_flush = time.monotonic()
+        self._pristi_rotace = time.time() + rotace_po if rotace_po else None
+        super().__init__(soubor, maxBytes=max_bajtu, backupCount=pocet_zaloh, encoding=encoding, delay=True)
+        self.mode = rezim  # RotatingFileHandler s maxBytes > 0 by vnutil 'a'
+        self.delay = False  # jinak by doRollover() nový soubor neotevřel
+        self.stream = self._open()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, encoding=self.encoding,
+                      buffering=self.velikost_bufferu)
+        self._zapsano = stream.tell()  # u režimu 'a' navazujeme na existující soubor
+        return stream
+
+    def shouldRollover(self, record) -> bool:
+        # Bez seek()/tell() na každý záznam jako v RotatingFileHandler - velikost si počítáme sami
+        if self._pristi_rotace is not None and time.time() >= self._pristi_rotace:
+            return True
+        return 0 < self.maxBytes <= self._zapsano
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        if self.rotace_po:
+            self._pristi_rotace = time.time() + self.rotace_po
+
+    def emit(self, record) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            zprava = self.format(record) + self.terminator
+            self.stream.write(zprava)
+            self._zapsano += len(zprava)
+            self._od_flush += 1
+            if (self._od_flush >= self.davka or record.levelno >= logging.ERROR
+                    or time.monotonic() - self._posledni_flush >= self.interval):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super().flush()
+        self._od_flush = 0
+        self._posledni_flush = time.monotonic()
+
+
+class JsonFormatter(logging.Formatter):
+    """Jeden záznam = jeden řádek JSON. Vlastní pole přes extra={...} se přidají také."""
+
+    # Atributy, které má každý LogRecord - vše ostatní přišlo z extra={...}
+    STANDARDNI = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+    def format(self, record) -> str:
+        data = {
+            "cas": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "uroven": record.levelname,
+            "logger": record.name,
+            "zprava": record.getMessage(),
+            "funkce": record.funcName,
+            "radek": record.lineno,
+        }
+        for klic, hodnota in vars(record).items():
+            if klic not in self.STANDARDNI:
+                data[klic] = hodnota
+        if record.exc_info:
+            data["vyjimka"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class LogovaciVlakno(logging.handlers.QueueListener):
+    """
+    QueueListener, který si pamatuje, jestli běží - stop() jde volat opakovaně.
+    Zná i logger a QueueHandler, který do fronty zapisuje, aby ho šlo po
+    zastavení odebrat (jinak by se fronta plnila a nikdo ji nečetl).
+    """
+
+    def __init__(self, fronta, *handlery, respect_handler_level: bool = False,
+                 logger: logging.Logger | None = None, vstup: logging.Handler | None = None):
+        super().__init__(fronta, *handlery, respect_handler_level=respect_handler_level)
+        self.logger = logger
+        self.vstup = vstup
+        self.bezi = False
+
+    def start(self) -> None:
+        super().start()
+        self.bezi = True
+
+    def stop(self) -> None:
+        if not self.bezi:
+            return
+        self.bezi = False
+        super().stop()
+
+
+class RychlyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler.prepare() zprávu zformátuje už ve volajícím vlákně (kvůli
+    posílání mezi procesy). Fronta mezi vlákny to nepotřebuje - záznam
+    předáme beze změny a formátování proběhne až ve vlákně listeneru.
+
+    Pozor: měnitelné argumenty (seznam, slovník) se formátují až později,
+    pokud je volající mezitím změní, v logu bude nová hodnota.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+# Globální nastavení modulu logging před misto_volani=False (obnoví ho zastav_logovani)
+_puvodni_misto_volani: dict | None = None
+
+
+def nastav_logovani(soubor: str, uroven: int = logging.DEBUG, asynchronne: bool = True,
+                    jako_json: bool = False, logger: logging.Logger | None = None,
+                    misto_volani: bool = True,
+                    **nastaveni_souboru) -> LogovaciVlakno | None:
+    """
+    Nastaví logger (výchozí root) na zápis do `soubor` přes DavkovyRotujiciHandler
+    (nastaveni_souboru jsou jeho parametry, např. rezim="w").
+    Vrací běžící LogovaciVlakno (nebo None, když asynchronne=False).
+
+    misto_volani=False vypne (pro celý proces, do zastav_logovani) zjišťování
+    funkce a řádku volání a ID vlákna/procesu v záznamech - vytvoření
+    LogRecord je pak několikrát levnější (viz "Optimization" v Logging
+    HOWTO), ale funcName a lineno budou prázdné.
+    """
+    global _puvodni_misto_volani
+    if not misto_volani:
+        if _puvodni_misto_volani is None:
+            _puvodni_misto_volani = {nazev: getattr(logging, nazev) for nazev in
+                                     ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing")}
+        logging._srcfile = None  # bez procházení zásobníku volání (findCaller)
+        logging.logThreads = logging.logProcesses = logging.logMultiprocessing = False
+    logger = logger or logging.getLogger()
+    handler = DavkovyRotujiciHandler(soubor, **nastaveni_souboru)
+    handler.setFormatter(JsonFormatter() if jako_json else
+                         logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    for stary in logger.handlers[:]:
+        logger.removeHandler(stary)
+        stary.close()
+    logger.setLevel(uroven)
+    if not asynchronne:
+        logger.addHandler(handler)
+        return None
+    fronta = queue.SimpleQueue()  # bez zámku na velikost, nejrychlejší fronta mezi vlákny
+    vstup = RychlyQueueHandler(fronta)
+    logger.addHandler(vstup)
+    listener = LogovaciVlakno(fronta, handler, respect_handler_level=True, logger=logger, vstup=vstup)
+    listener.start()
+    atexit.register(zastav_logovani, listener)
+    return listener
+
+
+def zastav_logovani(listener: LogovaciVlakno | None) -> None:
+    """
+    Odpojí frontu od loggeru, počká, až listener zapíše vše z fronty, a zavře
+    soubory. Vrátí i nastavení změněné přes misto_volani=False. Opakované
+    volání nevadí. Další záznamy loggeru už nikam nejdou (nemá handler).
+    """
+    global _puvodni_misto_volani
+    if _puvodni_misto_volani is not None:
+        for nazev, hodnota in _puvodni_misto_volani.items():
+            setattr(logging, nazev, hodnota)
+        _puvodni_misto_volani = None
+    if listener is None or not listener.bezi:
+        return
+    if listener.logger is not None:
+        listener.logger.removeHandler(listener.vstup)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
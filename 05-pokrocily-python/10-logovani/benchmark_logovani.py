@@ -0,0 +1,119 @@
+"""
+Benchmark logování: kolik stojí jedno volání logging.* v zpracuj_seznam().
+
+Měří se "horká cesta" - čas, o který logování zdrží samotný program
+(µs na jedno volání logování). U asynchronních variant se zvlášť měří
+i dopsání fronty na konci (to už program nezdržuje, běží na pozadí).
+
+Varianty:
+  basicConfig      - FileHandler jako v main.py: formát + zápis + flush() při každém volání
+  sync + dávky     - DavkovyRotujiciHandler přímo (formát + zápis do bufferu)
+  async            - RychlyQueueHandler: jen vložení do fronty, zbytek ve vlákně
+  async + JSON     - totéž s JsonFormatter
+  async, rychlé    - async a záznamy bez funkce/řádku volání a ID vlákna (misto_volani=False);
+                     měří se jako poslední, protože nastavení platí pro celý proces
+
+S --uroven INFO (WARNING) jsou DEBUG (a INFO) zprávy vypnuté: porovná se %-styl
+(zpracuj_seznam z main.py) s původní verzí s f-stringy, které se
+sestavují, i když se nic nezapíše.
+
+Použití:  python benchmark_logovani.py [--polozek 100000] [--uroven DEBUG|INFO|WARNING]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from asynchronni_logovani import nastav_logovani, zastav_logovani
+from main import zpracuj_seznam
+
+
+# Původní verze z main.py s f-stringy - pro srovnání
+def bezpecne_deleni_fstring(a, b):
+    logging.debug(f"Volána funkce bezpecne_deleni s argumenty: a={a}, b={b}")
+    try:
+        vysledek = a / b
+        logging.info(f"Dělení proběhlo úspěšně. Výsledek: {vysledek}")
+        return vysledek
+    except ZeroDivisionError:
+        logging.error("Pokus o dělení nulou!", exc_info=True)
+        return None
+
+
+def zpracuj_seznam_fstring(data):
+    logging.info(f"Začínám zpracovávat seznam o délce {len(data)}")
+    for polozka in data:
+        if not isinstance(polozka, (int, float)):
+            logging.warning(f"Přeskakuji neplatnou položku: '{polozka}' (není číslo)")
+            continue
+        logging.debug(f"Počítám s položkou: {polozka}")
+        bezpecne_deleni_fstring(100, polozka)
+    logging.info("Zpracování seznamu dokončeno.")
+
+
+def testovaci_data(pocet: int) -> list:
+    """Většinou čísla, každá tisícá položka je text nebo nula (chyba s tracebackem)."""
+    return ["text" if i % 1000 == 500 else i % 1000 for i in range(1, pocet + 1)]
+
+
+def pocet_volani(data: list) -> int:
+    """Kolikrát zpracuj_seznam zavolá logging.* (i pro vypnuté úrovně)."""
+    textu = sum(1 for x in data if isinstance(x, str))
+    return 2 + textu + 3 * (len(data) - textu)
+
+
+def nastav_basic_config(soubor: str, uroven: int) -> None:
+    logger = logging.getLogger()
+    for stary in logger.handlers[:]:
+        logger.removeHandler(stary)
+        stary.close()
+    handler = logging.FileHandler(soubor, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(uroven)
+
+
+def zmer(varianta: str, funkce, data: list, adresar: str, uroven: int) -> tuple[float, float]:
+    """(µs na volání v horké cestě, s na dopsání fronty)."""
+    soubor = os.path.join(adresar, f"{len(os.listdir(adresar))}.log")
+    listener = None
+    if varianta == "basicConfig":
+        nastav_basic_config(soubor, uroven)
+    else:
+        listener = nastav_logovani(soubor, uroven, asynchronne=varianta.startswith("async"),
+                                   jako_json=varianta.endswith("JSON"), max_bajtu=0,
+                                   misto_volani=not varianta.endswith("rychlé"))
+    start = time.perf_counter()
+    funkce(data)
+    horka = time.perf_counter() - start
+    start = time.perf_counter()
+    zastav_logovani(listener)
+    for handler in logging.getLogger().handlers[:]:
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+    return horka / pocet_volani(data) * 1e6, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--polozek", type=int, default=100_000)
+    parser.add_argument("--uroven", choices=["DEBUG", "INFO", "WARNING"], default="DEBUG")
+    args = parser.parse_args()
+    uroven = getattr(logging, args.uroven)
+    data = testovaci_data(args.polozek)
+
+    print(f"{args.polozek} položek, {pocet_volani(data)} volání logování, úroveň {args.uroven}")
+    print(f"{'Varianta':<16} {'Zprávy':<9} {'µs/volání':>10} {'Dopsání [s]':>12}")
+    with tempfile.TemporaryDirectory() as adresar:
+        for varianta in ["basicConfig", "sync + dávky", "async", "async + JSON", "async, rychlé"]:
+            for nazev, funkce in [("%-styl", zpracuj_seznam), ("f-string", zpracuj_seznam_fstring)]:
+                if nazev == "f-string" and uroven == logging.DEBUG:
+                    continue  # vše se zapisuje, formátuje se stejně
+                us, dopsani = zmer(varianta, funkce, data, adresar, uroven)
+                print(f"{varianta:<16} {nazev:<9} {us:>10.2f} {dopsani:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
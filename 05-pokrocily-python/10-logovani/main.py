@@ -5,29 +5,36 @@ Tento skript ukazuje, jak nahradit print() profesionálním logováním.
 Logování nám umožní zpětně zjistit, co se v programu dělo, i když u toho nesedíme.
 """
 
+import argparse
 import logging
 
+from asynchronni_logovani import nastav_logovani, zastav_logovani
+
 # 1. Základní nastavení (Konfigurace)
 # Nastavíme, že chceme logovat vše od úrovně DEBUG výše
 # a výstup chceme ukládat do souboru 'aplikace.log'
-logging.basicConfig(
-    level=logging.DEBUG,  # Minimální úroveň, která se zaznamená
-    filename='aplikace.log', # Cíl logů (pokud vynecháte, jde to do konzole)
-    filemode='w',         # 'w' přepíše soubor při každém startu, 'a' připojí na konec
-    format='%(asctime)s - %(levelname)s - %(message)s', # Formát zprávy
-    encoding='utf-8'
-)
+def nastav_zakladni_logovani():
+    logging.basicConfig(
+        level=logging.DEBUG,  # Minimální úroveň, která se zaznamená
+        filename='aplikace.log', # Cíl logů (pokud vynecháte, jde to do konzole)
+        filemode='w',         # 'w' přepíše soubor při každém startu, 'a' připojí na konec
+        format='%(asctime)s - %(levelname)s - %(message)s', # Formát zprávy
+        encoding='utf-8'
+    )
 
 # Vytvoření loggeru (pokud chceme logovat do více míst, používáme pojmenované loggery)
 # Pro jednoduchost zde používáme ten základní (root logger) nastavený výše.
 
 def bezpecne_deleni(a, b):
     # Logujeme vstupní data (užitečné pro debugging)
-    logging.debug(f"Volána funkce bezpecne_deleni s argumenty: a={a}, b={b}")
+    # Argumenty předáváme zvlášť (%-styl), ne f-stringem: zpráva se pak
+    # formátuje, jen když se opravdu zapíše. f-string by se sestavil vždy,
+    # i když je úroveň DEBUG vypnutá.
+    logging.debug("Volána funkce bezpecne_deleni s argumenty: a=%s, b=%s", a, b)
     
     try:
         vysledek = a / b
-        logging.info(f"Dělení proběhlo úspěšně. Výsledek: {vysledek}")
+        logging.info("Dělení proběhlo úspěšně. Výsledek: %s", vysledek)
         return vysledek
     
     except ZeroDivisionError:
@@ -36,18 +43,18 @@ def bezpecne_deleni(a, b):
         return None
     
     except TypeError as e:
-        logging.critical(f"Kritická chyba typu: {e}")
+        logging.critical("Kritická chyba typu: %s", e)
         return None
 
 def zpracuj_seznam(data):
-    logging.info(f"Začínám zpracovávat seznam o délce {len(data)}")
+    logging.info("Začínám zpracovávat seznam o délce %d", len(data))
     
     for polozka in data:
         if not isinstance(polozka, (int, float)):
-            logging.warning(f"Přeskakuji neplatnou položku: '{polozka}' (není číslo)")
+            logging.warning("Přeskakuji neplatnou položku: '%s' (není číslo)", polozka)
             continue
             
-        logging.debug(f"Počítám s položkou: {polozka}")
+        logging.debug("Počítám s položkou: %s", polozka)
         bezpecne_deleni(100, polozka)
         
     logging.info("Zpracování seznamu dokončeno.")
@@ -55,10 +62,24 @@ def zpracuj_seznam(data):
 
 # --- Hlavní program ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--async", dest="asynchronne", action="store_true",
+                        help="Zápis přes frontu ve vlákně na pozadí (asynchronni_logovani.py)")
+    parser.add_argument("--json", action="store_true", help="Záznamy jako JSON Lines (jen s --async)")
+    args = parser.parse_args()
+
+    listener = None
+    if args.asynchronne:
+        # rezim='w' jako filemode='w' u basicConfig - obě cesty začínají s prázdným logem
+        listener = nastav_logovani('aplikace.log', jako_json=args.json, rezim='w')
+    else:
+        nastav_zakladni_logovani()
+
     print("--- Spouštím aplikaci (výstup hledejte v 'aplikace.log') ---")
     
     testovaci_data = [10, 5, 0, "text", 20]
     
     zpracuj_seznam(testovaci_data)
+    zastav_logovani(listener)  # dopíše zbytek fronty
     
     print("--- Hotovo. Podívejte se do souboru 'aplikace.log'. ---")
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""Rotace souborů nesmí ztrácet záznamy a zastavení musí frontu odpojit."""
+
+import glob
+import logging
+import time
+
+from asynchronni_logovani import RychlyQueueHandler, nastav_logovani, zastav_logovani
+
+
+def pocet_radku(soubor) -> int:
+    pocet = 0
+    for cesta in glob.glob(f"{soubor}*"):
+        with open(cesta, encoding="utf-8") as f:
+            pocet += sum(1 for _ in f)
+    return pocet
+
+
+def test_rotace_podle_velikosti_nic_neztrati(tmp_path):
+    soubor = tmp_path / "r.log"
+    listener = nastav_logovani(str(soubor), max_bajtu=2000, pocet_zaloh=100, rezim="w")
+    for i in range(300):
+        logging.info("Záznam %d", i)
+    zastav_logovani(listener)
+    assert pocet_radku(soubor) == 300
+    assert 5 < len(glob.glob(f"{soubor}*")) < 100  # rotuje, ale ne po každém záznamu
+
+
+def test_rotace_podle_casu_nic_neztrati(tmp_path):
+    soubor = tmp_path / "c.log"
+    listener = nastav_logovani(str(soubor), max_bajtu=0, rotace_po=0.2, pocet_zaloh=100)
+    for i in range(5):
+        logging.info("Záznam %d", i)
+        time.sleep(0.1)
+    zastav_logovani(listener)
+    assert pocet_radku(soubor) == 5
+
+
+def test_zastaveni_odpoji_frontu(tmp_path):
+    listener = nastav_logovani(str(tmp_path / "z.log"))
+    zastav_logovani(listener)
+    assert not any(isinstance(h, RychlyQueueHandler) for h in logging.getLogger().handlers)
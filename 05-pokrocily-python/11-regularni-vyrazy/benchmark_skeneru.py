@@ -0,0 +1,173 @@
+"""
+Benchmark skeneru: cenzura tisíců slov a prohledání velkého souboru.
+
+1) Mikrobenchmark: re.search(r"...", text) vs. předkompilovaný vzor.
+2) Na vzorku textu (--vzorek MB) se porovná, kolik MB/s zvládne:
+     alternace   - ručně psané "slovo1|slovo2|..." jako v main.py
+     trie        - Cenzor: jeden regex se sloučenými začátky slov
+     ahocorasick - knihovna pyahocorasick, pokud je nainstalovaná
+                   (pip install pyahocorasick); hranice slov se kontrolují ručně
+   Počty nalezených slov musí vyjít všem stejně.
+3) Celý soubor (výchozí 1 GB) projde Cenzor.skenuj_soubor() přes mmap;
+   vypíše se rychlost a paměť procesu (jen Linux, /proc/self/status):
+     RssAnon - vlastní paměť procesu (objekty Pythonu) - zůstává malá
+     RssFile - stránky namapovaného souboru; patří do cache OS, která je
+               při nedostatku paměti zahodí, a ru_maxrss je počítá také
+
+Soubor se vygeneruje do dočasného adresáře z náhodných "slov", mezi
+kterými je asi 1 % zakázaných. S --soubor se použije existující soubor
+(UTF-8 text, např. log) a zakázaná slova se jen vygenerují.
+
+Použití:  python benchmark_skeneru.py [--velikost 1024] [--slov 5000] [--vzorek 8]
+                                      [--soubor cesta.log]
+"""
+
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+import timeit
+
+from skener import TELEFON, Cenzor
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+ABECEDA = "aábcčdďeéěfghiíjklmnňoópqrřsštťuúůvwxyýzž"
+VELIKOST_BLOKU = 4 * 2**20
+
+
+def nahodna_slova(pocet: int, rng: random.Random) -> list[str]:
+    slova = set()
+    while len(slova) < pocet:
+        slova.add("".join(rng.choices(ABECEDA, k=rng.randint(3, 10))))
+    return sorted(slova)
+
+
+def vytvor_soubor(cesta: str, velikost_mb: int, zakazana: list[str], rng: random.Random) -> None:
+    """Několik různých bloků po 4 MB opakovaných do požadované velikosti."""
+    bezna = nahodna_slova(20_000, rng)
+    bloky = []
+    for _ in range(4):
+        radky, delka = [], 0
+        while delka < VELIKOST_BLOKU:
+            slova = [rng.choice(zakazana) if rng.random() < 0.01 else rng.choice(bezna)
+                     for _ in range(12)]
+            if rng.random() < 0.1:
+                slova[0] = slova[0].capitalize()
+            radek = "INFO " + " ".join(slova) + ".\n"
+            radky.append(radek)
+            delka += len(radek.encode("utf-8"))
+        bloky.append("".join(radky).encode("utf-8"))
+    with open(cesta, "wb") as f:
+        zapsano, i = 0, 0
+        while zapsano < velikost_mb * 2**20:
+            zapsano += f.write(bloky[i % len(bloky)])
+            i += 1
+
+
+def alternace(slova: list[str]) -> re.Pattern:
+    # Delší slova napřed, jinak by "blb" vyhrálo nad "blbec"
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(slova, key=len, reverse=True))) + r")\b",
+                      re.IGNORECASE)
+
+
+def pocet_ahocorasick(slova: list[str], text: str) -> int:
+    automat = ahocorasick.Automaton()
+    for slovo in slova:
+        automat.add_word(slovo, len(slovo))
+    automat.make_automaton()
+    pocet = 0
+    # Automat najde i slova uvnitř jiných slov - celá slova ověříme podle okolí
+    for konec, delka in automat.iter(text.lower()):
+        zacatek = konec - delka + 1
+        if (zacatek == 0 or not text[zacatek - 1].isalnum()) and \
+                (konec + 1 == len(text) or not text[konec + 1].isalnum()):
+            pocet += 1
+    return pocet
+
+
+def mikrobenchmark(pocet: int = 1_000_000) -> None:
+    radek = "Moje telefonní číslo je 123456789 a směrovací číslo je 602."
+    for nazev, prikaz in [("re.search(r'\\d{9}', text)", "re.search(r'\\d{9}', radek)"),
+                          ("TELEFON.search(text)", "TELEFON.search(radek)")]:
+        cas = min(timeit.repeat(prikaz, globals={"re": re, "TELEFON": TELEFON, "radek": radek},
+                                number=pocet, repeat=3))
+        print(f"  {nazev:<28} {cas / pocet * 1e9:>8.0f} ns/volání")
+
+
+def pamet_procesu() -> dict[str, float]:
+    """{'RssAnon': MB, 'RssFile': MB}; mimo Linux prázdný slovník."""
+    try:
+        with open("/proc/self/status") as f:
+            radky = [radek.split() for radek in f]
+    except OSError:
+        return {}
+    return {r[0].rstrip(":"): int(r[1]) / 1024 for r in radky if r[0] in ("RssAnon:", "RssFile:")}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--velikost", type=int, default=1024, help="Velikost souboru v MB")
+    parser.add_argument("--slov", type=int, default=5000, help="Počet zakázaných slov")
+    parser.add_argument("--vzorek", type=int, default=8, help="MB textu pro porovnání metod")
+    parser.add_argument("--soubor", help="Existující soubor místo vygenerovaného")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    zakazana = nahodna_slova(args.slov, rng)
+
+    print("--- Předkompilovaný vzor ---")
+    mikrobenchmark()
+
+    with tempfile.TemporaryDirectory() as adresar:
+        cesta = args.soubor
+        if cesta is None:
+            cesta = os.path.join(adresar, "velky.log")
+            start = time.perf_counter()
+            vytvor_soubor(cesta, args.velikost, zakazana, rng)
+            print(f"\nVygenerováno {os.path.getsize(cesta) / 2**20:.0f} MB za {time.perf_counter() - start:.1f} s")
+
+        with open(cesta, "rb") as f:
+            vzorek = f.read(args.vzorek * 2**20).decode("utf-8", errors="ignore")
+        mb = len(vzorek.encode("utf-8")) / 2**20
+
+        print(f"\n--- {len(zakazana)} zakázaných slov, vzorek {mb:.1f} MB ---")
+        start = time.perf_counter()
+        cenzor = Cenzor(zakazana)
+        print(f"  sestavení trie: {time.perf_counter() - start:.2f} s, "
+              f"vzor {len(cenzor.vzor.pattern)} znaků")
+        metody = [("alternace", alternace(zakazana).findall), ("trie", cenzor.najdi)]
+        if ahocorasick is not None:
+            metody.append(("ahocorasick", lambda text: range(pocet_ahocorasick(zakazana, text))))
+        else:
+            print("  (pyahocorasick není nainstalovaný - přeskočeno)")
+        for nazev, najdi in metody:
+            start = time.perf_counter()
+            pocet = len(najdi(vzorek))
+            cas = time.perf_counter() - start
+            print(f"  {nazev:<12} {pocet:>9} nálezů {cas:>8.2f} s {mb / cas:>8.1f} MB/s")
+        del vzorek
+
+        velikost = os.path.getsize(cesta) / 2**20
+        print(f"\n--- Celý soubor {velikost:.0f} MB přes mmap ---")
+        pred = pamet_procesu()
+        nejvic = dict(pred)
+        start = time.perf_counter()
+        pocet = 0
+        for pocet, _ in enumerate(cenzor.skenuj_soubor(cesta), 1):
+            if pocet % 2**16 == 0:
+                for klic, mb in pamet_procesu().items():
+                    nejvic[klic] = max(nejvic[klic], mb)
+        cas = time.perf_counter() - start
+        print(f"  {pocet} nálezů za {cas:.1f} s ({velikost / cas:.1f} MB/s)")
+        for klic in nejvic:
+            print(f"  {klic}: před {pred[klic]:.0f} MB, nejvýše {nejvic[klic]:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
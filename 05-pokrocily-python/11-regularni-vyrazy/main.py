@@ -7,17 +7,21 @@ validaci a nahrazování textu podle vzorů.
 
 import re
 
+from skener import DATUM_V_ZAVORKACH, EMAIL, TELEFON, Cenzor
+
+# Vzory se kompilují jednou při importu (viz skener.py). re.search(r"...", text)
+# by je při každém volání znovu hledal v cache modulu re.
+
 # ==========================================
 # 1. Základní vyhledávání (Search vs Match)
 # ==========================================
 def zakladni_hledani():
     text = "Moje telefonní číslo je 123456789 a směrovací číslo je 602."
     
-    # Hledáme vzor: 9 číslic za sebou (\d znamená digit/číslice, {9} počet opakování)
-    vzor_telefon = r"\d{9}" 
+    # Vzor TELEFON (skener.py): 9 číslic za sebou (\d znamená digit/číslice, {9} počet opakování)
     
-    # re.search hledá kdekoliv v textu (vrátí první výskyt)
-    nalezeno = re.search(vzor_telefon, text)
+    # search hledá kdekoliv v textu (vrátí první výskyt)
+    nalezeno = TELEFON.search(text)
     
     print("--- 1. Vyhledávání ---")
     if nalezeno:
@@ -25,8 +29,8 @@ def zakladni_hledani():
     else:
         print("Telefonní číslo nenalezeno.")
 
-    # re.match hledá POUZE na začátku řetězce
-    match_na_zacatku = re.match(vzor_telefon, text)
+    # match hledá POUZE na začátku řetězce
+    match_na_zacatku = TELEFON.match(text)
     print(f"Je číslo na začátku textu? {'ANO' if match_na_zacatku else 'NE'}")
     print()
 
@@ -41,13 +45,12 @@ def extrakce_dat():
     WARNING [2023-10-01 14:10]: Disk je téměř plný
     """
     
-    # Hledáme vzor data v hranatých závorkách: [rok-mesic-den cas]
+    # Vzor DATUM_V_ZAVORKACH (skener.py) hledá data v hranatých závorkách: [rok-mesic-den cas]
     # \[ a \] jsou escapované závorky (protože [] mají v regexu speciální význam)
     # (.*?) je tzv. capture group - to co nás zajímá uvnitř
-    vzor_datum = r"\[(.*?)\]"
     
     print("--- 2. Extrakce dat (findall) ---")
-    vsechna_data = re.findall(vzor_datum, log_soubor)
+    vsechna_data = DATUM_V_ZAVORKACH.findall(log_soubor)
     print(f"Nalezené časové známky: {vsechna_data}")
     print()
 
@@ -56,7 +59,7 @@ def extrakce_dat():
 # 3. Validace (E-mail)
 # ==========================================
 def validace_emailu(email):
-    # Komplexní regex pro email (zjednodušený, ale funkční pro většinu)
+    # Vzor EMAIL (skener.py) - komplexní regex pro email (zjednodušený, ale funkční pro většinu)
     # ^ = začátek řetězce
     # [\w\.-]+ = písmena, čísla, tečky nebo pomlčky (uživatel)
     # @ = zavináč
@@ -64,9 +67,8 @@ def validace_emailu(email):
     # \. = tečka před koncovkou
     # [a-zA-Z]{2,} = koncovka (alespoň 2 písmena)
     # $ = konec řetězce
-    vzor = r"^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$"
     
-    je_validni = re.match(vzor, email) is not None
+    je_validni = EMAIL.match(email) is not None
     print(f"Validace e-mailu '{email}': {'OK' if je_validni else 'CHYBA'}")
 
 
@@ -81,12 +83,19 @@ def cenzura_textu():
     hruby_vzor = r"blbec|idiot|hlupák"
     
     # Nahradíme hvězdičkami
-    cenzurovano = re.sub(sprosty_vzor, "***", zprava, flags=re.IGNORECASE)
+    cenzurovano = re.sub(hruby_vzor, "***", zprava, flags=re.IGNORECASE)
     
     print("\n--- 4. Nahrazování (Cenzura) ---")
     print(f"Původní: {zprava}")
     print(f"Po cenzuře: {cenzurovano}")
 
+    # Pro dlouhý seznam slov: Cenzor složí slova do jednoho regexu ve tvaru
+    # trie (blb(?:ec|ost)?) a hledá jen celá slova - "blbost" se u vzoru
+    # "blb" necenzuruje napůl. Vzor se zkompiluje jednou, cenzuruj() už jen hledá.
+    cenzor = Cenzor(["blbec", "idiot", "hlupák"])
+    print(f"Vzor z trie: {cenzor.vzor.pattern}")
+    print(f"Cenzor: {cenzor.cenzuruj(zprava)}")
+
 
 # --- Hlavní program ---
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+"""
+Skener textu: předkompilované vzory, cenzura podle seznamu slov a
+prohledávání velkých souborů přes mmap.
+
+1) re.compile() jednou, ne při každém volání. re.search(r"...", text)
+   vzor pokaždé hledá v interní cache modulu re (a po 512 různých
+   vzorech ho kompiluje znovu). Zkompilovaný vzor v konstantě modulu
+   to přeskočí.
+
+2) Seznam zakázaných slov jako JEDEN regex ve tvaru trie (prefixového
+   stromu). Obyčejné "blbec|blbost|blb" zkouší na každé pozici textu
+   všechna slova jedno po druhém - u tisíců slov tisíce pokusů. Trie
+   sloučí společné začátky:
+
+       blbec|blbost|blb  ->  blb(?:ec|ost)?
+
+   takže engine na každé pozici porovná nejvýš tolik znaků, kolik má
+   nejdelší slovo, bez ohledu na počet slov (jako Aho-Corasick).
+
+3) Soubor přes mmap: OS si stránky souboru načítá a uvolňuje sám.
+   Bajtový vzor běží přímo nad namapovaným souborem; textový vzor po
+   blocích (standardně 4 MB, řezaných na konci řádku), které se dekódují
+   z UTF-8 - \b a IGNORECASE tak fungují pro všechna písmena stejně jako
+   u řetězce. I 1 GB log se prohledá s pár desítkami MB paměti.
+"""
+
+import mmap
+import os
+import re
+from typing import Iterable, Iterator
+
+VELIKOST_BLOKU = 4 * 2**20
+
+# Předkompilované vzory z main.py
+TELEFON = re.compile(r"\d{9}")
+DATUM_V_ZAVORKACH = re.compile(r"\[(.*?)\]")
+EMAIL = re.compile(r"^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$")
+UROVEN_LOGU = re.compile(rb"^(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b", re.MULTILINE)
+
+
+def _trie(slova: Iterable[str]) -> dict:
+    koren = {}
+    for slovo in slova:
+        uzel = koren
+        for znak in slovo:
+            uzel = uzel.setdefault(znak, {})
+        uzel[""] = {}  # tady končí celé slovo
+    return koren
+
+
+def _uzel_na_vzor(uzel: dict) -> str | None:
+    konec_slova = "" in uzel
+    vetve = []
+    jednotlive_znaky = []  # větve, které hned končí -> sloučí se do [abc]
+    for znak in sorted(k for k in uzel if k):
+        podvzor = _uzel_na_vzor(uzel[znak])
+        if podvzor is None:
+            jednotlive_znaky.append(re.escape(znak))
+        else:
+            vetve.append(re.escape(znak) + podvzor)
+    if jednotlive_znaky:
+        vetve.append(jednotlive_znaky[0] if len(jednotlive_znaky) == 1
+                     else "[" + "".join(jednotlive_znaky) + "]")
+    if not vetve:
+        return None
+    if len(vetve) > 1:
+        vzor, jeden_prvek = "(?:" + "|".join(vetve) + ")", True
+    else:
+        vzor, jeden_prvek = vetve[0], bool(jednotlive_znaky)
+    if konec_slova:  # slovo může skončit i tady -> zbytek je nepovinný
+        vzor = vzor + "?" if jeden_prvek else "(?:" + vzor + ")?"
+    return vzor
+
+
+def vzor_z_trie(slova: Iterable[str]) -> str:
+    """Regex (bez hranic slova), který najde kterékoli ze `slova`; společné začátky jsou sloučené."""
+    vzor = _uzel_na_vzor(_trie(slova))
+    if vzor is None:
+        raise ValueError("Seznam slov je prázdný")
+    return vzor
+
+
+def _konec_bloku(mapa: mmap.mmap, od: int, velikost_bloku: int) -> int:
+    """Konec bloku za posledním koncem řádku (nebo mezerou), aby se nerozdělilo slovo ani znak."""
+    do = od + velikost_bloku
+    if do >= len(mapa):
+        return len(mapa)
+    for oddelovac in (b"\n", b" "):
+        konec = mapa.rfind(oddelovac, od, do)
+        if konec >= 0:
+            return konec + 1
+    # Celý blok bez mezery - řežeme aspoň mimo vícebajtový znak UTF-8 (bajty 10xxxxxx)
+    while do > od + 1 and mapa[do] & 0xC0 == 0x80:
+        do -= 1
+    return do
+
+
+def _skenuj_text(mapa: mmap.mmap, vzor: re.Pattern, velikost_bloku: int) -> Iterator[tuple[int, str]]:
+    od = 0
+    while od < len(mapa):
+        do = _konec_bloku(mapa, od, velikost_bloku)
+        # surrogateescape: neplatné bajty přežijí dekódování i zpětné kódování beze změny délky
+        text = mapa[od:do].decode("utf-8", "surrogateescape")
+        pozice, posledni = od, 0
+        for shoda in vzor.finditer(text):
+            # Pozici v bajtech dopočítáváme po kouskách mezi nálezy - celkem O(n)
+            pozice += len(text[posledni:shoda.start()].encode("utf-8", "surrogateescape"))
+            posledni = shoda.start()
+            yield pozice, shoda.group()
+        od = do
+
+
+def skenuj_soubor(cesta: str, vzor: re.Pattern,
+                  velikost_bloku: int = VELIKOST_BLOKU) -> Iterator[tuple[int, str | bytes]]:
+    """
+    Projde soubor vzorem přes mmap; vrací (pozice v bajtech, nalezený text).
+
+    Bajtový vzor (rb"...") běží přímo nad namapovanými stránkami, bez kopie.
+    POZOR: v bajtech zná \b i re.IGNORECASE jen ASCII písmena - "hlupák"
+    tak najde i uprostřed "hlupákovi" a "HLUPÁK" nenajde.
+    Textový vzor se pouští na bloky dekódované z UTF-8 a chová se stejně
+    jako na řetězci; blok se řeže za koncem řádku, takže shoda nesmí
+    přesahovat přes konec řádku.
+    """
+    with open(cesta, "rb") as soubor:
+        if os.fstat(soubor.fileno()).st_size == 0:
+            return  # prázdný soubor nejde namapovat
+        with mmap.mmap(soubor.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if isinstance(vzor.pattern, str):
+                yield from _skenuj_text(mapa, vzor, velikost_bloku)
+                return
+            nalezy = vzor.finditer(mapa)
+            try:
+                for shoda in nalezy:
+                    yield shoda.start(), shoda.group()
+            finally:
+                # finditer drží buffer mmapu - bez uvolnění by mapa.close() selhalo (BufferError)
+                del nalezy
+
+
+class Cenzor:
+    """
+    Najde a zamaskuje slova ze seznamu (jen celá slova, bez ohledu na velikost písmen).
+
+    cenzor = Cenzor(["blbec", "idiot", "hlupák"])
+    cenzor.cenzuruj("Ty Blbče, ty idiote!")   # jen celá slova: "Blbče" ani "idiote" nenajde
+    cenzor.skenuj_soubor("velky.log")         # (pozice, slovo) přes mmap
+    """
+
+    def __init__(self, slova: Iterable[str], nahrada: str | None = None):
+        self.slova = {s.lower() for s in slova if s}
+        self.nahrada = nahrada  # None = hvězdičky podle délky slova
+        self.vzor = re.compile(rf"\b(?:{vzor_z_trie(self.slova)})\b", re.IGNORECASE)
+
+    def _nahrad(self, shoda: re.Match) -> str:
+        return self.nahrada if self.nahrada is not None else "*" * len(shoda.group())
+
+    def cenzuruj(self, text: str) -> str:
+        return self.vzor.sub(self._nahrad, text)
+
+    def najdi(self, text: str) -> list[str]:
+        return self.vzor.findall(text)
+
+    def skenuj_soubor(self, cesta: str) -> Iterator[tuple[int, str]]:
+        """(pozice v bajtech, nalezené slovo malými písmeny) pro každý výskyt v souboru (UTF-8)."""
+        for pozice, nalez in skenuj_soubor(cesta, self.vzor):
+            yield pozice, nalez.lower()
@@ -0,0 +1,110 @@
+"""
+Skutečná spotřeba paměti: seznam vs. generátor vs. roura po dávkách.
+
+main.py porovnává paměť přes sys.getsizeof - ten ale měří jen samotný
+objekt seznamu (pole ukazatelů, 8 B na prvek), ne čísla, na která
+ukazuje (int zabírá dalších 28+ B). tracemalloc sleduje každou alokaci
+Pythonu a get_traced_memory() vrací i ŠPIČKU - nejvíc paměti, kolik
+bylo během výpočtu najednou obsazeno.
+
+Úloha pro všechny varianty: součet druhých mocnin čísel dělitelných 3
+z range(N).
+
+Seznam o 10**8 prvcích by potřeboval několik GB, proto se seznam měří
+jen do --max-seznam prvků (výchozí 10**7).
+tracemalloc výpočet zpomaluje (zaznamenává každou alokaci), proto se
+čas měří v samostatném běhu bez něj (přepínač --cas).
+
+Použití:  python benchmark_pameti.py [--n 100000000] [--max-seznam 10000000] [--davka 10000] [--cas]
+"""
+
+import argparse
+import functools
+import sys
+import time
+import tracemalloc
+
+from roura import Roura
+
+
+def je_delitelne_tremi(x: int) -> bool:
+    return x % 3 == 0
+
+
+def na_druhou(x: int) -> int:
+    return x * x
+
+
+def soucet_davky(davka: list) -> int:
+    return sum(x * x for x in davka if x % 3 == 0)
+
+
+def seznam(n: int):
+    mezivysledek = [x * x for x in range(n) if x % 3 == 0]
+    return sum(mezivysledek), sys.getsizeof(mezivysledek)
+
+
+def generator(n: int):
+    return sum(x * x for x in range(n) if x % 3 == 0), None
+
+
+def roura(n: int):
+    return sum(Roura(range(n)).filtruj(je_delitelne_tremi).mapuj(na_druhou)), None
+
+
+def roura_po_davkach(n: int, velikost_davky: int = 10_000):
+    return sum(Roura(range(n)).davky(velikost_davky).mapuj(soucet_davky)), None
+
+
+VARIANTY = {
+    "seznam": seznam,
+    "generátor": generator,
+    "roura": roura,
+    "roura po dávkách": roura_po_davkach,
+}
+
+
+def spicka_pameti(funkce, n: int):
+    """(výsledek, getsizeof nebo None, špička tracemalloc v bajtech)."""
+    tracemalloc.start()
+    try:
+        vysledek, velikost = funkce(n)
+        _, spicka = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return vysledek, velikost, spicka
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=10**8, help="Počet prvků vstupu")
+    parser.add_argument("--max-seznam", type=int, default=10**7,
+                        help="Nad tento počet prvků se varianta se seznamem přeskočí")
+    parser.add_argument("--davka", type=int, default=10_000, help="Velikost dávky pro rouru po dávkách")
+    parser.add_argument("--cas", action="store_true", help="Změřit i čas (další běh bez tracemalloc)")
+    args = parser.parse_args()
+    VARIANTY["roura po dávkách"] = functools.partial(roura_po_davkach, velikost_davky=args.davka)
+
+    print(f"N = {args.n:,}")
+    print(f"{'Varianta':<18} {'Špička [MB]':>12} {'getsizeof [MB]':>15} {'Čas [s]':>9}")
+    ocekavany = None
+    for nazev, funkce in VARIANTY.items():
+        if funkce is seznam and args.n > args.max_seznam:
+            print(f"{nazev:<18} {'přeskočeno (N > --max-seznam)':>37}")
+            continue
+        vysledek, velikost, spicka = spicka_pameti(funkce, args.n)
+        if ocekavany is None:
+            ocekavany = vysledek
+        assert vysledek == ocekavany, f"{nazev}: jiný výsledek"
+        cas = "-"
+        if args.cas:
+            start = time.perf_counter()
+            funkce(args.n)
+            cas = f"{time.perf_counter() - start:.2f}"
+        velikost = f"{velikost / 2**20:.2f}" if velikost is not None else "-"
+        print(f"{nazev:<18} {spicka / 2**20:>12.2f} {velikost:>15} {cas:>9}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
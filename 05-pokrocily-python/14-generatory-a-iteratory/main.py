@@ -7,6 +7,9 @@ Ukazuje, jak generátory šetří paměť tím, že hodnoty vytvářejí "za bě
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from roura import Roura
 
 # 1. Vlastní Iterátor (Starý, složitý způsob - pro pochopení principu)
 class MujRange:
@@ -76,6 +79,8 @@ if __name__ == "__main__":
     print(f"Generátor: Čas={t1-t0:.4f}s, Velikost v paměti={velikost_gen} BYTES (!!!)")
     
     print(f"\nGenerátor je {velikost_list / velikost_gen:.0f}x menší!")
+    # Pozor: getsizeof měří jen pole ukazatelů seznamu, ne samotná čísla.
+    # Skutečnou špičku paměti (tracemalloc) měří benchmark_pameti.py.
 
     print("\n=== 4. Nekonečný generátor ===")
     fib = fibonacci()
@@ -83,4 +88,14 @@ if __name__ == "__main__":
     for _ in range(5):
         # Ruční volání next()
         print(next(fib), end=" ")
-    print("\n(Generátor čeká na další zavolání...)")
\ No newline at end of file
+    print("\n(Generátor čeká na další zavolání...)")
+
+    print("\n=== 5. Líná roura ===")
+    # Z nekonečného generátoru si vezmeme jen tolik, kolik potřebujeme
+    sude = Roura(fibonacci()).filtruj(lambda x: x % 2 == 0).vezmi(5)
+    print("Prvních 5 sudých Fibonacciho čísel:", sude)
+    print("Posuvné okno:", Roura(range(6)).okno(3).vezmi(10))
+    print("Dávky:", Roura(range(7)).davky(3).vezmi(10))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        # Paralelní map, výsledky ve stejném pořadí jako vstup
+        print("Paralelně:", Roura(range(10)).paralelne(lambda x: x**2, pool).vezmi(10))
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+Líná roura (lazy pipeline) - skládání generátorů do řetězce zpracování.
+
+Každý krok je generátor: nic nepočítá, dokud si konec roury neřekne o další
+prvek. Celou rourou tak v každém okamžiku teče jen pár prvků a paměť
+nezávisí na délce vstupu (10**8 prvků zabere stejně jako 10).
+
+    Roura(range(10**8)).filtruj(lichy).mapuj(na_druhou).davky(1000)
+
+Kroky:
+    mapuj / filtruj     - vestavěné map() a filter() (běží v C, rychlejší než vlastní yield)
+    okno(n, krok)       - posuvné okno n-tic: (1,2,3), (2,3,4), ...
+    davky(n)            - seznamy po n prvcích (itertools.batched od 3.12 vrací n-tice)
+    rozdvoj(n)          - jako itertools.tee, ale s omezeným bufferem
+    paralelne(funkce)   - map v poolu vláken/procesů, výsledky v původním pořadí
+"""
+
+import os
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+
+
+class PrekrocenBuffer(RuntimeError):
+    """Jedna větev rozdvoj() předběhla jinou o víc než max_buffer prvků."""
+
+
+def okno(iterovatelne, velikost: int, krok: int = 1):
+    """Posuvné okno: n-tice `velikost` po sobě jdoucích prvků, posun o `krok`. Neúplné okno na konci se zahodí."""
+    # Kontrola hned při volání, ne až při prvním next() (tělo generátoru běží líně)
+    if velikost < 1 or krok < 1:
+        raise ValueError(f"velikost i krok musí být aspoň 1 (velikost={velikost}, krok={krok})")
+    return _okno(iter(iterovatelne), velikost, krok)
+
+
+def _okno(it, velikost: int, krok: int):
+    aktualni = deque(islice(it, velikost), maxlen=velikost)
+    if len(aktualni) < velikost:
+        return
+    yield tuple(aktualni)
+    while True:
+        nove = list(islice(it, krok))
+        if len(nove) < krok:
+            return
+        aktualni.extend(nove)  # maxlen: staré prvky zleva samy vypadnou
+        yield tuple(aktualni)
+
+
+def davky(iterovatelne, velikost: int):
+    """Seznamy po `velikost` prvcích; poslední může být kratší."""
+    if velikost < 1:
+        raise ValueError(f"velikost dávky musí být aspoň 1 (velikost={velikost})")
+    return _davky(iter(iterovatelne), velikost)
+
+
+def _davky(it, velikost: int):
+    while davka := list(islice(it, velikost)):
+        yield davka
+
+
+class _Vetev:
+    """
+    Jedna větev rozdvoj(). Iterátorová třída místo generátoru: generátor
+    po vyhozené výjimce skončí natrvalo, tahle větev po PrekrocenBuffer
+    dál funguje, jakmile pomalejší větev dožene zpoždění.
+    """
+
+    def __init__(self, it, buffery: dict, cislo: int, max_buffer: int):
+        self._it = it
+        self._buffery = buffery
+        self._cislo = cislo
+        self._moje = buffery[cislo]
+        self._max_buffer = max_buffer
+        self._zavrena = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._moje:
+            return self._moje.popleft()
+        if self._zavrena:
+            raise StopIteration
+        ostatni = [b for c, b in self._buffery.items() if c != self._cislo]
+        # Kontrola PŘED next(it) - prvek vytažený ze vstupu by jinak
+        # ostatním větvím chyběl
+        if any(len(b) >= self._max_buffer for b in ostatni):
+            raise PrekrocenBuffer(f"Větev {self._cislo} předběhla ostatní o víc než {self._max_buffer} prvků")
+        hodnota = next(self._it)
+        for b in ostatni:
+            b.append(hodnota)
+        return hodnota
+
+    def close(self) -> None:
+        """Větev už nebude číst - její fronta se zahodí a přestane se plnit."""
+        self._zavrena = True
+        self._moje.clear()
+        self._buffery.pop(self._cislo, None)
+
+
+def rozdvoj(iterovatelne, n: int = 2, max_buffer: int = 1024) -> tuple:
+    """
+    Rozdělí jeden iterátor na `n` nezávislých větví (jako itertools.tee).
+
+    Prvky, které jedna větev už přečetla a jiná ještě ne, musí někde počkat.
+    itertools.tee je drží bez omezení - když jedna větev doběhne na konec
+    dřív, než druhá začne, skončí v paměti celý vstup. Tady má každá větev
+    frontu nejvýše `max_buffer` prvků a při přetečení se vyhodí PrekrocenBuffer.
+    Větev, která výjimku dostala, o žádný prvek nepřišla a po dočtení
+    pomalejší větve se z ní dá číst dál.
+
+    Zavřená (close()) nebo zahozená větev se přestane plnit. Jen pro jedno vlákno.
+    """
+    it = iter(iterovatelne)
+    buffery = {i: deque() for i in range(n)}
+    vetve = tuple(_Vetev(it, buffery, i, max_buffer) for i in range(n))
+    for i, v in enumerate(vetve):
+        # Zahozená větev (i taková, ze které se nikdy nečetlo) už frontu nepotřebuje
+        weakref.finalize(v, buffery.pop, i, None)
+    return vetve
+
+
+def _mapuj_davku(funkce, davka: list) -> list:
+    # Na úrovni modulu, aby šla poslat do procesu (pickle)
+    return [funkce(x) for x in davka]
+
+
+def paralelni_mapuj(funkce, iterovatelne, executor: Executor | None = None,
+                    ve_vzduchu: int | None = None, davka: int = 1):
+    """
+    Jako map(funkce, iterovatelne), ale výpočty běží v `executor` (pool vláken
+    nebo procesů). Výsledky vrací ve stejném pořadí jako vstup.
+
+    Executor.map() si na začátku odešle úlohy pro CELÝ vstup - u nekonečného
+    nebo obřího generátoru nikdy nevrátí první výsledek a zaplní paměť.
+    Tady je rozpracovaných nejvýše `ve_vzduchu` úloh; další se odešle až
+    po vydání nejstaršího výsledku.
+
+    davka > 1 posílá prvky po dávkách - u procesů se tak platí režie
+    (pickle, meziprocesová fronta) jednou za dávku, ne za každý prvek.
+    Bez `executor` se vytvoří ProcessPoolExecutor a na konci se zavře.
+    """
+    if executor is None:
+        with ProcessPoolExecutor() as vlastni:
+            yield from paralelni_mapuj(funkce, iterovatelne, vlastni, ve_vzduchu, davka)
+        return
+    ve_vzduchu = ve_vzduchu or 2 * (os.cpu_count() or 1)
+    rozpracovane = deque()
+    try:
+        for kus in davky(iterovatelne, davka):
+            if len(rozpracovane) >= ve_vzduchu:
+                yield from rozpracovane.popleft().result()
+            rozpracovane.append(executor.submit(_mapuj_davku, funkce, kus))
+        while rozpracovane:
+            yield from rozpracovane.popleft().result()
+    finally:
+        # Spotřebitel skončil dřív (break, chyba) - neodstartované úlohy zrušíme
+        for budouci in rozpracovane:
+            budouci.cancel()
+
+
+class Roura:
+    """Obal pro řetězení kroků: Roura(zdroj).filtruj(...).mapuj(...). Iterovat jde jen jednou."""
+
+    def __init__(self, zdroj):
+        self._it = iter(zdroj)
+
+    def __iter__(self):
+        return self._it
+
+    def mapuj(self, funkce) -> "Roura":
+        return Roura(map(funkce, self._it))
+
+    def filtruj(self, podminka) -> "Roura":
+        return Roura(filter(podminka, self._it))
+
+    def okno(self, velikost: int, krok: int = 1) -> "Roura":
+        return Roura(okno(self._it, velikost, krok))
+
+    def davky(self, velikost: int) -> "Roura":
+        return Roura(davky(self._it, velikost))
+
+    def rozdvoj(self, n: int = 2, max_buffer: int = 1024) -> tuple["Roura", ...]:
+        return tuple(Roura(v) for v in rozdvoj(self._it, n, max_buffer))
+
+    def paralelne(self, funkce, executor: Executor | None = None,
+                  ve_vzduchu: int | None = None, davka: int = 1) -> "Roura":
+        return Roura(paralelni_mapuj(funkce, self._it, executor, ve_vzduchu, davka))
+
+    def vezmi(self, n: int) -> list:
+        """Prvních n prvků jako seznam (zbytek roury zůstane nepřečtený)."""
+        return list(islice(self._it, n))
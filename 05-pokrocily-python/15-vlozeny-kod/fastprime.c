@@ -1,12 +1,24 @@
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
 
 /*
  * Logika v jazyce C (Výpočetně náročná část)
- * Zjišťuje, zda je číslo n prvočíslo.
+ *
+ * Všechna čísla jsou 64bitová (uint64_t). Výpočty běží bez GIL
+ * (Py_BEGIN_ALLOW_THREADS), takže více Python vláken může počítat
+ * současně na více jádrech.
  */
-int isPrime(int n) {
+
+/*
+ * Zjišťuje, zda je číslo n prvočíslo (zkoušení dělitelů).
+ * Podmínka i <= n / i místo i * i <= n: součin i * i by u velkých n přetekl.
+ */
+int isPrime(uint64_t n) {
     if (n <= 1) return 0;
-    for (int i = 2; i * i <= n; i++) {
+    for (uint64_t i = 2; i <= n / i; i++) {
         if (n % i == 0)
             return 0;
     }
@@ -16,9 +28,9 @@ int isPrime(int n) {
 /*
  * Najde k-té prvočíslo.
  */
-int kthPrime(int k) {
-    int candidate = 2;
-    int count = 0;
+uint64_t kthPrime(uint64_t k) {
+    uint64_t candidate = 2;
+    uint64_t count = 0;
     while (count < k) {
         if (isPrime(candidate)) {
             count++;
@@ -28,24 +40,288 @@ int kthPrime(int k) {
     return candidate;
 }
 
+/*
+ * Rychlý test prvočíselnosti pro celý rozsah uint64_t:
+ * deterministický Miller-Rabin (těchto 12 základů stačí pro n < 2^64).
+ * Násobení modulo potřebuje 128bitový mezivýsledek; překladač bez
+ * __int128 (MSVC) použije zkoušení dělitelů.
+ */
+#ifdef __SIZEOF_INT128__
+static uint64_t mulmod(uint64_t a, uint64_t b, uint64_t m) {
+    return (uint64_t)((unsigned __int128)a * b % m);
+}
+
+static uint64_t powmod(uint64_t a, uint64_t e, uint64_t m) {
+    uint64_t r = 1;
+    a %= m;
+    while (e) {
+        if (e & 1) r = mulmod(r, a, m);
+        a = mulmod(a, a, m);
+        e >>= 1;
+    }
+    return r;
+}
+
+static int isPrimeFast(uint64_t n) {
+    static const uint64_t bases[] = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37};
+    if (n < 2) return 0;
+    for (int i = 0; i < 12; i++) {
+        if (n % bases[i] == 0) return n == bases[i];
+    }
+    uint64_t d = n - 1;
+    int s = 0;
+    while ((d & 1) == 0) { d >>= 1; s++; }
+    for (int i = 0; i < 12; i++) {
+        uint64_t x = powmod(bases[i], d, n);
+        if (x == 1 || x == n - 1) continue;
+        int composite = 1;
+        for (int r = 1; r < s; r++) {
+            x = mulmod(x, x, n);
+            if (x == n - 1) { composite = 0; break; }
+        }
+        if (composite) return 0;
+    }
+    return 1;
+}
+#else
+static int isPrimeFast(uint64_t n) {
+    return isPrime(n);
+}
+#endif
+
+/*
+ * Eratosthenovo síto jen pro lichá čísla: sieve[i] odpovídá číslu 2*i + 1.
+ * Vrací pole prvočísel <= n (malloc, uvolní volající) a jejich počet
+ * v *count, nebo NULL při nedostatku paměti.
+ */
+uint64_t* primesUpTo(uint64_t n, Py_ssize_t* count) {
+    *count = 0;
+    if (n < 2) return malloc(sizeof(uint64_t));  /* prázdné pole (nenulový ukazatel) */
+
+    uint64_t size = (n - 1) / 2 + 1;  /* lichá čísla 1, 3, ..., <= n */
+    unsigned char* sieve = malloc(size);
+    if (sieve == NULL) return NULL;
+    memset(sieve, 1, size);
+    sieve[0] = 0;  /* 1 není prvočíslo */
+    for (uint64_t i = 1; (2 * i + 1) <= n / (2 * i + 1); i++) {
+        if (sieve[i]) {
+            uint64_t p = 2 * i + 1;
+            for (uint64_t j = p * p / 2; j < size; j += p)  /* lichých násobků od p*p */
+                sieve[j] = 0;
+        }
+    }
+
+    Py_ssize_t total = 1;  /* dvojka */
+    for (uint64_t i = 0; i < size; i++) total += sieve[i];
+
+    uint64_t* primes = malloc(total * sizeof(uint64_t));
+    if (primes != NULL) {
+        Py_ssize_t k = 0;
+        primes[k++] = 2;
+        for (uint64_t i = 0; i < size; i++)
+            if (sieve[i]) primes[k++] = 2 * i + 1;
+        *count = total;
+    }
+    free(sieve);
+    return primes;
+}
+
+
+/*
+ * Typ PrimeArray: výsledek primes_up_to.
+ * Drží C pole uint64_t a zpřístupňuje ho přes buffer protocol, takže
+ * memoryview(pole) nebo np.asarray(pole) data nekopírují.
+ */
+typedef struct {
+    PyObject_HEAD
+    uint64_t* data;
+    Py_ssize_t length;
+    Py_ssize_t shape[1];
+    Py_ssize_t strides[1];
+} PrimeArray;
+
+static void PrimeArray_dealloc(PrimeArray* self) {
+    free(self->data);
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static int PrimeArray_getbuffer(PrimeArray* self, Py_buffer* view, int flags) {
+    if (flags & PyBUF_WRITABLE) {
+        PyErr_SetString(PyExc_BufferError, "PrimeArray je jen pro čtení");
+        return -1;
+    }
+    view->obj = (PyObject*)self;
+    Py_INCREF(self);
+    view->buf = self->data;
+    view->len = self->length * sizeof(uint64_t);
+    view->readonly = 1;
+    view->itemsize = sizeof(uint64_t);
+    view->format = (flags & PyBUF_FORMAT) ? "Q" : NULL;
+    view->ndim = 1;
+    view->shape = (flags & PyBUF_ND) ? self->shape : NULL;
+    view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? self->strides : NULL;
+    view->suboffsets = NULL;
+    view->internal = NULL;
+    return 0;
+}
+
+static Py_ssize_t PrimeArray_length(PrimeArray* self) {
+    return self->length;
+}
+
+static PyObject* PrimeArray_item(PrimeArray* self, Py_ssize_t i) {
+    if (i < 0 || i >= self->length) {
+        PyErr_SetString(PyExc_IndexError, "index mimo rozsah");
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(self->data[i]);
+}
+
+static PyBufferProcs PrimeArray_as_buffer = {
+    (getbufferproc)PrimeArray_getbuffer,
+    NULL,
+};
+
+static PySequenceMethods PrimeArray_as_sequence = {
+    .sq_length = (lenfunc)PrimeArray_length,
+    .sq_item = (ssizeargfunc)PrimeArray_item,
+};
+
+static PyTypeObject PrimeArrayType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "fastprime.PrimeArray",
+    .tp_doc = "Pole prvočísel (uint64) s buffer protocolem - np.asarray() ho nekopíruje.",
+    .tp_basicsize = sizeof(PrimeArray),
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_dealloc = (destructor)PrimeArray_dealloc,
+    .tp_as_buffer = &PrimeArray_as_buffer,
+    .tp_as_sequence = &PrimeArray_as_sequence,
+};
+
+
 /*
  * Wrapper funkce pro Python.
  * Převede Python argumenty na C typy, zavolá C funkci a výsledek převede zpět.
  */
 static PyObject* py_kthPrime(PyObject* self, PyObject* args)
 {
-    int n;
-    // Parsování argumentů: "i" znamená integer
-    if (!PyArg_ParseTuple(args, "i", &n))
+    PyObject* arg;
+    uint64_t n, result;
+    // Parsování argumentů: "O" znamená libovolný Python objekt
+    if (!PyArg_ParseTuple(args, "O", &arg))
     {
         return NULL; // Chyba při parsování
     }
-    
-    // Volání C funkce
-    int result = kthPrime(n);
-    
-    // Převedení C int zpět na Python int
-    return Py_BuildValue("i", result);
+    // Převod na 64bitové číslo bez znaménka (záporné číslo -> OverflowError)
+    n = PyLong_AsUnsignedLongLong(arg);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    if (n == 0) {
+        PyErr_SetString(PyExc_ValueError, "k musí být alespoň 1");
+        return NULL;
+    }
+
+    // Volání C funkce - během výpočtu uvolníme GIL (nesahá se na Python objekty)
+    Py_BEGIN_ALLOW_THREADS
+    result = kthPrime(n);
+    Py_END_ALLOW_THREADS
+
+    // Převedení C čísla zpět na Python int
+    return PyLong_FromUnsignedLongLong(result);
+}
+
+static PyObject* py_primesUpTo(PyObject* self, PyObject* args)
+{
+    PyObject* arg;
+    uint64_t n;
+    uint64_t* primes;
+    Py_ssize_t count;
+    if (!PyArg_ParseTuple(args, "O", &arg))
+    {
+        return NULL;
+    }
+    n = PyLong_AsUnsignedLongLong(arg);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    primes = primesUpTo(n, &count);
+    Py_END_ALLOW_THREADS
+
+    if (primes == NULL) {
+        return PyErr_NoMemory();
+    }
+    PrimeArray* result = PyObject_New(PrimeArray, &PrimeArrayType);
+    if (result == NULL) {
+        free(primes);
+        return NULL;
+    }
+    result->data = primes;
+    result->length = count;
+    result->shape[0] = count;
+    result->strides[0] = sizeof(uint64_t);
+    return (PyObject*)result;
+}
+
+/*
+ * is_prime_many(buffer) -> bytearray s 0/1 pro každé číslo.
+ * Vstup je libovolný souvislý buffer celých čísel (array.array, NumPy pole,
+ * memoryview) s prvky o velikosti 1, 2, 4 nebo 8 bajtů; záporná čísla nejsou prvočísla.
+ */
+static PyObject* py_isPrimeMany(PyObject* self, PyObject* args)
+{
+    PyObject* obj;
+    Py_buffer view;
+    if (!PyArg_ParseTuple(args, "O", &obj))
+    {
+        return NULL;
+    }
+    // Buffer si vyžádáme i s formátem, abychom věděli, jak velká a jaká čísla obsahuje
+    if (PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        return NULL;
+    }
+
+    const char* format = view.format ? view.format : "B";
+    if (*format == '@' || *format == '=' || *format == '<') format++;
+    int is_signed = strchr("bhilq", *format) != NULL;
+    if (strchr("bBhHiIlLqQ", *format) == NULL || format[1] != '\0') {
+        // Formátovací řetězec PyErr_Format musí být ASCII, český text předáme jako argument
+        PyErr_Format(PyExc_TypeError, "%s '%s'", "is_prime_many očekává pole celých čísel, ne formát", view.format);
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+
+    Py_ssize_t count = view.len / view.itemsize;
+    PyObject* result = PyByteArray_FromStringAndSize(NULL, count);
+    if (result == NULL) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    unsigned char* out = (unsigned char*)PyByteArray_AS_STRING(result);
+    Py_ssize_t itemsize = view.itemsize;
+    const char* buf = view.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < count; i++) {
+        const char* p = buf + i * itemsize;
+        int64_t value;
+        uint64_t number;
+        switch (itemsize) {
+            case 1: value = is_signed ? *(const int8_t*)p : (int64_t)*(const uint8_t*)p; break;
+            case 2: value = is_signed ? *(const int16_t*)p : (int64_t)*(const uint16_t*)p; break;
+            case 4: value = is_signed ? *(const int32_t*)p : (int64_t)*(const uint32_t*)p; break;
+            default: value = *(const int64_t*)p; break;
+        }
+        if (itemsize == 8 && !is_signed) number = *(const uint64_t*)p;
+        else number = value < 0 ? 0 : (uint64_t)value;
+        out[i] = (unsigned char)isPrimeFast(number);
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&view);
+    return result;
 }
 
 /*
@@ -55,6 +331,10 @@ static PyObject* py_kthPrime(PyObject* self, PyObject* args)
 static PyMethodDef FastPrimeMethods[] = {
     // {název_v_pythonu, C_funkce, typ_argumentů, dokumentace}
     {"kth_prime", (PyCFunction)py_kthPrime, METH_VARARGS, "Vypočítá k-té prvočíslo."},
+    {"primes_up_to", (PyCFunction)py_primesUpTo, METH_VARARGS,
+     "Všechna prvočísla <= n jako PrimeArray (buffer uint64, bez kopírování do NumPy)."},
+    {"is_prime_many", (PyCFunction)py_isPrimeMany, METH_VARARGS,
+     "Pro každé číslo z bufferu celých čísel vrátí 1/0 v bytearray."},
     {NULL, NULL, 0, NULL} // Sentinel (ukončení pole)
 };
 
@@ -63,7 +343,7 @@ static PyMethodDef FastPrimeMethods[] = {
  */
 static struct PyModuleDef fastprimemodule = {
     PyModuleDef_HEAD_INIT,
-    "fastprime",   /* název modulu */
+    "_fastprime",   /* název modulu (C backend balíčku fastprime) */
     "Modul pro rychlý výpočet prvočísel v C.", /* dokumentace */
     -1,       /* velikost stavu per-interpreter (-1 = globální stav) */
     FastPrimeMethods
@@ -71,9 +351,20 @@ static struct PyModuleDef fastprimemodule = {
 
 /*
  * Inicializační funkce modulu.
- * Volá se, když v Pythonu napíšete 'import fastprime'.
+ * Volá se při 'import fastprime._fastprime' (dělá to fastprime/__init__.py).
  */
-PyMODINIT_FUNC PyInit_fastprime(void)
+PyMODINIT_FUNC PyInit__fastprime(void)
 {
-    return PyModule_Create(&fastprimemodule);
-}
\ No newline at end of file
+    if (PyType_Ready(&PrimeArrayType) < 0)
+        return NULL;
+    PyObject* module = PyModule_Create(&fastprimemodule);
+    if (module == NULL)
+        return NULL;
+    Py_INCREF(&PrimeArrayType);
+    if (PyModule_AddObject(module, "PrimeArray", (PyObject*)&PrimeArrayType) < 0) {
+        Py_DECREF(&PrimeArrayType);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,22 @@
+"""
+Balíček fastprime: prvočísla s C backendem a Pythonovou zálohou.
+
+Pokud je C rozšíření zkompilované (python3 setup.py build_ext --inplace),
+použijí se funkce z fastprime._fastprime. Jinak se použije čistě Pythonový
+backend (fastprime._python), takže import nikdy neselže.
+
+BACKEND říká, který backend je aktivní ("c" nebo "python").
+prime_pi a is_prime jsou vždy z Pythonové tabulky prvočísel. primes_up_to
+vrací v obou případech PrimeArray s buffer protocolem.
+"""
+
+try:
+    from ._fastprime import PrimeArray, is_prime_many, kth_prime, primes_up_to
+    BACKEND = "c"
+except ImportError:
+    from ._python import PrimeArray, is_prime_many, kth_prime, primes_up_to
+    BACKEND = "python"
+
+from ._python import is_prime, prime_pi
+
+__all__ = ["BACKEND", "PrimeArray", "is_prime", "is_prime_many", "kth_prime", "prime_pi", "primes_up_to"]
@@ -0,0 +1,140 @@
+"""
+Čistě Pythonový backend balíčku fastprime.
+
+Místo toho, aby každý dotaz znovu zkoušel dělitele od dvojky, si proces
+drží jednu sdílenou tabulku prvočísel (array uint64, seřazená). Když dotaz
+sahá za její konec, tabulka se rozšíří segmentovaným sítem (prosévá se
+jen nový úsek po segmentech VELIKOST_SEGMENTU čísel, takže kromě samotné
+tabulky stačí konstantní paměť; limit se aspoň zdvojnásobí). Dotazy uvnitř tabulky jsou
+jen bisect, tj. O(log n):
+    kth_prime(k)  -> tabulka[k - 1]
+    prime_pi(n)   -> bisect_right(tabulka, n)
+"""
+
+import math
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Základy Miller-Rabinova testu, které stačí pro všechna n < 2^64
+ZAKLADY_MR = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+VELIKOST_SEGMENTU = 1 << 18
+
+
+class PrimeArray(array):
+    """
+    Pythonová obdoba C typu PrimeArray: pole uint64 ("Q").
+
+    Jako každé array.array podporuje buffer protocol, takže memoryview(p)
+    ani np.asarray(p) data nekopírují.
+    """
+
+    def __new__(cls, prvocisla=()):
+        return super().__new__(cls, "Q", prvocisla)
+
+
+class TabulkaPrvocisel:
+    """Rostoucí tabulka všech prvočísel <= limit (bezpečná pro více vláken)."""
+
+    def __init__(self, pocatecni_limit: int = 1 << 16):
+        self.prvocisla = array("Q")
+        self.limit = 1
+        self._zamek = threading.Lock()
+        self.rozsir(pocatecni_limit)
+
+    def rozsir(self, limit: int) -> None:
+        """Zajistí, že tabulka obsahuje všechna prvočísla <= limit."""
+        if limit <= self.limit:
+            return
+        with self._zamek:
+            if limit <= self.limit:  # mezitím rozšířilo jiné vlákno
+                return
+            self._zajisti(max(limit, 2 * self.limit))
+
+    def _zajisti(self, limit: int) -> None:
+        if limit <= self.limit:
+            return
+        # Základní prvočísla do sqrt(limit) musí tabulka mít dřív, než se proseje nový úsek
+        self._zajisti(math.isqrt(limit))
+        self._prosej(self.limit + 1, limit)
+
+    def _prosej(self, od: int, do: int) -> None:
+        """Úsek [od, do] prosévá po segmentech prvočísly z tabulky a nalezená připojí."""
+        for zacatek in range(od, do + 1, VELIKOST_SEGMENTU):
+            konec = min(zacatek + VELIKOST_SEGMENTU - 1, do)
+            segment = bytearray([1]) * (konec - zacatek + 1)
+            for p in self.prvocisla:
+                if p * p > konec:
+                    break
+                prvni = max(p * p, (zacatek + p - 1) // p * p)
+                segment[prvni - zacatek::p] = bytes(len(range(prvni - zacatek, konec - zacatek + 1, p)))
+            for cislo in range(zacatek, min(2, konec + 1)):  # 0 a 1 nejsou prvočísla
+                segment[cislo - zacatek] = 0
+            self.prvocisla.extend(zacatek + i for i, je_prvocislo in enumerate(segment) if je_prvocislo)
+            self.limit = konec
+
+
+_tabulka = TabulkaPrvocisel()
+
+
+def prime_pi(n: int) -> int:
+    """Počet prvočísel <= n."""
+    if n < 2:
+        return 0
+    _tabulka.rozsir(n)
+    return bisect_right(_tabulka.prvocisla, n)
+
+
+def kth_prime(k: int) -> int:
+    """k-té prvočíslo (kth_prime(1) == 2)."""
+    if k < 1:
+        raise ValueError("k musí být alespoň 1")
+    while len(_tabulka.prvocisla) < k:
+        # Odhad p_k < k (ln k + ln ln k) platí pro k >= 6
+        odhad = int(k * (math.log(k) + math.log(math.log(k)))) + 1 if k >= 6 else 13
+        _tabulka.rozsir(max(odhad, 2 * _tabulka.limit))
+    return _tabulka.prvocisla[k - 1]
+
+
+def primes_up_to(n: int) -> PrimeArray:
+    """Všechna prvočísla <= n jako PrimeArray (kopie z tabulky, která dál roste)."""
+    if n < 2:
+        return PrimeArray()
+    _tabulka.rozsir(n)
+    return PrimeArray(_tabulka.prvocisla[:bisect_right(_tabulka.prvocisla, n)])
+
+
+def _miller_rabin(n: int) -> bool:
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in ZAKLADY_MR:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n: int) -> bool:
+    """Uvnitř tabulky bisect, nad ní deterministický Miller-Rabin."""
+    if n < 2:
+        return False
+    if n <= _tabulka.limit:
+        i = bisect_left(_tabulka.prvocisla, n)
+        return i < len(_tabulka.prvocisla) and _tabulka.prvocisla[i] == n
+    if any(n % p == 0 for p in ZAKLADY_MR):
+        return n in ZAKLADY_MR
+    return _miller_rabin(n)
+
+
+def is_prime_many(cisla) -> bytearray:
+    """Pro každé číslo z bufferu (array.array, NumPy pole, ...) vrátí 1/0 v bytearray."""
+    return bytearray(map(is_prime, memoryview(cisla).tolist()))
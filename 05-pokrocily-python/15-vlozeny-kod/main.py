@@ -1,26 +1,30 @@
 """
 15 - Vložený kód: Srovnání výkonu Python vs C
 
-Tento skript porovnává rychlost výpočtu k-tého prvočísla
-v čistém Pythonu a v našem kompilovaném C modulu 'fastprime'.
+Tento skript porovnává rychlost čistého Pythonu a našeho kompilovaného
+C modulu 'fastprime':
+  1. k-té prvočíslo (zkoušení dělitelů)
+  2. všechna prvočísla do n (síto) - výsledek (PrimeArray) se do NumPy nekopíruje
+  3. test prvočíselnosti pro celé pole čísel najednou
+  4. C funkce ve více vláknech (C kód uvolňuje GIL)
 
-POZOR: Před spuštěním musíte modul zkompilovat a nainstalovat!
-V terminálu spusťte:
+Balíček fastprime funguje i bez kompilace (čistě Pythonový backend
+s tabulkou prvočísel). Pro C backend v terminálu spusťte:
     python3 setup.py build_ext --inplace
 """
 
+import array
+import random
 import time
-import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Balíček vybere C backend, pokud je zkompilovaný, jinak Pythonový
+import fastprime
 
-# Zkusíme importovat náš C modul.
-# Pokud neexistuje, vypíšeme návod.
 try:
-    import fastprime
+    import numpy as np
 except ImportError:
-    print("CHYBA: Modul 'fastprime' nebyl nalezen.")
-    print("Musíte ho nejprve zkompilovat příkazem:")
-    print("  python3 setup.py build_ext --inplace")
-    sys.exit(1)
+    np = None
 
 # --- Implementace v čistém Pythonu ---
 def is_prime_py(n):
@@ -41,32 +45,74 @@ def kth_prime_py(k):
             candidate += 1
     return candidate
 
+def primes_up_to_py(n):
+    # Eratosthenovo síto nad bytearray
+    if n < 2:
+        return []
+    sito = bytearray([1]) * (n + 1)
+    sito[0] = sito[1] = 0
+    for p in range(2, int(n**0.5) + 1):
+        if sito[p]:
+            sito[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [i for i, je_prvocislo in enumerate(sito) if je_prvocislo]
+
+
+# --- Měření ---
+def zmer(funkce, opakovani=3):
+    """Nejlepší čas z několika opakování (time.perf_counter je přesnější než time.time)."""
+    nejlepsi = float("inf")
+    for _ in range(opakovani):
+        start = time.perf_counter()
+        vysledek = funkce()
+        nejlepsi = min(nejlepsi, time.perf_counter() - start)
+    return vysledek, nejlepsi
+
+def porovnej(nazev, funkce_py, funkce_c, opakovani=3):
+    vysledek_py, cas_py = zmer(funkce_py, opakovani)
+    vysledek_c, cas_c = zmer(funkce_c, opakovani)
+    zrychleni = cas_py / cas_c if cas_c > 0 else 0
+    shoda = "" if vysledek_py == vysledek_c else "   CHYBA: výsledky se liší!"
+    print(f"{nazev:<34} Python {cas_py:>8.4f} s   fastprime {cas_c:>8.4f} s   {zrychleni:>7.1f}x{shoda}")
+
+
 # --- Hlavní program ---
 def main():
     K = 10_000 # Kolikáté prvočíslo hledáme
-    
-    print(f"--- Srovnání výkonu (hledáme {K}. prvočíslo) ---")
-
-    # 1. Měření Pythonu
-    start_py = time.time()
-    vysledek_py = kth_prime_py(K)
-    end_py = time.time()
-    cas_py = end_py - start_py
-    
-    print(f"Python:\t {vysledek_py} (čas: {cas_py:.4f} s)")
-
-    # 2. Měření C modulu
-    start_c = time.time()
-    vysledek_c = fastprime.kth_prime(K)
-    end_c = time.time()
-    cas_c = end_c - start_c
-    
-    print(f"C Ext:\t {vysledek_c} (čas: {cas_c:.4f} s)")
-
-    # 3. Vyhodnocení
-    zrychleni = cas_py / cas_c if cas_c > 0 else 0
+    N = 5_000_000 # Síto do N
+    POCET_TESTU = 50_000 # Kolik čísel testujeme najednou
+    POCET_VLAKEN = 4
+
+    print(f"--- Srovnání výkonu Python vs fastprime (backend: {fastprime.BACKEND}) ---")
+    if fastprime.BACKEND != "c":
+        print("C modul není zkompilovaný - pro C backend: python3 setup.py build_ext --inplace")
+
+    # 1. k-té prvočíslo
+    porovnej(f"kth_prime({K})", lambda: kth_prime_py(K), lambda: fastprime.kth_prime(K), opakovani=1)
+
+    # 2. Síto - PrimeArray podporuje buffer protocol, len() i indexování
+    porovnej(f"primes_up_to({N:,})", lambda: primes_up_to_py(N),
+             lambda: list(memoryview(fastprime.primes_up_to(N))))
+    if np is not None:
+        # np.asarray PrimeArray nekopíruje; Pythonový backend ale kopíruje výsledek z tabulky
+        _, cas_np = zmer(lambda: np.asarray(fastprime.primes_up_to(N)))
+        popis = "bez kopie" if fastprime.BACKEND == "c" else "s kopií"
+        print(f"{f'  -> jako NumPy pole ({popis})':<34} {'':>17}   fastprime {cas_np:>8.4f} s")
+
+    # 3. Test celého pole najednou (vstup je array.array - buffer bez Python objektů)
+    cisla = array.array("q", (random.randrange(1, 10**9) for _ in range(POCET_TESTU)))
+    porovnej(f"is_prime_many({POCET_TESTU:,} čísel)", lambda: [is_prime_py(c) for c in cisla],
+             lambda: [bool(b) for b in fastprime.is_prime_many(cisla)], opakovani=1)
+
+    # 4. Vlákna: C kód během výpočtu uvolní GIL, takže vlákna běží opravdu paralelně
+    #    (Pythonový backend GIL drží, ale po prvním dotazu už jen hledá v tabulce)
+    K_VLAKNA = 50_000
+    _, cas_serial = zmer(lambda: [fastprime.kth_prime(K_VLAKNA) for _ in range(POCET_VLAKEN)], 1)
+    with ThreadPoolExecutor(POCET_VLAKEN) as pool:
+        _, cas_vlakna = zmer(lambda: list(pool.map(fastprime.kth_prime, [K_VLAKNA] * POCET_VLAKEN)), 1)
+    print(f"{f'{POCET_VLAKEN}x kth_prime({K_VLAKNA}) ve vláknech':<34} "
+          f"sériově {cas_serial:>6.3f} s   vlákna {cas_vlakna:>6.3f} s   {cas_serial / cas_vlakna if cas_vlakna > 0 else 0:>4.1f}x")
     print("-" * 40)
-    print(f"C modul je přibližně {zrychleni:.1f}x rychlejší!")
+    print("Zrychlení ve vláknech je omezené počtem jader CPU.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,13 +1,14 @@
 from setuptools import setup, Extension
 
 # Definice modulu
-# name: název balíčku v Pythonu
+# name: název modulu v Pythonu - C backend je podmodul balíčku fastprime
 # sources: seznam C/C++ souborů
-module = Extension('fastprime', sources=['fastprime.c'])
+module = Extension('fastprime._fastprime', sources=['fastprime.c'])
 
 setup(
     name='fastprime',
-    version='1.0',
+    version='1.1',
     description='Demonstrace C rozšíření pro Python',
+    packages=['fastprime'],
     ext_modules=[module]
-)
\ No newline at end of file
+)
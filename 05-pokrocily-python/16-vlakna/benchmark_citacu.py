@@ -0,0 +1,68 @@
+"""
+Benchmark čítačů: kolik stojí jedno přičtení při různé synchronizaci.
+
+Každé z N vláken přičte --opakovani krát jedničku. Vypíše se čas,
+počet přičtení za sekundu a jestli výsledek sedí (nezamčený čítač
+může přičtení ztrácet).
+
+Použití:  python benchmark_citacu.py [--opakovani 200000] [--vlaken 1 2 4 8]
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from citace import DavkovyCitac, NezamcenyCitac, ProcesovyCitac, ShardovanyCitac, ZamcenyCitac
+
+CITACE = {
+    "nezamčený": NezamcenyCitac,
+    "globální Lock": ZamcenyCitac,
+    "shardovaný": ShardovanyCitac,
+    "dávkový": DavkovyCitac,
+    "multiprocessing.Value": ProcesovyCitac,
+}
+
+
+def pracuj(citac, opakovani: int, start: threading.Barrier) -> None:
+    pridej = citac.pridej
+    start.wait()  # všechna vlákna začnou současně
+    for _ in range(opakovani):
+        pridej()
+    if isinstance(citac, DavkovyCitac):
+        citac.vyprazdni()
+
+
+def zmer(trida, pocet_vlaken: int, opakovani: int) -> tuple[float, int]:
+    citac = trida()
+    bariera = threading.Barrier(pocet_vlaken + 1)
+    vlakna = [threading.Thread(target=pracuj, args=(citac, opakovani, bariera)) for _ in range(pocet_vlaken)]
+    for t in vlakna:
+        t.start()
+    bariera.wait()
+    start = time.perf_counter()
+    for t in vlakna:
+        t.join()
+    return time.perf_counter() - start, citac.hodnota()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--opakovani", type=int, default=200_000, help="Přičtení na vlákno")
+    parser.add_argument("--vlaken", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]} ({'s GIL' if gil else 'bez GIL'}), {args.opakovani:,} přičtení na vlákno")
+    print(f"{'Čítač':<22} {'Vláken':>6} {'Čas [s]':>8} {'Mil. ops/s':>10} {'ns/op':>7}   Výsledek")
+    for nazev, trida in CITACE.items():
+        for pocet in args.vlaken:
+            doba, hodnota = zmer(trida, pocet, args.opakovani)
+            ocekavano = pocet * args.opakovani
+            stav = "OK" if hodnota == ocekavano else f"CHYBA: {hodnota:,} místo {ocekavano:,}"
+            print(f"{nazev:<22} {pocet:>6} {doba:>8.3f} {ocekavano / doba / 1e6:>10.2f} "
+                  f"{doba / ocekavano * 1e9:>7.0f}   {stav}")
+
+
+if __name__ == "__main__":
+    main()
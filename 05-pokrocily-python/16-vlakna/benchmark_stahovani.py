@@ -0,0 +1,57 @@
+"""
+Benchmark stahovače: vlákna vs. asyncio při různé souběžnosti.
+
+Proti lokálnímu zpožďovacímu serveru (každá odpověď trvá --zpozdeni s)
+pošle --pocet požadavků a změří propustnost (požadavků za sekundu)
+a latenci jednotlivých požadavků (medián, 95. a 99. percentil).
+
+Použití:  python benchmark_stahovani.py [--pocet 500] [--zpozdeni 0.05] [--soubeznost 1 10 50 200]
+"""
+
+import argparse
+import statistics
+import time
+
+from stahovac import BACKENDY, Vysledek, vytvor_stahovac
+from zpozdovaci_server import spust_server
+
+
+def percentil(hodnoty: list[float], p: float) -> float:
+    serazene = sorted(hodnoty)
+    return serazene[min(len(serazene) - 1, int(p / 100 * len(serazene)))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pocet", type=int, default=500)
+    parser.add_argument("--zpozdeni", type=float, default=0.05)
+    parser.add_argument("--chyby", type=float, default=0.0, help="Podíl odpovědí 503 (test opakování)")
+    parser.add_argument("--soubeznost", type=int, nargs="+", default=[1, 10, 50, 200])
+    args = parser.parse_args()
+
+    server = spust_server()
+    host, port = server.server_address
+    url = f"http://{host}:{port}/?zpozdeni={args.zpozdeni}&chyba={args.chyby}"
+    urls = [url] * args.pocet
+
+    print(f"{args.pocet} požadavků, zpoždění serveru {args.zpozdeni * 1000:.0f} ms, chyby {args.chyby:.0%}")
+    print(f"{'Backend':<9} {'Souběžnost':>10} {'Čas [s]':>8} {'Req/s':>8} "
+          f"{'p50 [ms]':>9} {'p95 [ms]':>9} {'p99 [ms]':>9} {'Chyb':>5}")
+    for backend in BACKENDY:
+        for soubeznost in args.soubeznost:
+            with vytvor_stahovac(backend, soubeznost=soubeznost, timeout=5.0, pokusy=3, pauza=0.01) as stahovac:
+                start = time.perf_counter()
+                vysledky = stahovac.mapuj(urls)
+                doba = time.perf_counter() - start
+            casy = [v.cas * 1000 for v in vysledky if isinstance(v, Vysledek)]
+            chyb = len(vysledky) - len(casy)
+            # Když selžou všechny požadavky (např. krátký timeout), latence nejsou
+            latence = ([f"{statistics.median(casy):>9.1f}", f"{percentil(casy, 95):>9.1f}",
+                        f"{percentil(casy, 99):>9.1f}"] if casy else [f"{'-':>9}"] * 3)
+            print(f"{backend:<9} {soubeznost:>10} {doba:>8.2f} {args.pocet / doba:>8.0f} "
+                  f"{' '.join(latence)} {chyb:>5}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Čítače pro více vláken - od nejjednoduššího po nejrychlejší.
+
+pridej_do_pokladu v main.py ukazuje chybu souběhu a opravu `with zamek:`.
+Jeden globální zámek kolem KAŽDÉHO přičtení ale vlákna seřadí za sebe:
+všechna se perou o stejný zámek a většinu času čekají.
+
+Řešení: každé vlákno počítá do vlastní proměnné (nikdo jiný do ní
+nezapisuje, takže není potřeba zámek) a hodnoty se sečtou
+  * až při čtení (ShardovanyCitac), nebo
+  * průběžně po dávkách pod zámkem (DavkovyCitac) - zámek se bere
+    jednou za `davka` přičtení místo pokaždé.
+
+Všechny čítače mají stejné API: pridej(n=1) a hodnota().
+"""
+
+import multiprocessing
+import threading
+
+
+class NezamcenyCitac:
+    """Bez synchronizace - rychlý, ale při souběhu ztrácí přičtení (race condition)."""
+
+    def __init__(self):
+        self._hodnota = 0
+
+    def pridej(self, n: int = 1) -> None:
+        self._hodnota += n  # načíst, přičíst, uložit - mezi tím může přepnout vlákno
+
+    def hodnota(self) -> int:
+        return self._hodnota
+
+
+class ZamcenyCitac:
+    """Jeden globální zámek kolem každého přičtení - správně, ale vlákna na sebe čekají."""
+
+    def __init__(self):
+        self._hodnota = 0
+        self._zamek = threading.Lock()
+
+    def pridej(self, n: int = 1) -> None:
+        with self._zamek:
+            self._hodnota += n
+
+    def hodnota(self) -> int:
+        with self._zamek:
+            return self._hodnota
+
+
+class ShardovanyCitac:
+    """
+    Každé vlákno má vlastní buňku (seznam s jedním číslem); zapisuje do ní
+    jen ono, takže pridej() nepotřebuje zámek. hodnota() sečte všechny buňky.
+    Zámek se bere jen při prvním přičtení z nového vlákna (registrace buňky).
+    Buňky skončených vláken zůstávají, takže se jejich přičtení neztratí.
+
+    Během běhu vláken může hodnota() vrátit o chvilku starší součet;
+    po join() všech vláken je přesná.
+    """
+
+    def __init__(self):
+        self._lokalni = threading.local()
+        self._bunky = []
+        self._zamek = threading.Lock()
+
+    def _bunka(self) -> list:
+        try:
+            return self._lokalni.bunka
+        except AttributeError:
+            bunka = self._lokalni.bunka = [0]
+            with self._zamek:
+                self._bunky.append(bunka)
+            return bunka
+
+    def pridej(self, n: int = 1) -> None:
+        try:
+            self._lokalni.bunka[0] += n
+        except AttributeError:  # první přičtení z tohoto vlákna
+            self._bunka()[0] += n
+
+    def hodnota(self) -> int:
+        with self._zamek:
+            bunky = list(self._bunky)
+        return sum(bunka[0] for bunka in bunky)
+
+
+class DavkovyCitac:
+    """
+    Vlákno sčítá lokálně a do společné hodnoty přelije (pod zámkem) vždy
+    po `davka` přičteních. Na konci práce musí vlákno zavolat vyprazdni(),
+    jinak zbytek poslední dávky chybí. hodnota() vidí jen přelité dávky.
+    """
+
+    def __init__(self, davka: int = 1024):
+        self.davka = davka
+        self._lokalni = threading.local()
+        self._hodnota = 0
+        self._zamek = threading.Lock()
+
+    def _stav(self) -> list:
+        """[čekající součet, počet přičtení] aktuálního vlákna."""
+        try:
+            return self._lokalni.stav
+        except AttributeError:
+            stav = self._lokalni.stav = [0, 0]
+            return stav
+
+    def pridej(self, n: int = 1) -> None:
+        stav = self._stav()
+        stav[0] += n
+        stav[1] += 1
+        if stav[1] >= self.davka:
+            with self._zamek:
+                self._hodnota += stav[0]
+            stav[0] = stav[1] = 0
+
+    def vyprazdni(self) -> None:
+        """Přelije zbytek dávky aktuálního vlákna."""
+        stav = self._stav()
+        if stav[0]:
+            with self._zamek:
+                self._hodnota += stav[0]
+        stav[0] = stav[1] = 0
+
+    def hodnota(self) -> int:
+        with self._zamek:
+            return self._hodnota
+
+
+class ProcesovyCitac:
+    """multiprocessing.Value - sdílené číslo i mezi procesy, se zámkem z multiprocessing."""
+
+    def __init__(self):
+        self._hodnota = multiprocessing.Value("q", 0)
+
+    def pridej(self, n: int = 1) -> None:
+        with self._hodnota.get_lock():
+            self._hodnota.value += n
+
+    def hodnota(self) -> int:
+        return self._hodnota.value
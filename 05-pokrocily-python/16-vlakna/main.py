@@ -7,6 +7,9 @@ import threading
 import time
 import requests # Nutné nainstalovat: pip install requests (nebo použijeme time.sleep pro simulaci)
 
+from stahovac import Vysledek, vytvor_stahovac
+from zpozdovaci_server import spust_server
+
 # --- 1. I/O Bound úloha (Zde vlákna pomáhají) ---
 def stahuj_stranku(url):
     print(f"[{threading.current_thread().name}] Začínám stahovat: {url}")
@@ -104,7 +107,30 @@ def demo_race_condition():
         print("OK (Měli jste štěstí, nebo je Lock aktivní)")
 
 
+# --- 4. Pool vláken místo vlákna pro každou URL ---
+def demo_stahovac():
+    print("=== 4. Stahovač s omezenou souběžností (stahovac.py) ===")
+    server = spust_server()  # lokální "pomalý web": každá odpověď trvá 1 s
+    host, port = server.server_address
+    urls = [f"http://{host}:{port}/?zpozdeni=1&stranka={i}" for i in range(6)]
+    urls.append(f"http://{host}:1/neexistuje")  # chyba se nepropadne - dostaneme ji jako výsledek
+
+    start = time.time()
+    with vytvor_stahovac("vlakna", soubeznost=3, timeout=2.0, pokusy=2) as stahovac:
+        vysledky = stahovac.mapuj(urls)
+    end = time.time()
+
+    for vysledek in vysledky:
+        if isinstance(vysledek, Vysledek):
+            print(f"  {vysledek.status} {vysledek.url} ({vysledek.cas:.2f} s)")
+        else:
+            print(f"  CHYBA {vysledek}")
+    print(f"Celkový čas: {end - start:.2f} s (6 stránek po 1 s, najednou max. 3)\n")
+    server.shutdown()
+
+
 if __name__ == "__main__":
     demo_io_bound()
     demo_cpu_bound()
-    demo_race_condition()
\ No newline at end of file
+    demo_race_condition()
+    demo_stahovac()
\ No newline at end of file
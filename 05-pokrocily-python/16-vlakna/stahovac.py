@@ -0,0 +1,285 @@
+"""
+Stahovač s omezenou souběžností, timeouty a opakováním.
+
+demo_io_bound v main.py spouští pro každou URL vlastní vlákno, nesbírá
+výsledky a chyby se ztratí ve vlákně. Tady:
+  * najednou běží nejvýš `soubeznost` požadavků, ostatní čekají ve frontě,
+  * odesli(url) hned vrátí concurrent.futures.Future - výsledek nebo
+    výjimku si volající vyzvedne přes future.result(),
+  * timeout platí pro celý úkol (všechny pokusy, pauzy i přesměrování),
+    neúspěch (chyba sítě, vadná odpověď, 5xx) se opakuje s exponenciálně
+    rostoucí pauzou (+ náhodný rozptyl, aby se klienti nesešli ve stejnou
+    chvíli); přesměrování (3xx s Location) se sleduje, nejvýš 5krát.
+
+Rozhodování (kdy opakovat, kdy přesměrovat, kolik zbývá času) je pro oba
+backendy společné: generátor _Stahovac._postup() jen říká, co udělat
+("stáhni", "počkej"), a backend to provede - blokujícím voláním ve vlákně,
+nebo přes await v asyncio.
+
+Dva backendy se stejným API:
+  VlaknovyStahovac - ThreadPoolExecutor (fronta úloh + N vláken), http.client
+  AsyncStahovac    - asyncio smyčka ve vlákně na pozadí, Semaphore omezuje
+                     souběžnost; úlohy se předávají přes run_coroutine_threadsafe
+
+Použití:
+    with vytvor_stahovac("asyncio", soubeznost=50, timeout=2.0) as stahovac:
+        for vysledek in stahovac.mapuj(urls):
+            print(vysledek.url, vysledek.status, vysledek.cas)
+"""
+
+import asyncio
+import http.client
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+from urllib.parse import urljoin, urlsplit
+
+PRESMEROVANI = {301, 302, 303, 307, 308}
+MAX_PRESMEROVANI = 5
+
+
+class Vysledek(NamedTuple):
+    url: str
+    status: int
+    data: bytes
+    pokusu: int
+    cas: float  # doba od začátku prvního pokusu včetně opakování, bez čekání ve frontě [s]
+    # url je vždy ta zadaná (i po přesměrování), aby šly výsledky spárovat se vstupem
+
+
+class ChybaStahovani(Exception):
+    """Požadavek se nepodařil ani po všech pokusech (původní chyba je v __cause__)."""
+
+
+def _opakovat(status: int) -> bool:
+    # 4xx je chyba klienta - opakování nepomůže; 5xx a 429 jsou dočasné
+    return status >= 500 or status == 429
+
+
+def _cesta(url: str) -> str:
+    casti = urlsplit(url)
+    return (casti.path or "/") + ("?" + casti.query if casti.query else "")
+
+
+class _Stahovac(ABC):
+    def __init__(self, soubeznost: int = 10, timeout: float = 5.0, pokusy: int = 3,
+                 pauza: float = 0.1, max_pauza: float = 5.0):
+        self.soubeznost = soubeznost
+        self.timeout = timeout
+        self.pokusy = pokusy
+        self.pauza = pauza
+        self.max_pauza = max_pauza
+
+    def _pauza_pred_pokusem(self, pokus: int) -> float:
+        """Exponenciální backoff s rozptylem: náhodně z <0, pauza * 2^pokus>."""
+        return random.uniform(0, min(self.max_pauza, self.pauza * 2 ** pokus))
+
+    def _postup(self, url: str):
+        """
+        Logika jednoho úkolu bez I/O, společná oběma backendům. Generátor vydává
+        ("stahni", adresa, zbyva_s) - backend pošle zpět (status, location, data)
+        nebo výjimku - a ("pockej", s) - backend počká a pošle None.
+        Vrací Vysledek, nebo vyhodí ChybaStahovani.
+        """
+        start = time.perf_counter()
+        konec = start + self.timeout
+        adresa, pokus, presmerovani = url, 0, 0
+        while True:
+            zbyva = konec - time.perf_counter()
+            if zbyva <= 0:
+                raise ChybaStahovani(f"{url}: vypršel timeout {self.timeout} s (pokusů: {pokus})")
+            odpoved = yield "stahni", adresa, zbyva
+            if isinstance(odpoved, Exception):
+                chyba, popis = odpoved, repr(odpoved)
+            else:
+                status, lokace, data = odpoved
+                if status in PRESMEROVANI and lokace:
+                    presmerovani += 1
+                    if presmerovani > MAX_PRESMEROVANI:
+                        raise ChybaStahovani(f"{url}: víc než {MAX_PRESMEROVANI} přesměrování")
+                    adresa = urljoin(adresa, lokace)
+                    continue  # přesměrování není neúspěšný pokus
+                if status < 400:
+                    return Vysledek(url, status, data, pokus + 1, time.perf_counter() - start)
+                chyba, popis = None, f"HTTP {status}"
+                if not _opakovat(status):
+                    raise ChybaStahovani(f"{url}: {popis} (pokusů: {pokus + 1})")
+            pokus += 1
+            if pokus >= self.pokusy:
+                raise ChybaStahovani(f"{url}: {popis} (pokusů: {pokus})") from chyba
+            yield "pockej", min(self._pauza_pred_pokusem(pokus), max(0.0, konec - time.perf_counter()))
+
+    @abstractmethod
+    def odesli(self, url: str) -> Future:
+        """Zařadí stažení `url` do fronty a hned vrátí Future s Vysledek (nebo ChybaStahovani)."""
+
+    def mapuj(self, urls) -> list:
+        """Stáhne všechny URL; výsledky jsou ve stejném pořadí, chyba je místo výsledku výjimka."""
+        budouci = [self.odesli(url) for url in urls]
+        vysledky = []
+        for f in budouci:
+            try:
+                vysledky.append(f.result())
+            except Exception as e:
+                vysledky.append(e)
+        return vysledky
+
+    def zavri(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
+
+
+def _http_get_blokujici(url: str, zbyva: float) -> tuple[int, str | None, bytes]:
+    """GET přes http.client; celý pokus (spojení, hlavičky, tělo) musí stihnout do `zbyva` s."""
+    konec = time.monotonic() + zbyva
+    casti = urlsplit(url)
+    trida = http.client.HTTPSConnection if casti.scheme == "https" else http.client.HTTPConnection
+    spojeni = trida(casti.hostname, casti.port, timeout=zbyva)
+    try:
+        spojeni.request("GET", _cesta(url), headers={"Connection": "close"})
+        sock = spojeni.sock  # po getresponse() ho spojení předá odpovědi a zapomene
+
+        def zbyva_cas() -> float:
+            # Timeout socketu platí pro jednu operaci - před každou ho zkrátíme na zbytek pokusu
+            zbyva = konec - time.monotonic()
+            if zbyva <= 0:
+                raise TimeoutError("vypršel čas pokusu")
+            sock.settimeout(zbyva)
+            return zbyva
+
+        zbyva_cas()
+        odpoved = spojeni.getresponse()
+        kusy = []
+        while zbyva_cas() and (kus := odpoved.read1(65536)):
+            kusy.append(kus)
+        return odpoved.status, odpoved.getheader("Location"), b"".join(kusy)
+    finally:
+        spojeni.close()
+
+
+class VlaknovyStahovac(_Stahovac):
+    """Backend s vlákny: ThreadPoolExecutor = fronta úloh + pevný počet vláken."""
+
+    def __init__(self, **nastaveni):
+        super().__init__(**nastaveni)
+        self._pool = ThreadPoolExecutor(self.soubeznost, thread_name_prefix="stahovac")
+
+    def odesli(self, url: str) -> Future:
+        return self._pool.submit(self._stahni, url)
+
+    def _stahni(self, url: str) -> Vysledek:
+        postup = self._postup(url)
+        odpoved = None
+        try:
+            while True:
+                akce = postup.send(odpoved)
+                odpoved = None
+                if akce[0] == "pockej":
+                    time.sleep(akce[1])
+                    continue
+                try:
+                    odpoved = _http_get_blokujici(akce[1], akce[2])
+                except (OSError, http.client.HTTPException) as e:
+                    odpoved = e
+        except StopIteration as hotovo:
+            return hotovo.value
+
+    def zavri(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+class ChybaOdpovedi(http.client.HTTPException):
+    """Server poslal odpověď, která není platné HTTP (opakuje se jako chyba sítě)."""
+
+
+async def _http_get(url: str) -> tuple[int, str | None, bytes]:
+    """Jednoduchý HTTP/1.1 GET nad asyncio (jen pro demo: bez chunked kódování)."""
+    casti = urlsplit(url)
+    port = casti.port or (443 if casti.scheme == "https" else 80)
+    reader, writer = await asyncio.open_connection(casti.hostname, port, ssl=casti.scheme == "https")
+    try:
+        writer.write(f"GET {_cesta(url)} HTTP/1.1\r\nHost: {casti.netloc}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        odpoved = await reader.read()  # Connection: close -> čteme do konce spojení
+    finally:
+        writer.close()
+    hlavicka, oddelovac, telo = odpoved.partition(b"\r\n\r\n")
+    radky = hlavicka.split(b"\r\n")
+    stav = radky[0].split(b" ", 2)
+    if not oddelovac or len(stav) < 2 or not stav[0].startswith(b"HTTP/") or not stav[1].isdigit():
+        raise ChybaOdpovedi(f"Neplatná odpověď serveru: {radky[0][:60]!r}")
+    lokace = None
+    for radek in radky[1:]:
+        jmeno, _, hodnota = radek.partition(b":")
+        if jmeno.strip().lower() == b"location":
+            lokace = hodnota.strip().decode("latin-1")
+    return int(stav[1]), lokace, telo
+
+
+class AsyncStahovac(_Stahovac):
+    """Backend s asyncio: jedna smyčka ve vlákně na pozadí, souběžnost hlídá Semaphore."""
+
+    def __init__(self, **nastaveni):
+        super().__init__(**nastaveni)
+        self._smycka = asyncio.new_event_loop()
+        self._vlakno = threading.Thread(target=self._smycka.run_forever, name="stahovac-asyncio", daemon=True)
+        self._vlakno.start()
+        # Semaphore se musí vytvořit uvnitř smyčky, ve které se bude používat
+        self._semafor = asyncio.run_coroutine_threadsafe(self._vytvor_semafor(), self._smycka).result()
+
+    async def _vytvor_semafor(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.soubeznost)
+
+    def odesli(self, url: str) -> Future:
+        return asyncio.run_coroutine_threadsafe(self._stahni(url), self._smycka)
+
+    async def _stahni(self, url: str) -> Vysledek:
+        async with self._semafor:  # fronta: další korutiny čekají, až se uvolní místo
+            # Čas ve frontě se nepočítá (stejně jako u vláken) - _postup měří až odsud
+            postup = self._postup(url)
+            odpoved = None
+            try:
+                while True:
+                    akce = postup.send(odpoved)
+                    odpoved = None
+                    if akce[0] == "pockej":
+                        await asyncio.sleep(akce[1])
+                        continue
+                    try:
+                        odpoved = await asyncio.wait_for(_http_get(akce[1]), akce[2])
+                    except (asyncio.TimeoutError, OSError, http.client.HTTPException) as e:
+                        odpoved = e
+            except StopIteration as hotovo:
+                return hotovo.value
+
+    async def _dokonci_ulohy(self) -> None:
+        ulohy = [u for u in asyncio.all_tasks() if u is not asyncio.current_task()]
+        await asyncio.gather(*ulohy, return_exceptions=True)
+
+    def zavri(self) -> None:
+        """Počká na rozpracované požadavky (jako ThreadPoolExecutor.shutdown) a zastaví smyčku."""
+        if self._smycka.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._dokonci_ulohy(), self._smycka).result()
+        self._smycka.call_soon_threadsafe(self._smycka.stop)
+        self._vlakno.join()
+        self._smycka.close()
+
+
+BACKENDY = {
+    "vlakna": VlaknovyStahovac,
+    "asyncio": AsyncStahovac,
+}
+
+
+def vytvor_stahovac(backend: str = "vlakna", **nastaveni) -> _Stahovac:
+    """backend: "vlakna" nebo "asyncio"; nastaveni: soubeznost, timeout, pokusy, pauza, max_pauza."""
+    return BACKENDY[backend](**nastaveni)
@@ -0,0 +1,79 @@
+"""
+Lokální HTTP server, který odpovídá se zpožděním - simulace pomalého webu.
+
+    GET /?zpozdeni=0.2           odpoví po 200 ms
+    GET /?zpozdeni=0.2&chyba=0.1 v 10 % případů vrátí 503 (pro test opakování)
+    GET /?presmeruj=2            dvakrát přesměruje (302), pak odpoví
+    GET /?rozbite=0.1            v 10 % případů pošle neplatný stavový řádek
+
+Každý požadavek obsluhuje vlastní vlákno (ThreadingHTTPServer), takže
+server zvládne stovky souběžných požadavků a měří se jen klient.
+"""
+
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+class ZpozdovaciHandler(BaseHTTPRequestHandler):
+    # Bez Naglova algoritmu - jinak malé odpovědi čekají na zpožděné ACK (~40 ms)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parametry = parse_qs(urlsplit(self.path).query)
+        zpozdeni = float(parametry.get("zpozdeni", ["0"])[0])
+        podil_chyb = float(parametry.get("chyba", ["0"])[0])
+        presmeruj = int(parametry.get("presmeruj", ["0"])[0])
+        time.sleep(zpozdeni)
+        if random.random() < float(parametry.get("rozbite", ["0"])[0]):
+            self.wfile.write(b"NESMYSL\r\n\r\n")
+            self.close_connection = True
+            return
+        if random.random() < podil_chyb:
+            self.send_error(503, "Simulovaná chyba")
+            return
+        if presmeruj > 0:
+            parametry["presmeruj"] = [str(presmeruj - 1)]
+            self.send_response(302)
+            self.send_header("Location", "/?" + urlencode(parametry, doseq=True))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        telo = f"OK po {zpozdeni:.3f} s\n".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(telo)))
+        self.end_headers()
+        self.wfile.write(telo)
+
+    def log_message(self, format, *args):
+        pass  # bez výpisu každého požadavku
+
+
+class ZpozdovaciServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # backlog pro stovky souběžných spojení
+
+    def handle_error(self, request, client_address):
+        # Klient, kterému vypršel timeout, zavře spojení dřív, než odpovíme - to není chyba serveru
+        if not issubclass(sys.exc_info()[0], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def spust_server(port: int = 0) -> ZpozdovaciServer:
+    """Spustí server ve vlákně na pozadí; adresa je v server.server_address."""
+    server = ZpozdovaciServer(("127.0.0.1", port), ZpozdovaciHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    server = ZpozdovaciServer(("127.0.0.1", 8000), ZpozdovaciHandler)
+    print("Server běží na http://127.0.0.1:8000/?zpozdeni=0.5 (Ctrl+C ukončí)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,227 @@
+"""
+Benchmark: stejná úloha sériově, ve vláknech, v procesech (a v subinterpreterech).
+
+main.py (a demo_cpu_bound v lekci 16-vlakna) měří jeden běh pomocí
+time.time() a v každém vlákně/procesu počítá celou úlohu znovu. Tady:
+  * úloha (kernel) je funkce, která zpracuje jeden kus práce, např. (od, do),
+  * strategie rozdělení určí, na jaké kusy se práce rozdělí,
+  * každý executor se spustí nejdřív naprázdno (zahřátí - start procesů,
+    importy) a pak opakovaně; bere se nejlepší čas a medián,
+  * výsledkem je tabulka zrychlení a efektivity a volitelně řádek JSON
+    (lze připisovat do souboru a sledovat vývoj výkonu v čase).
+
+Executory:
+  serial      - obyčejný map v hlavním vlákně (základ pro zrychlení)
+  vlakna      - ThreadPoolExecutor (na Pythonu bez GIL = opravdu paralelní)
+  procesy     - ProcessPoolExecutor
+  interpretery - InterpreterPoolExecutor (Python 3.14+), jinak se přeskočí
+
+Použití:
+    python benchmark_executoru.py --uloha prvocisla --velikost 2000000 --workeru 1 2 4
+    python benchmark_executoru.py --uloha cekani --workeru 8 32 --json vysledky.jsonl
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent import futures
+from datetime import datetime
+
+
+# --- Úlohy (kernely): zpracují jeden kus práce (od, do) ---
+
+def prvocisla_v_rozsahu(rozsah: tuple[int, int]) -> int:
+    """Počet prvočísel v [od, do) naivním zkoušením dělitelů (jako spocitej_prvocisla v main.py)."""
+    od, do = rozsah
+    count = 0
+    for i in range(max(od, 2), do):
+        for j in range(2, int(i ** 0.5) + 1):
+            if i % j == 0:
+                break
+        else:
+            count += 1
+    return count
+
+
+def odpocitavani(rozsah: tuple[int, int]) -> int:
+    """Prázdná smyčka jako narocny_vypocet v lekci 16-vlakna."""
+    od, do = rozsah
+    n = do - od
+    while n > 0:
+        n -= 1
+    return do - od
+
+
+def cekani(rozsah: tuple[int, int]) -> int:
+    """I/O úloha: každá položka = 10 ms čekání (simulace síťového požadavku)."""
+    od, do = rozsah
+    for _ in range(od, do):
+        time.sleep(0.01)
+    return do - od
+
+
+ULOHY = {
+    "prvocisla": prvocisla_v_rozsahu,
+    "odpocitavani": odpocitavani,
+    "cekani": cekani,
+}
+
+# Výchozí --velikost pro každou úlohu: sériový běh zhruba do sekundy
+# (1 000 000 čekání po 10 ms by trvalo skoro 3 hodiny)
+VYCHOZI_VELIKOST = {
+    "prvocisla": 1_000_000,
+    "odpocitavani": 20_000_000,
+    "cekani": 64,
+}
+
+
+# --- Strategie rozdělení práce: (velikost, pocet_workeru) -> seznam kusů ---
+
+def rovnomerne(velikost: int, pocet_workeru: int) -> list[tuple[int, int]]:
+    """Každý worker dostane jeden stejně velký kus."""
+    hranice = [velikost * i // pocet_workeru for i in range(pocet_workeru + 1)]
+    return [(od, do) for od, do in zip(hranice, hranice[1:]) if od < do]
+
+
+def jemne(velikost: int, pocet_workeru: int, kusu_na_workera: int = 8) -> list[tuple[int, int]]:
+    """Víc menších kusů - vyrovná nerovnoměrnou práci (např. větší čísla = dražší test)."""
+    return rovnomerne(velikost, pocet_workeru * kusu_na_workera)
+
+
+ROZDELENI = {
+    "rovnomerne": rovnomerne,
+    "jemne": jemne,
+}
+
+
+# --- Executory ---
+
+def _serial_map(uloha, kusy):
+    return list(map(uloha, kusy))
+
+
+def dostupne_executory() -> dict:
+    """Název -> třída executoru (None = sériově). Nedostupné se vynechají."""
+    executory = {
+        "serial": None,
+        "vlakna": futures.ThreadPoolExecutor,
+        "procesy": futures.ProcessPoolExecutor,
+    }
+    if hasattr(futures, "InterpreterPoolExecutor"):
+        executory["interpretery"] = futures.InterpreterPoolExecutor
+    return executory
+
+
+def ma_gil() -> bool:
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def zmer_executor(uloha, kusy, executor_trida, pocet_workeru: int, opakovani: int, zahrivani: int) -> dict:
+    """Změří jeden executor; pool se vytvoří jednou, takže start procesů padne do zahřátí."""
+    if opakovani < 1:
+        raise ValueError("opakovani musí být alespoň 1")
+    casy = []
+    if executor_trida is None:
+        spust = lambda: _serial_map(uloha, kusy)
+        pool = None
+    else:
+        pool = executor_trida(max_workers=pocet_workeru)
+        spust = lambda: list(pool.map(uloha, kusy))
+    try:
+        for _ in range(zahrivani):
+            spust()
+        for _ in range(opakovani):
+            start = time.perf_counter()
+            vysledky = spust()
+            casy.append(time.perf_counter() - start)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return {"min_s": min(casy), "median_s": statistics.median(casy), "vysledek": sum(vysledky)}
+
+
+def benchmark(uloha, velikost: int, rozdeleni=rovnomerne, pocty_workeru=(1, 2, 4),
+              executory: list[str] | None = None, opakovani: int = 3, zahrivani: int = 1) -> list[dict]:
+    """
+    Spustí úlohu pro všechny executory a počty workerů.
+    Zrychlení a efektivita se počítají vůči sériovému běhu.
+    """
+    dostupne = dostupne_executory()
+    nazvy = [n for n in (executory or dostupne) if n in dostupne]
+
+    zaklad = zmer_executor(uloha, rozdeleni(velikost, 1), None, 1, opakovani, zahrivani)
+    zaznamy = [{"executor": "serial", "workeru": 1, **zaklad, "zrychleni": 1.0, "efektivita": 1.0}]
+    for nazev in nazvy:
+        if nazev == "serial":
+            continue
+        for pocet in pocty_workeru:
+            vysledek = zmer_executor(uloha, rozdeleni(velikost, pocet), dostupne[nazev],
+                                     pocet, opakovani, zahrivani)
+            zrychleni = zaklad["min_s"] / vysledek["min_s"]
+            zaznamy.append({"executor": nazev, "workeru": pocet, **vysledek,
+                            "zrychleni": zrychleni, "efektivita": zrychleni / pocet})
+    return zaznamy
+
+
+def vypis_tabulku(zaznamy: list[dict]) -> None:
+    print(f"{'Executor':<13} {'Workerů':>7} {'Min [s]':>9} {'Medián [s]':>11} "
+          f"{'Zrychlení':>10} {'Efektivita':>11} {'Výsledek':>12}")
+    for z in zaznamy:
+        print(f"{z['executor']:<13} {z['workeru']:>7} {z['min_s']:>9.3f} {z['median_s']:>11.3f} "
+              f"{z['zrychleni']:>9.2f}x {z['efektivita']:>10.0%} {z['vysledek']:>12}")
+    if len({z["vysledek"] for z in zaznamy}) != 1:
+        print("CHYBA: Výsledky se neshodují!")
+
+
+def uloz_json(cesta: str, parametry: dict, zaznamy: list[dict]) -> None:
+    """Připíše jeden řádek JSON (JSON-lines) s prostředím, parametry a výsledky."""
+    radek = {
+        "cas": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "gil": ma_gil(),
+        "cpu": os.cpu_count(),
+        **parametry,
+        "vysledky": zaznamy,
+    }
+    with open(cesta, "a", encoding="utf-8") as f:
+        f.write(json.dumps(radek, ensure_ascii=False) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porovná sériový běh, vlákna a procesy na stejné úloze.")
+    parser.add_argument("--uloha", choices=ULOHY, default="prvocisla")
+    parser.add_argument("--velikost", type=int,
+                        help="Počet položek (čísel, iterací, čekání); výchozí podle úlohy, viz VYCHOZI_VELIKOST")
+    parser.add_argument("--rozdeleni", choices=ROZDELENI, default="jemne")
+    parser.add_argument("--workeru", type=int, nargs="+", default=[1, 2, os.cpu_count()])
+    parser.add_argument("--executory", nargs="+", help="Podmnožina: serial vlakna procesy interpretery")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("--zahrati", type=int, default=1)
+    parser.add_argument("--json", metavar="SOUBOR", help="Připsat výsledky jako řádek JSON do souboru")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat musí být alespoň 1")
+    if min(args.workeru) < 1:
+        parser.error("--workeru musí být alespoň 1")
+    if args.velikost is None:
+        args.velikost = VYCHOZI_VELIKOST[args.uloha]
+
+    pocty_workeru = sorted(set(args.workeru))
+    print(f"Úloha {args.uloha}, velikost {args.velikost:,}, rozdělení {args.rozdeleni}, "
+          f"Python {platform.python_version()} ({'s GIL' if ma_gil() else 'bez GIL'}), {os.cpu_count()} CPU\n")
+    zaznamy = benchmark(ULOHY[args.uloha], args.velikost, ROZDELENI[args.rozdeleni], pocty_workeru,
+                        args.executory, args.repeat, args.zahrati)
+    vypis_tabulku(zaznamy)
+
+    if args.json:
+        parametry = {"uloha": args.uloha, "velikost": args.velikost, "rozdeleni": args.rozdeleni,
+                     "opakovani": args.repeat}
+        uloz_json(args.json, parametry, zaznamy)
+
+
+if __name__ == "__main__":
+    main()
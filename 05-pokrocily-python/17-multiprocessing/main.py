@@ -7,6 +7,8 @@ import time
 import threading
 import multiprocessing
 
+from sito import spocitej_prvocisla_sitem
+
 # --- Výpočetně náročná funkce (CPU Bound) ---
 def spocitej_prvocisla(n):
     # Hledá počet prvočísel do n (naivní pomalý algoritmus)
@@ -56,6 +58,19 @@ def run_multiprocessing(narocnost):
     print(f"Čas: {end - start:.2f} s (Zrychlení!)")
     print("Důvod: Každý proces má vlastní Python interpret a běží na jiném jádře.\n")
 
+def run_segmentovane_sito(narocnost):
+    print("--- 4. Lepší algoritmus + rozdělení práce (sito.py) ---")
+    pocet_procesu = multiprocessing.cpu_count()
+    # Interval se rozdělí na segmenty a každý proces proseje jen svoje
+    # (aspoň jeden segment na proces, jinak by pracoval jediný)
+    velikost_segmentu = -(-narocnost // pocet_procesu)
+    start = time.time()
+    spocitej_prvocisla_sitem(narocnost, pocet_procesu, velikost_segmentu)
+    spocitej_prvocisla_sitem(narocnost, pocet_procesu, velikost_segmentu)
+    end = time.time()
+    print(f"Čas: {end - start:.2f} s ({pocet_procesu} procesů)")
+    print("Důvod: Síto místo zkoušení dělitelů a každý proces počítá jen část úlohy.\n")
+
 if __name__ == "__main__":
     # POZOR: Na Windows je tato podmínka NUTNÁ pro multiprocessing.
     
@@ -66,4 +81,5 @@ if __name__ == "__main__":
     
     run_serial(NAROCNOST)
     run_threads(NAROCNOST)
-    run_multiprocessing(NAROCNOST)
\ No newline at end of file
+    run_multiprocessing(NAROCNOST)
+    run_segmentovane_sito(NAROCNOST)
\ No newline at end of file
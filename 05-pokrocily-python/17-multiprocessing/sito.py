@@ -0,0 +1,132 @@
+"""
+Segmentované Eratosthenovo síto rozdělené mezi procesy.
+
+V main.py počítá každý proces CELÝ úkol znovu (zkoušení dělitelů až do
+odmocniny pro každé číslo). Tady se práce opravdu dělí:
+  1. Jednou spočítáme "základní" prvočísla až do sqrt(n).
+  2. Interval [2, n) rozdělíme na segmenty (např. po 1 MB).
+  3. Každý segment proseje jeden proces - bytearray (nebo NumPy pole),
+     ve kterém škrtáme násobky základních prvočísel řezem segment[i::p].
+  4. Hlavní proces jen sečte počty.
+
+Segment je malý (vejde se do cache CPU) a procesy spolu nic nesdílí,
+takže s více jádry roste výkon téměř lineárně.
+
+Spuštění samostatně změří škálování na 1..N jádrech (čas jen výpočtu,
+bez spouštění procesů):
+    python sito.py [n] [max_procesu]
+"""
+
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Základní prvočísla - každý proces si je spočítá jednou (viz _inicializace)
+_zakladni = []
+
+
+def zakladni_prvocisla(limit: int) -> list[int]:
+    """Obyčejné Eratosthenovo síto pro čísla <= limit."""
+    sito = bytearray([1]) * (limit + 1)
+    sito[:2] = b"\x00\x00"[:limit + 1]
+    for p in range(2, math.isqrt(limit) + 1):
+        if sito[p]:
+            sito[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return [i for i, je_prvocislo in enumerate(sito) if je_prvocislo]
+
+
+def _inicializace(n: int) -> None:
+    global _zakladni
+    _zakladni = zakladni_prvocisla(math.isqrt(n))
+
+
+def pocet_v_segmentu(rozsah: tuple[int, int]) -> int:
+    """Počet prvočísel v intervalu [od, do) pomocí bytearray."""
+    od, do = rozsah
+    segment = bytearray([1]) * (do - od)
+    for p in _zakladni:
+        if p * p >= do:
+            break
+        prvni = max(p * p, (od + p - 1) // p * p)
+        segment[prvni - od::p] = bytes(len(range(prvni - od, do - od, p)))
+    for cislo in (0, 1):  # 0 a 1 nejsou prvočísla
+        if od <= cislo < do:
+            segment[cislo - od] = 0
+    return segment.count(1)
+
+
+def pocet_v_segmentu_numpy(rozsah: tuple[int, int]) -> int:
+    """Totéž s NumPy polem (škrtání řezem běží celé v C)."""
+    od, do = rozsah
+    segment = np.ones(do - od, dtype=np.bool_)
+    for p in _zakladni:
+        if p * p >= do:
+            break
+        prvni = max(p * p, (od + p - 1) // p * p)
+        segment[prvni - od::p] = False
+    segment[max(0, 0 - od):max(0, 2 - od)] = False
+    return int(np.count_nonzero(segment))
+
+
+def segmenty(n: int, velikost_segmentu: int) -> list[tuple[int, int]]:
+    return [(od, min(od + velikost_segmentu, n)) for od in range(0, n, velikost_segmentu)]
+
+
+def _funkce_segmentu(pouzij_numpy: bool):
+    return pocet_v_segmentu_numpy if pouzij_numpy and np is not None else pocet_v_segmentu
+
+
+def spocitej_prvocisla_sitem(n: int, pocet_procesu: int = 1, velikost_segmentu: int = 1 << 20,
+                             pouzij_numpy: bool = False) -> int:
+    """
+    Počet prvočísel menších než n (stejně jako spocitej_prvocisla v main.py).
+
+    Procesů nepracuje víc, než je segmentů - pro malé n zmenšete velikost_segmentu.
+    """
+    if n <= 2:
+        return 0
+    funkce = _funkce_segmentu(pouzij_numpy)
+    useky = segmenty(n, velikost_segmentu)
+    if pocet_procesu == 1:
+        _inicializace(n)
+        return sum(map(funkce, useky))
+    with Pool(pocet_procesu, initializer=_inicializace, initargs=(n,)) as pool:
+        return sum(pool.imap_unordered(funkce, useky))
+
+
+def zmer_skalovani(n: int, max_procesu: int, pouzij_numpy: bool = False) -> list[tuple[int, float]]:
+    """Vypíše čas, zrychlení a efektivitu (zrychlení / počet jader) pro 1..max_procesu."""
+    print(f"Prvočísla menší než {n:,} ({'NumPy' if pouzij_numpy else 'bytearray'} segmenty)")
+    print(f"{'Procesů':>8} {'Čas [s]':>9} {'Zrychlení':>10} {'Efektivita':>11} {'Výsledek':>12}")
+    funkce = _funkce_segmentu(pouzij_numpy)
+    useky = segmenty(n, 1 << 20)
+    vysledky = []
+    zaklad = None
+    for pocet in range(1, max_procesu + 1):
+        # Pool i pro 1 proces a jeho spuštění mimo měření - všechny řádky měří totéž
+        with Pool(pocet, initializer=_inicializace, initargs=(n,)) as pool:
+            pool.map(abs, range(pocet))  # počkáme, až procesy naběhnou
+            start = time.perf_counter()
+            pocet_prvocisel = sum(pool.imap_unordered(funkce, useky))
+            doba = time.perf_counter() - start
+        zaklad = zaklad or doba
+        zrychleni = zaklad / doba
+        print(f"{pocet:>8} {doba:>9.3f} {zrychleni:>9.2f}x {zrychleni / pocet:>10.0%} {pocet_prvocisel:>12}")
+        vysledky.append((pocet, doba))
+    return vysledky
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000_000
+    MAX_PROCESU = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    zmer_skalovani(N, MAX_PROCESU)
+    if np is not None:
+        print()
+        zmer_skalovani(N, MAX_PROCESU, pouzij_numpy=True)
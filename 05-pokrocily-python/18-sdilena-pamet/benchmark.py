@@ -0,0 +1,65 @@
+"""
+Benchmark: Pool.map s kopiemi polí vs. mapuj_po_castech nad sdílenou pamětí.
+
+Pool.map musí každý kus pole zapicklovat, poslat rourou do procesu
+a výsledek stejnou cestou vrátit (a nakonec ho hlavní proces slepí).
+Se sdílenou pamětí se posílají jen indexy (od, do).
+
+Použití:  python benchmark.py [velikost_MB ...] [--procesy N]   (výchozí 100 500 2000 MB)
+POZOR: Varianta s Pool.map potřebuje zhruba 4x velikost pole volné RAM.
+"""
+
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from sdilene_pole import RegistrPoli, mapuj_po_castech, rozdel
+
+
+def vypocet(x: np.ndarray) -> np.ndarray:
+    """Jednoduchá prvková operace (jeden průchod daty)."""
+    return np.sqrt(x) * 0.5 + 1.0
+
+
+def pres_pool_map(pole: np.ndarray, pocet_procesu: int) -> np.ndarray:
+    casti = [pole[od:do] for od, do in rozdel(len(pole), pocet_procesu * 4)]
+    with Pool(pocet_procesu) as pool:
+        return np.concatenate(pool.map(vypocet, casti))
+
+
+def zmer(nazev: str, funkce):
+    start = time.perf_counter()
+    vysledek = funkce()
+    doba = time.perf_counter() - start
+    print(f"  {nazev:<32} {doba:>8.3f} s")
+    return vysledek
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("velikosti", type=int, nargs="*", default=[100, 500, 2000], help="Velikosti polí v MB")
+    parser.add_argument("--procesy", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    for velikost_mb in args.velikosti:
+        n = velikost_mb * 1024 * 1024 // 8
+        print(f"Pole {velikost_mb} MB ({n:,} float64), {args.procesy} procesů")
+        with RegistrPoli() as registr:
+            # Vstup se rovnou vytvoří ve sdílené paměti - žádná kopie navíc
+            x = registr.vytvor("x", (n,), "float64")
+            x[:] = np.arange(n, dtype=np.float64)
+            y = registr.vytvor("y", (n,), "float64")
+
+            ocekavane = zmer("Pool.map (pickle)", lambda: pres_pool_map(x, args.procesy))
+            zmer("sdílená paměť", lambda: mapuj_po_castech(vypocet, registr.popis("x"),
+                                                              registr.popis("y"), args.procesy))
+            if not np.array_equal(ocekavane, y):
+                print("CHYBA: Výsledky se neshodují!")
+            del ocekavane, x, y  # pohledy pryč, aby šla paměť zavřít
+
+
+if __name__ == "__main__":
+    main()
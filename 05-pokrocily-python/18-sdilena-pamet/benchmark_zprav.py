@@ -0,0 +1,115 @@
+"""
+Benchmark posílání zpráv mezi procesy: KruhovyBuffer vs. Queue vs. Pipe.
+
+Producent (samostatný proces) pošle N zpráv dané velikosti, hlavní proces
+je přijme. Měří se zprávy za sekundu a MB/s pro několik velikostí zpráv.
+Prázdná zpráva b"" znamená konec. Každá zpráva začíná číslem producenta
+a pořadovým číslem; příjemce kontroluje pořadí, délku i obsah zpráv.
+
+Použití:  python benchmark_zprav.py [pocet_zprav] [--producentu P]
+"""
+
+import argparse
+import struct
+import time
+from multiprocessing import Pipe, Process, Queue
+
+from kruhovy_buffer import KruhovyBuffer
+
+VELIKOSTI = (16, 256, 4096, 65536)
+KONEC = b""
+CISLO_ZPRAVY = struct.Struct("<II")  # číslo producenta, pořadí zprávy
+
+
+def telo(velikost: int) -> bytes:
+    """Obsah zprávy za číslem - různé bajty, aby šlo poznat posunutá nebo stará data."""
+    return (bytes(range(256)) * (velikost // 256 + 1))[:velikost - CISLO_ZPRAVY.size]
+
+
+def zpravy(producent: int, velikost: int, pocet: int):
+    obsah = telo(velikost)
+    for i in range(pocet):
+        yield CISLO_ZPRAVY.pack(producent, i) + obsah
+
+
+def producent_buffer(buffer, producent, velikost, pocet):
+    for zprava in zpravy(producent, velikost, pocet):
+        buffer.posli(zprava)
+    buffer.posli(KONEC)
+    buffer.zavri()
+
+
+def producent_queue(fronta, producent, velikost, pocet):
+    for zprava in zpravy(producent, velikost, pocet):
+        fronta.put(zprava)
+    fronta.put(KONEC)
+
+
+def producent_pipe(spojeni, producent, velikost, pocet):
+    for zprava in zpravy(producent, velikost, pocet):
+        spojeni.send_bytes(zprava)
+    spojeni.send_bytes(KONEC)
+    spojeni.close()
+
+
+def zmer(producent, kanal, prijmi, velikost: int, pocet: int, producentu: int) -> float:
+    """Spustí producenty a přijímá, dokud nedorazí všechny koncové zprávy. Vrací čas v s."""
+    procesy = [Process(target=producent, args=(kanal, i, velikost, pocet)) for i in range(producentu)]
+    obsah = telo(velikost)
+    ocekavane = [0] * producentu  # další očekávané pořadí od každého producenta
+    chybnych = 0
+    konce = 0
+    start = time.perf_counter()
+    for p in procesy:
+        p.start()
+    while konce < producentu:
+        zprava = prijmi()
+        if not zprava:
+            konce += 1
+            continue
+        cislo_producenta, poradi = CISLO_ZPRAVY.unpack_from(zprava)
+        if (len(zprava) != velikost or cislo_producenta >= producentu
+                or poradi != ocekavane[cislo_producenta] or zprava[CISLO_ZPRAVY.size:] != obsah):
+            chybnych += 1
+        else:
+            ocekavane[cislo_producenta] += 1
+    doba = time.perf_counter() - start
+    for p in procesy:
+        p.join()
+    if chybnych or sum(ocekavane) != pocet * producentu:
+        print(f"CHYBA: {sum(ocekavane)} správných zpráv místo {pocet * producentu}, {chybnych} chybných")
+    return doba
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pocet", type=int, nargs="?", default=100_000, help="Zpráv na producenta")
+    parser.add_argument("--producentu", type=int, default=1)
+    args = parser.parse_args()
+    celkem = args.pocet * args.producentu
+
+    print(f"{args.pocet:,} zpráv x {args.producentu} producentů")
+    print(f"{'Velikost':>9} {'Kanál':<15} {'Čas [s]':>8} {'Zpráv/s':>12} {'MB/s':>9}")
+    for velikost in VELIKOSTI:
+        vysledky = {}
+
+        with KruhovyBuffer(max(1 << 22, 16 * velikost), vice_producentu=args.producentu > 1) as buffer:
+            vysledky["KruhovyBuffer"] = zmer(producent_buffer, buffer, buffer.prijmi,
+                                             velikost, args.pocet, args.producentu)
+
+        fronta = Queue(maxsize=1024)
+        vysledky["Queue"] = zmer(producent_queue, fronta, fronta.get, velikost, args.pocet, args.producentu)
+
+        if args.producentu == 1:  # Pipe má jen dva konce
+            prijimac, vysilac = Pipe(duplex=False)
+            vysledky["Pipe"] = zmer(producent_pipe, vysilac, prijimac.recv_bytes, velikost, args.pocet, 1)
+            vysilac.close()
+            prijimac.close()
+
+        for kanal, doba in vysledky.items():
+            print(f"{velikost:>8}B {kanal:<15} {doba:>8.3f} {celkem / doba:>12,.0f} "
+                  f"{celkem * velikost / doba / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Kruhový buffer (ring buffer) ve sdílené paměti pro posílání zpráv mezi procesy.
+
+multiprocessing.Queue každou zprávu zapickluje, pošle rourou a na druhé
+straně rozbalí (a k tomu má pomocné vlákno). Tady zprávy zapisujeme
+přímo do sdílené paměti:
+
+    [ head (8 B) | ... | tail (8 B) | ... | data: kapacita bajtů ... ]
+      kam zapisuje       odkud čte          zprávy [délka 4 B][obsah]
+
+head a tail jsou stále rostoucí počty bajtů (nikdy se nenulují); pozice
+v datech je head % kapacita. Ve bufferu je (head - tail) bajtů, volno je
+kapacita - (head - tail). Zpráva, která přeteče konec, pokračuje od začátku.
+
+  * Jeden producent, jeden konzument: bez zámků. Producent zapíše data
+    a AŽ POTOM posune head; konzument přečte data a AŽ POTOM posune tail.
+    Každý index mění jen jedna strana. head a tail leží v různých
+    řádcích cache (64 B), aby si procesy navzájem nezneplatňovaly cache.
+  * Více producentů (vice_producentu=True): zápis chrání multiprocessing.Lock
+    (jen mezi producenty, konzument zámek nepotřebuje).
+
+POZOR: Spoléhá na to, že zarovnaný 8bajtový zápis je atomický a zápisy
+se nepřehazují (platí na x86/x86-64). Pro jiné architektury by bylo
+potřeba paměťové bariéry - v čistém Pythonu to nejde.
+"""
+
+import os
+import struct
+import time
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+
+RADEK_CACHE = 64
+HLAVICKA = 2 * RADEK_CACHE
+DELKA = struct.Struct("<I")
+
+
+def _cekej(podminka, timeout: float | None) -> bool:
+    """Čeká, až podminka() vrátí True: chvíli jen uvolňuje CPU, pak spí čím dál déle."""
+    if podminka():
+        return True
+    konec = None if timeout is None else time.monotonic() + timeout
+    pauza = 0.0
+    while not podminka():
+        if konec is not None and time.monotonic() >= konec:
+            return False
+        time.sleep(pauza)
+        pauza = min(pauza * 2 or 1e-6, 1e-3)
+    return True
+
+
+class KruhovyBuffer:
+    def __init__(self, kapacita: int = 1 << 20, vice_producentu: bool = False, jmeno: str | None = None):
+        """Vytvoří nový buffer (tento proces je vlastník a na konci ho smaže)."""
+        self.kapacita = kapacita
+        self._zamek = Lock() if vice_producentu else None
+        self._pripoj(SharedMemory(name=jmeno, create=True, size=HLAVICKA + kapacita), vlastnik=True)
+        self._indexy[0] = 0
+        self._indexy[RADEK_CACHE // 8] = 0
+
+    def _pripoj(self, shm: SharedMemory, vlastnik: bool) -> None:
+        self.shm = shm
+        # Při fork potomek zdědí celý objekt - smazat smí jen proces, který buffer vytvořil
+        self._pid_vlastnika = os.getpid() if vlastnik else None
+        # Indexy jako pole uint64: [0] = head, [8] = tail (další řádek cache)
+        self._indexy = shm.buf[:HLAVICKA].cast("Q")
+        self._data = shm.buf[HLAVICKA:HLAVICKA + self.kapacita]
+        # Poslední známá hodnota indexu druhé strany (sdílenou paměť čteme, jen když je potřeba).
+        # Začínáme od aktuálních sdílených hodnot - proces se může připojit i k bufferu,
+        # kterým už zprávy prošly (tail > 0).
+        self._znamy_tail = self._tail
+        self._znamy_head = self._head
+
+    # Při předání do jiného procesu (argument Process) se posílá jen jméno a zámek
+    def __getstate__(self):
+        return self.shm.name, self.kapacita, self._zamek
+
+    def __setstate__(self, stav):
+        jmeno, self.kapacita, self._zamek = stav
+        try:
+            shm = SharedMemory(name=jmeno, track=False)  # Python 3.13+
+        except TypeError:
+            shm = SharedMemory(name=jmeno)
+        self._pripoj(shm, vlastnik=False)
+
+    @property
+    def _head(self) -> int:
+        return self._indexy[0]
+
+    @property
+    def _tail(self) -> int:
+        return self._indexy[RADEK_CACHE // 8]
+
+    def _zapis(self, pozice: int, data) -> None:
+        zacatek = pozice % self.kapacita
+        prvni = min(len(data), self.kapacita - zacatek)
+        self._data[zacatek:zacatek + prvni] = data[:prvni]
+        if prvni < len(data):
+            self._data[:len(data) - prvni] = data[prvni:]
+
+    def _precti(self, pozice: int, delka: int) -> bytes:
+        zacatek = pozice % self.kapacita
+        if zacatek + delka <= self.kapacita:
+            return bytes(self._data[zacatek:zacatek + delka])
+        prvni = self.kapacita - zacatek
+        return bytes(self._data[zacatek:]) + bytes(self._data[:delka - prvni])
+
+    def __len__(self) -> int:
+        """Počet obsazených bajtů (včetně hlaviček zpráv)."""
+        return self._head - self._tail
+
+    def posli(self, data: bytes, timeout: float | None = None) -> None:
+        """Zapíše zprávu; když je buffer plný, čeká (nejdéle timeout s, pak queue.Full)."""
+        potreba = DELKA.size + len(data)
+        if potreba > self.kapacita:
+            raise ValueError(f"Zpráva ({len(data)} B) je větší než buffer ({self.kapacita} B)")
+        if self._zamek is not None:
+            if not self._zamek.acquire(True, timeout):
+                raise Full
+            try:
+                self._posli(data, potreba, timeout)
+            finally:
+                self._zamek.release()
+        else:
+            self._posli(data, potreba, timeout)
+
+    def _posli(self, data, potreba: int, timeout: float | None) -> None:
+        head = self._head
+        if self.kapacita - (head - self._znamy_tail) < potreba:
+            def je_misto():
+                self._znamy_tail = self._tail
+                return self.kapacita - (head - self._znamy_tail) >= potreba
+            if not _cekej(je_misto, timeout):
+                raise Full
+        self._zapis(head, DELKA.pack(len(data)))
+        self._zapis(head + DELKA.size, data)
+        self._indexy[0] = head + potreba  # zveřejnění zprávy až po zápisu dat
+
+    def prijmi(self, timeout: float | None = None) -> bytes:
+        """Přečte další zprávu; když je buffer prázdný, čeká (nejdéle timeout s, pak queue.Empty)."""
+        tail = self._tail
+        if self._znamy_head == tail:
+            def neni_prazdny():
+                self._znamy_head = self._head
+                return self._znamy_head != tail
+            if not _cekej(neni_prazdny, timeout):
+                raise Empty
+        delka, = DELKA.unpack(self._precti(tail, DELKA.size))
+        data = self._precti(tail + DELKA.size, delka)
+        self._indexy[RADEK_CACHE // 8] = tail + DELKA.size + delka  # místo uvolníme až po přečtení
+        return data
+
+    def zavri(self) -> None:
+        """Zavře přístup k paměti; vlastník ji i smaže. Lze volat opakovaně."""
+        if self.shm is None:
+            return
+        self._indexy.release()
+        self._data.release()
+        self.shm.close()
+        if self._pid_vlastnika == os.getpid():
+            self.shm.unlink()
+        self.shm = None
+
+    def __enter__(self) -> "KruhovyBuffer":
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
@@ -0,0 +1,222 @@
+"""
+Knihovna nad SharedMemory pro NumPy pole.
+
+V numpy-demo.py se jméno paměti, tvar a dtype předávají potomkovi ručně
+a úklid je na nás. Tady:
+  * PopisPole     - malý (picklovatelný) popis pole: jméno bloku, tvar, dtype.
+                    Jen ten se posílá mezi procesy, nikdy data.
+  * SdilenePole   - context manager: vytvoří / připojí blok a postaví nad ním
+                    np.ndarray; na konci zavře a (vlastník) smaže blok.
+  * RegistrPoli   - pojmenovaná sada sdílených polí, úklid všech najednou.
+  * mapuj_po_castech - pool procesů, kde každý proces dostane jen rozsah
+                    (od, do) a pracuje přímo nad svým řezem sdílené paměti.
+
+Příklad:
+    with RegistrPoli() as registr:
+        x = registr.vytvor("x", (10_000_000,), "float64")
+        y = registr.vytvor("y", (10_000_000,), "float64")
+        x[:] = np.arange(len(x))
+        mapuj_po_castech(np.sqrt, registr.popis("x"), registr.popis("y"), pocet_procesu=4)
+        del x, y   # pohledy pryč, jinak zavření registru skončí BufferError
+
+POZOR: Funkce pro mapuj_po_castech musí být definovaná na úrovni modulu
+(posílá se do procesů picklem jako odkaz) a nesmí si nechat odkaz na řez
+pole - po skončení se paměť zavírá.
+
+Dokud existuje jakékoli pole (nebo řez) nad blokem, zavri() odmítne paměť
+odmapovat a vyhodí BufferError - čtení z odmapované paměti by shodilo
+celý interpret (SIGSEGV).
+"""
+
+import ctypes
+import os
+import weakref
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+import numpy as np
+
+
+class PopisPole(NamedTuple):
+    jmeno: str
+    tvar: tuple
+    dtype: str
+
+
+def _pripoj_blok(jmeno: str) -> SharedMemory:
+    """Připojení k existujícímu bloku. Od Pythonu 3.13 ho nesledujeme
+    (track=False), jinak by ho resource_tracker mohl smazat za vlastníka."""
+    try:
+        return SharedMemory(name=jmeno, track=False)
+    except TypeError:
+        return SharedMemory(name=jmeno)
+
+
+class SdilenePole:
+    def __init__(self, shm: SharedMemory, tvar, dtype, vlastnik: bool):
+        self.shm = shm
+        self.vlastnik = vlastnik
+        self.popis = PopisPole(shm.name, tuple(tvar), np.dtype(dtype).str)
+        self._postav_pole()
+
+    def _postav_pole(self) -> None:
+        # NumPy si export bufferu nenechává (drží jen odkaz na objekt), takže by
+        # shm.close() paměť odmapoval i pod živými poli. Ctypes pole z from_buffer
+        # export drží, dokud žije - a žije, dokud na něj ukazuje kterékoli pole
+        # (přes .base). Podle slabého odkazu na něj pak poznáme, že pole ještě žijí.
+        velikost = max(1, int(np.prod(self.popis.tvar)) * np.dtype(self.popis.dtype).itemsize)
+        self._export = (ctypes.c_char * velikost).from_buffer(self.shm.buf)
+        self._ziva_pole = weakref.ref(self._export)
+        self.pole = np.ndarray(self.popis.tvar, dtype=self.popis.dtype, buffer=self._export)
+
+    @classmethod
+    def vytvor(cls, tvar, dtype="float64", jmeno: str | None = None) -> "SdilenePole":
+        tvar = (tvar,) if isinstance(tvar, int) else tuple(tvar)
+        velikost = max(1, int(np.prod(tvar)) * np.dtype(dtype).itemsize)  # SharedMemory neumí 0 bajtů
+        return cls(SharedMemory(name=jmeno, create=True, size=velikost), tvar, dtype, vlastnik=True)
+
+    @classmethod
+    def z_pole(cls, pole: np.ndarray, jmeno: str | None = None) -> "SdilenePole":
+        """Nový blok s kopií pole (jediná kopie dat - pak už se jen sdílí)."""
+        sdilene = cls.vytvor(pole.shape, pole.dtype, jmeno)
+        sdilene.pole[...] = pole
+        return sdilene
+
+    @classmethod
+    def pripoj(cls, popis: PopisPole) -> "SdilenePole":
+        return cls(_pripoj_blok(popis.jmeno), popis.tvar, popis.dtype, vlastnik=False)
+
+    def zavri(self) -> None:
+        """
+        Zavře přístup k paměti; vlastník blok i smaže. Lze volat opakovaně.
+        Pokud ještě existuje pole nad blokem (i řez nebo pohled), vyhodí
+        BufferError a blok nechá otevřený.
+        """
+        if self.shm is None:
+            return
+        self.pole = self._export = None  # naše odkazy pryč, ostatní musí zahodit volající
+        export = self._ziva_pole()
+        if export is not None:
+            self._export = export
+            self.pole = np.ndarray(self.popis.tvar, dtype=self.popis.dtype, buffer=export)
+            raise BufferError(f"Sdílené pole {self.popis.jmeno} se ještě používá "
+                              "- nejdřív zahoďte všechny odkazy na něj")
+        self.shm.close()
+        if self.vlastnik:
+            self.shm.unlink()
+        self.shm = None
+
+    def __enter__(self) -> np.ndarray:
+        return self.pole
+
+    def __exit__(self, *exc):
+        self.zavri()
+
+
+class RegistrPoli:
+    """Pojmenovaná sdílená pole jednoho procesu; zavri() uklidí všechna."""
+
+    def __init__(self):
+        self._pole: dict[str, SdilenePole] = {}
+
+    def vytvor(self, nazev: str, tvar, dtype="float64") -> np.ndarray:
+        if nazev in self._pole:
+            raise KeyError(f"Pole '{nazev}' už v registru je")
+        self._pole[nazev] = SdilenePole.vytvor(tvar, dtype)
+        return self._pole[nazev].pole
+
+    def pridej(self, nazev: str, pole: np.ndarray) -> np.ndarray:
+        """Zkopíruje existující pole do sdílené paměti."""
+        if nazev in self._pole:
+            raise KeyError(f"Pole '{nazev}' už v registru je")
+        self._pole[nazev] = SdilenePole.z_pole(pole)
+        return self._pole[nazev].pole
+
+    def pripoj(self, nazev: str, popis: PopisPole) -> np.ndarray:
+        """Připojí pole, které vytvořil jiný proces (nevlastníme ho)."""
+        self._pole[nazev] = SdilenePole.pripoj(popis)
+        return self._pole[nazev].pole
+
+    def __getitem__(self, nazev: str) -> np.ndarray:
+        return self._pole[nazev].pole
+
+    def __contains__(self, nazev: str) -> bool:
+        return nazev in self._pole
+
+    def popis(self, nazev: str) -> PopisPole:
+        return self._pole[nazev].popis
+
+    def popisy(self) -> dict[str, PopisPole]:
+        return {nazev: pole.popis for nazev, pole in self._pole.items()}
+
+    def odeber(self, nazev: str) -> None:
+        self._pole[nazev].zavri()
+        del self._pole[nazev]
+
+    def zavri(self) -> None:
+        """Zavře všechna pole, která jde; pole se živými odkazy v registru zůstanou (BufferError)."""
+        pouzivana = []
+        for nazev, pole in list(self._pole.items()):
+            try:
+                pole.zavri()
+            except BufferError:
+                pouzivana.append(nazev)
+            else:
+                del self._pole[nazev]
+        if pouzivana:
+            raise BufferError(f"Pole {', '.join(pouzivana)} se ještě používají")
+
+    def __enter__(self) -> "RegistrPoli":
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
+
+
+# --- Pool nad sdílenými poli ---
+
+# Pole připojená v procesu workeru (připojují se jednou při startu procesu)
+_registr_workeru = None
+
+
+def _inicializace_workeru(popisy: dict[str, PopisPole]) -> None:
+    global _registr_workeru
+    _registr_workeru = RegistrPoli()
+    for nazev, popis in popisy.items():
+        _registr_workeru.pripoj(nazev, popis)
+
+
+def _zpracuj_cast(argumenty):
+    funkce, od, do = argumenty
+    cast = _registr_workeru["vstup"][od:do]
+    vysledek = funkce(cast)
+    if "vystup" in _registr_workeru:
+        _registr_workeru["vystup"][od:do] = vysledek
+        return None
+    return vysledek
+
+
+def rozdel(delka: int, pocet_casti: int) -> list[tuple[int, int]]:
+    hranice = [delka * i // pocet_casti for i in range(pocet_casti + 1)]
+    return [(od, do) for od, do in zip(hranice, hranice[1:]) if od < do]
+
+
+def mapuj_po_castech(funkce, vstup: PopisPole, vystup: PopisPole | None = None,
+                     pocet_procesu: int | None = None, casti_na_proces: int = 4) -> list:
+    """
+    Rozdělí vstup (podle první osy) na řezy a zavolá funkce(rez) v poolu procesů.
+    S vystup se výsledek zapíše do stejného řezu výstupního pole a vrátí se [];
+    bez něj se vrátí seznam výsledků jednotlivých řezů (např. částečné součty).
+    Procesům se posílá jen (funkce, od, do).
+    """
+    pocet_procesu = pocet_procesu or os.cpu_count()
+    popisy = {"vstup": vstup}
+    if vystup is not None:
+        if vystup.tvar[0] != vstup.tvar[0]:
+            raise ValueError("Vstup a výstup musí mít stejnou délku první osy")
+        popisy["vystup"] = vystup
+    ukoly = [(funkce, od, do) for od, do in rozdel(vstup.tvar[0], pocet_procesu * casti_na_proces)]
+    with Pool(pocet_procesu, initializer=_inicializace_workeru, initargs=(popisy,)) as pool:
+        vysledky = pool.map(_zpracuj_cast, ukoly)
+    return [] if vystup is not None else vysledky
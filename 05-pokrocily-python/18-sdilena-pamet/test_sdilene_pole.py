@@ -0,0 +1,39 @@
+"""Zavření sdílené paměti pod živým polem nesmí shodit interpret."""
+
+import pytest
+
+from sdilene_pole import RegistrPoli, SdilenePole
+
+
+def test_zavri_pod_zivym_polem_vyhodi_bufferror():
+    sdilene = SdilenePole.vytvor((1000,))
+    pole = sdilene.pole
+    pole[:3] = 1
+    with pytest.raises(BufferError):
+        sdilene.zavri()
+    assert list(pole[:3]) == [1, 1, 1]  # paměť je pořád namapovaná
+    del pole
+    sdilene.zavri()
+
+
+def test_zavri_pod_rezem_z_enter():
+    sdilene = SdilenePole.vytvor((10,))
+    with pytest.raises(BufferError):
+        with sdilene as pole:
+            rez = pole[2:5]
+            del pole
+    assert rez.sum() == 0
+    del rez
+    sdilene.zavri()
+
+
+def test_registr_zavre_volna_pole_a_pouzivana_necha():
+    registr = RegistrPoli()
+    x = registr.vytvor("x", (10,))
+    registr.vytvor("y", (10,))
+    with pytest.raises(BufferError, match="x"):
+        registr.zavri()
+    assert "x" in registr and "y" not in registr
+    assert x[0] == 0
+    del x
+    registr.zavri()
@@ -0,0 +1,152 @@
+"""
+Benchmark echo serverů: vlákno na klienta vs. selectors při 10 / 1000 / 10000 spojeních.
+
+Server běží ve vlastním procesu. Klient (další proces) otevře N spojení
+a po každém z nich dokola posílá zprávu a čeká na její ozvěnu (jedna
+zpráva na spojení "ve vzduchu"). Měří se požadavky za sekundu a paměť
+serveru (RSS) a počet jeho vláken z /proc (Linux) nebo přes psutil.
+
+Klient je jen jeden Python proces - při velkém počtu spojení může být
+úzkým hrdlem on (viz --klientu pro víc klientských procesů).
+
+Použití:  python benchmark_serveru.py [--spojeni 10 1000 10000] [--doba 3] [--velikost 64]
+"""
+
+import argparse
+import multiprocessing
+import selectors
+import socket
+import sys
+import time
+
+from echo_servery import SERVERY, zvys_limit_souboru
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def beh_serveru(rezim: str, roura) -> None:
+    zvys_limit_souboru()
+    server = SERVERY[rezim]()
+    roura.send(server.adresa)
+    server.spust()
+
+
+def pamet_procesu(pid: int) -> tuple[float | None, int | None]:
+    """(RSS v MB, počet vláken) procesu."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            hodnoty = dict(radek.split(":", 1) for radek in f if ":" in radek)
+        return int(hodnoty["VmRSS"].split()[0]) / 1024, int(hodnoty["Threads"])
+    except OSError:
+        if psutil is None:
+            return None, None
+        proces = psutil.Process(pid)
+        return proces.memory_info().rss / 2**20, proces.num_threads()
+
+
+def otevri_spojeni(adresa, pocet: int) -> list[socket.socket]:
+    spojeni = []
+    for _ in range(pocet):
+        sock = socket.create_connection(adresa)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setblocking(False)
+        spojeni.append(sock)
+    return spojeni
+
+
+def zatez(spojeni: list[socket.socket], zprava: bytes, doba: float) -> int:
+    """Ping-pong na všech spojeních po dobu `doba` s; vrací počet dokončených odpovědí."""
+    selektor = selectors.DefaultSelector()
+    zbyva = {}
+    for sock in spojeni:
+        sock.send(zprava)
+        zbyva[sock] = len(zprava)
+        selektor.register(sock, selectors.EVENT_READ)
+    hotovo = 0
+    konec = time.perf_counter() + doba
+    while time.perf_counter() < konec:
+        for klic, _ in selektor.select(timeout=0.1):
+            sock = klic.fileobj
+            try:
+                data = sock.recv(65536)
+            except BlockingIOError:
+                continue
+            zbyva[sock] -= len(data)
+            if zbyva[sock] <= 0:
+                hotovo += 1
+                zbyva[sock] = len(zprava)
+                sock.send(zprava)
+    selektor.close()
+    return hotovo
+
+
+def beh_klienta(adresa, pocet: int, zprava: bytes, doba: float, start, vysledky) -> None:
+    zvys_limit_souboru()
+    spojeni = otevri_spojeni(adresa, pocet)
+    start.wait()  # všechny klientské procesy začnou zátěž současně
+    vysledky.put(zatez(spojeni, zprava, doba))
+    for sock in spojeni:
+        sock.close()
+
+
+def zmer(rezim: str, pocet: int, velikost: int, doba: float, klientu: int) -> dict:
+    kontext = multiprocessing.get_context()
+    prijem, odesilatel = kontext.Pipe(duplex=False)
+    server = kontext.Process(target=beh_serveru, args=(rezim, odesilatel), daemon=True)
+    server.start()
+    adresa = prijem.recv()
+    zaznam = {"rezim": rezim, "spojeni": pocet}
+    try:
+        podily = [pocet * (i + 1) // klientu - pocet * i // klientu for i in range(klientu)]
+        podily = [n for n in podily if n]
+        start = kontext.Barrier(len(podily) + 1)
+        fronta = kontext.Queue()
+        zprava = b"x" * velikost
+        klienti = [kontext.Process(target=beh_klienta, args=(adresa, n, zprava, doba, start, fronta))
+                   for n in podily]
+        for k in klienti:
+            k.start()
+        start.wait(timeout=300)
+        time.sleep(min(1.0, doba / 2))  # paměť měříme uprostřed zátěže
+        zaznam["rss_mb"], zaznam["vlaken"] = pamet_procesu(server.pid)
+        hotovo = sum(fronta.get(timeout=doba + 300) for _ in klienti)
+        for k in klienti:
+            k.join()
+        zaznam["req_s"] = hotovo / doba
+    except Exception as e:
+        zaznam["chyba"] = f"{type(e).__name__}: {e}"
+    finally:
+        server.kill()
+        server.join()
+    return zaznam
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--spojeni", type=int, nargs="+", default=[10, 1000, 10_000])
+    parser.add_argument("--rezimy", nargs="+", choices=SERVERY, default=list(SERVERY))
+    parser.add_argument("--doba", type=float, default=3.0, help="Délka zátěže v sekundách")
+    parser.add_argument("--velikost", type=int, default=64, help="Velikost zprávy v bajtech")
+    parser.add_argument("--klientu", type=int, default=1, help="Počet klientských procesů")
+    args = parser.parse_args()
+    zvys_limit_souboru()
+
+    print(f"Zpráva {args.velikost} B, {args.doba} s zátěže, {args.klientu} klientských procesů")
+    print(f"{'Režim':<10} {'Spojení':>8} {'Req/s':>10} {'RSS [MB]':>9} {'Vláken':>7}")
+    for pocet in args.spojeni:
+        for rezim in args.rezimy:
+            z = zmer(rezim, pocet, args.velikost, args.doba, args.klientu)
+            if "chyba" in z:
+                print(f"{rezim:<10} {pocet:>8}   CHYBA: {z['chyba']}")
+                continue
+            rss = f"{z['rss_mb']:.1f}" if z["rss_mb"] is not None else "-"
+            vlaken = z["vlaken"] if z["vlaken"] is not None else "-"
+            print(f"{rezim:<10} {pocet:>8} {z['req_s']:>10.0f} {rss:>9} {vlaken:>7}")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
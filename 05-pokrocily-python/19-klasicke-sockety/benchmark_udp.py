@@ -0,0 +1,132 @@
+"""
+Test a benchmark spolehlivého UDP se vkládanými ztrátami vs. TCP na localhostu.
+
+Příjemce běží ve vlastním procesu a ověřuje, že zprávy dorazily všechny,
+v pořadí a nepoškozené (každá nese své pořadové číslo). Měří se goodput -
+užitečná data aplikace za sekundu (bez hlaviček a přeposlaných kopií).
+
+Ztráty se u UDP vkládají uvnitř SpolehliveUDP (ztratovost=...), a to pro
+data i pro ACK. TCP na loopbacku běží bez ztrát; pro srovnání se ztrátami
+je potřeba ztráty vložit v jádře (Linux, root):
+    sudo tc qdisc add dev lo root netem loss 1%     # zrušení: ... del dev lo root
+
+Použití:  python benchmark_udp.py [--pocet 100000] [--velikost 100] [--ztraty 0 0.01 0.05]
+"""
+
+import argparse
+import multiprocessing
+import socket
+import struct
+import sys
+import time
+
+from spolehlive_udp import DELKA, SpolehliveUDP
+
+PORADI = struct.Struct("!Q")
+BUFFER_OS = 4 << 20
+
+
+def zprava(i: int, velikost: int) -> bytes:
+    return PORADI.pack(i) + bytes(velikost - PORADI.size)
+
+
+def chybnych(zpravy, velikost: int) -> int:
+    """Počet zpráv, které nemají očekávané pořadové číslo nebo délku."""
+    return sum(1 for i, z in enumerate(zpravy) if len(z) != velikost or PORADI.unpack_from(z)[0] != i)
+
+
+def udp_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, BUFFER_OS)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, BUFFER_OS)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+def prijemce_udp(roura, pocet: int, velikost: int, ztratovost: float, vysledky) -> None:
+    sock = udp_socket()
+    roura.send(sock.getsockname())
+    with SpolehliveUDP(sock, ztratovost=ztratovost, seed=2) as spojeni:
+        zpravy = [spojeni.prijmi(timeout=30)]
+        start = time.perf_counter()
+        for _ in range(pocet - 1):
+            zpravy.append(spojeni.prijmi(timeout=30))
+        doba = time.perf_counter() - start
+        vysledky.put((doba, chybnych(zpravy, velikost), spojeni.mimo_okno))
+        spojeni.dobeh()
+
+
+def prijemce_tcp(roura, pocet: int, velikost: int, vysledky) -> None:
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        roura.send(server.getsockname())
+        conn, _ = server.accept()
+    with conn, conn.makefile("rb") as soubor:
+        zpravy = []
+        start = None
+        for _ in range(pocet):
+            (delka,) = DELKA.unpack(soubor.read(DELKA.size))
+            zpravy.append(soubor.read(delka))
+            if start is None:
+                start = time.perf_counter()
+        vysledky.put((time.perf_counter() - start, chybnych(zpravy, velikost)))
+
+
+def spust_prijemce(cil, *argumenty):
+    prijem, odesilatel = multiprocessing.Pipe(duplex=False)
+    vysledky = multiprocessing.Queue()
+    proces = multiprocessing.Process(target=cil, args=(odesilatel, *argumenty, vysledky))
+    proces.start()
+    return proces, prijem.recv(), vysledky
+
+
+def zmer_udp(pocet: int, velikost: int, ztratovost: float, davkovani: bool) -> dict:
+    proces, adresa, vysledky = spust_prijemce(prijemce_udp, pocet, velikost, ztratovost)
+    with SpolehliveUDP(udp_socket(), adresa, davkovani=davkovani, ztratovost=ztratovost, seed=1) as spojeni:
+        for i in range(pocet):
+            spojeni.posli(zprava(i, velikost))
+        spojeni.vyprazdni(timeout=60)
+        doba, chyb, mimo_okno = vysledky.get(timeout=60)
+        proces.join()
+        return {"goodput": pocet * velikost / doba / 1e6, "chyb": chyb, "mimo_okno": mimo_okno,
+                "datagramu": spojeni.odeslano_datagramu + spojeni.zahozeno,
+                "ztraceno": spojeni.zahozeno,
+                "preposlano": spojeni.preposlano, "srtt_ms": (spojeni.srtt or 0) * 1000}
+
+
+def zmer_tcp(pocet: int, velikost: int) -> dict:
+    proces, adresa, vysledky = spust_prijemce(prijemce_tcp, pocet, velikost)
+    # Buffered writer skládá malé zprávy do velkých send() - obdoba dávkování u UDP
+    with socket.create_connection(adresa) as sock, sock.makefile("wb") as soubor:
+        for i in range(pocet):
+            soubor.write(DELKA.pack(velikost))
+            soubor.write(zprava(i, velikost))
+    doba, chyb = vysledky.get(timeout=60)
+    proces.join()
+    return {"goodput": pocet * velikost / doba / 1e6, "chyb": chyb}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pocet", type=int, default=100_000, help="Počet zpráv")
+    parser.add_argument("--velikost", type=int, default=100, help="Velikost zprávy v bajtech (min. 8)")
+    parser.add_argument("--ztraty", type=float, nargs="+", default=[0.0, 0.01, 0.05],
+                        help="Podíl zahozených datagramů")
+    parser.add_argument("--bez-davkovani", action="store_true", help="Měřit i UDP bez dávkování")
+    args = parser.parse_args()
+
+    print(f"{args.pocet} zpráv po {args.velikost} B")
+    print(f"{'Přenos':<16} {'Ztráta':>7} {'Goodput [MB/s]':>15} {'Datagramů':>10} {'Ztraceno':>9} "
+          f"{'Přeposláno':>11} {'Mimo okno':>10} {'SRTT [ms]':>10} {'Chyb':>5}")
+    varianty = [("UDP + dávky", True)] + ([("UDP bez dávek", False)] if args.bez_davkovani else [])
+    for ztratovost in args.ztraty:
+        for nazev, davkovani in varianty:
+            z = zmer_udp(args.pocet, args.velikost, ztratovost, davkovani)
+            print(f"{nazev:<16} {ztratovost:>7.1%} {z['goodput']:>15.2f} {z['datagramu']:>10} {z['ztraceno']:>9} "
+                  f"{z['preposlano']:>11} {z['mimo_okno']:>10} {z['srtt_ms']:>10.3f} {z['chyb']:>5}")
+            sys.stdout.flush()
+    z = zmer_tcp(args.pocet, args.velikost)
+    print(f"{'TCP':<16} {'-':>7} {z['goodput']:>15.2f} {'-':>10} {'-':>9} {'-':>11} {'-':>10} {'-':>10} {z['chyb']:>5}")
+
+
+if __name__ == "__main__":
+    main()
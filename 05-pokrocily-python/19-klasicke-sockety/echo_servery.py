@@ -0,0 +1,228 @@
+"""
+Echo servery pro měření: vlákno na klienta vs. jedno vlákno se selectors.
+
+Oba servery posílají zpět přesně ty bajty, které přišly (bez úprav a bez
+výpisu každé zprávy), takže fungují s jakýmkoli rámcováním zpráv.
+
+VlaknovyEchoServer  - jako tcp_server.py: accept() + nové vlákno pro každého
+                      klienta. Počet vláken roste s počtem klientů.
+SelectorsEchoServer - jedno vlákno, neblokující sockety a selectors
+                      (na Linuxu epoll). OS nám řekne, který socket je
+                      připravený ke čtení/zápisu, a obsloužíme jen ten.
+
+Backpressure (zpětný tlak): co nejde hned odeslat, čeká ve výstupním
+bufferu spojení. Když buffer přeroste max_buffer, přestaneme od klienta
+číst (dokud se buffer nevyprázdní pod polovinu) - pomalý klient tak
+nemůže serveru zaplnit paměť. Při max_spojeni server přestane přijímat
+nová spojení (čekají ve frontě OS), dokud se nějaké neuvolní. Stejně tak,
+když procesu dojdou soubory (EMFILE/ENFILE) - pak to zkusí znovu po
+PAUZA_PRIJMU s nebo hned po zavření některého spojení.
+
+Klient, který jen ukončí zápis (shutdown(SHUT_WR)), dostane ještě zbytek
+odpovědi; spojení se zavře až po jejím odeslání.
+
+Každé spojení je jeden soubor (fd) a výchozí limit bývá 1024 - pro tisíce
+klientů ho zvedněte funkcí zvys_limit_souboru().
+"""
+
+import errno
+import selectors
+import socket
+import threading
+import time
+
+VELIKOST_CTENI = 64 * 1024
+PAUZA_PRIJMU = 0.1
+# Chyby accept(), kdy chybí prostředky procesu/systému - další accept hned by selhal taky
+DOSLY_PROSTREDKY = {errno.EMFILE, errno.ENFILE, errno.ENOBUFS, errno.ENOMEM}
+
+
+def zvys_limit_souboru() -> None:
+    """Zvedne měkký limit otevřených souborů (RLIMIT_NOFILE) na tvrdý limit."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    mekky, tvrdy = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if tvrdy == resource.RLIM_INFINITY:
+        tvrdy = 1 << 20
+    resource.setrlimit(resource.RLIMIT_NOFILE, (max(mekky, tvrdy), tvrdy))
+
+
+class VlaknovyEchoServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, backlog: int = 4096):
+        self.sock = socket.create_server((host, port), backlog=backlog)
+        self.adresa = self.sock.getsockname()
+        self._bezi = True
+
+    def _obsluz(self, conn: socket.socket) -> None:
+        with conn:
+            try:
+                while data := conn.recv(VELIKOST_CTENI):
+                    conn.sendall(data)
+            except OSError:
+                pass
+
+    def spust(self) -> None:
+        with self.sock:
+            while self._bezi:
+                try:
+                    conn, _ = self.sock.accept()
+                except OSError:
+                    break
+                threading.Thread(target=self._obsluz, args=(conn,), daemon=True).start()
+
+    def zastav(self) -> None:
+        self._bezi = False
+        self.sock.close()
+
+
+class Spojeni:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.vystup = bytearray()
+        self.cteni_pozastaveno = False
+        self.cteni_ukonceno = False  # klient ukončil zápis, zbývá dopsat odpověď
+
+
+class SelectorsEchoServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, max_spojeni: int = 10_000,
+                 max_buffer: int = 1 << 20, backlog: int = 4096):
+        self.max_spojeni = max_spojeni
+        self.max_buffer = max_buffer
+        self.sock = socket.create_server((host, port), backlog=backlog)
+        self.sock.setblocking(False)
+        self.adresa = self.sock.getsockname()
+        self.selektor = selectors.DefaultSelector()
+        self.selektor.register(self.sock, selectors.EVENT_READ, None)
+        self.spojeni = 0
+        self._prijimame = True
+        self._obnovit_prijem = None  # kdy zkusit accept znovu po EMFILE (monotonic)
+        # Probuzení select() z jiného vlákna při zastavení
+        self._budik_cteni, self._budik_zapis = socket.socketpair()
+        self.selektor.register(self._budik_cteni, selectors.EVENT_READ, "budik")
+        self._bezi = True
+
+    def _prijmi(self) -> None:
+        # Najednou přijmeme všechna čekající spojení (neblokující accept)
+        while self.spojeni < self.max_spojeni:
+            try:
+                conn, _ = self.sock.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                if e.errno in DOSLY_PROSTREDKY:
+                    self._pozastav_prijem(time.monotonic() + PAUZA_PRIJMU)
+                    return
+                continue  # ECONNABORTED apod. - chyba jen tohoto jednoho spojení
+            try:
+                conn.setblocking(False)
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                conn.close()  # klient se mezitím odpojil
+                continue
+            self.selektor.register(conn, selectors.EVENT_READ, Spojeni(conn))
+            self.spojeni += 1
+        # Limit spojení: přestaneme se ptát na nová, zůstanou ve frontě OS
+        self._pozastav_prijem(None)
+
+    def _pozastav_prijem(self, obnovit: float | None) -> None:
+        if self._prijimame:
+            self.selektor.unregister(self.sock)
+            self._prijimame = False
+        self._obnovit_prijem = obnovit
+
+    def _obnov_prijem(self) -> None:
+        self._obnovit_prijem = None
+        if not self._prijimame:
+            self.selektor.register(self.sock, selectors.EVENT_READ, None)
+            self._prijimame = True
+
+    def _zavri(self, spojeni: Spojeni) -> None:
+        self.selektor.unregister(spojeni.sock)
+        spojeni.sock.close()
+        self.spojeni -= 1
+        self._obnov_prijem()  # uvolnilo se místo i jeden soubor
+
+    def _nastav_udalosti(self, spojeni: Spojeni) -> None:
+        ctu = not (spojeni.cteni_pozastaveno or spojeni.cteni_ukonceno)
+        udalosti = selectors.EVENT_READ if ctu else 0
+        if spojeni.vystup:
+            udalosti |= selectors.EVENT_WRITE
+        self.selektor.modify(spojeni.sock, udalosti, spojeni)
+
+    def _cti(self, spojeni: Spojeni) -> bool:
+        try:
+            data = spojeni.sock.recv(VELIKOST_CTENI)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        if not data:
+            spojeni.cteni_ukonceno = True  # klient už nic nepošle, ale odpověď ještě čte
+            return True
+        spojeni.vystup += data
+        return True
+
+    def _zapis(self, spojeni: Spojeni) -> bool:
+        try:
+            odeslano = spojeni.sock.send(spojeni.vystup)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        del spojeni.vystup[:odeslano]
+        return True
+
+    def _obsluz(self, spojeni: Spojeni, udalost: int) -> None:
+        puvodne = (spojeni.cteni_pozastaveno, spojeni.cteni_ukonceno, bool(spojeni.vystup))
+        if udalost & selectors.EVENT_READ and not spojeni.cteni_ukonceno and not self._cti(spojeni):
+            self._zavri(spojeni)
+            return
+        # Odpověď zkusíme poslat hned - většinou se vejde do bufferu OS celá
+        if spojeni.vystup and not self._zapis(spojeni):
+            self._zavri(spojeni)
+            return
+        if spojeni.cteni_ukonceno and not spojeni.vystup:
+            self._zavri(spojeni)  # vše odesláno, klient už nic nepošle
+            return
+        if len(spojeni.vystup) > self.max_buffer:
+            spojeni.cteni_pozastaveno = True   # klient nestíhá číst -> přestaneme číst my
+        elif len(spojeni.vystup) <= self.max_buffer // 2:
+            spojeni.cteni_pozastaveno = False
+        # selector.modify je systémové volání - jen když se něco změnilo
+        if (spojeni.cteni_pozastaveno, spojeni.cteni_ukonceno, bool(spojeni.vystup)) != puvodne:
+            self._nastav_udalosti(spojeni)
+
+    def spust(self) -> None:
+        try:
+            while self._bezi:
+                timeout = None
+                if self._obnovit_prijem is not None:
+                    timeout = self._obnovit_prijem - time.monotonic()
+                    if timeout <= 0:
+                        self._obnov_prijem()
+                        timeout = None
+                for klic, udalost in self.selektor.select(timeout):
+                    if klic.data is None:
+                        self._prijmi()
+                    elif klic.data == "budik":
+                        self._budik_cteni.recv(1)
+                    else:
+                        self._obsluz(klic.data, udalost)
+        finally:
+            for klic in list(self.selektor.get_map().values()):
+                klic.fileobj.close()
+            self.sock.close()  # při limitu spojení není v selektoru
+            self.selektor.close()
+            self._budik_zapis.close()
+
+    def zastav(self) -> None:
+        self._bezi = False
+        self._budik_zapis.send(b"x")
+
+
+SERVERY = {
+    "vlakna": VlaknovyEchoServer,
+    "selectors": SelectorsEchoServer,
+}
@@ -0,0 +1,328 @@
+"""
+SPOLEHLIVÉ UDP - lehká vrstva nad datagramy (takové malé TCP).
+
+UDP datagram se může ztratit, zdvojit nebo předběhnout jiný (udp_klient.py
+při ztrátě jen vypíše, že server neodpověděl). Tahle vrstva přidává:
+
+  * pořadová čísla datagramů - příjemce předává zprávy ve stejném pořadí,
+    v jakém byly odeslány, a duplikáty zahodí,
+  * selektivní potvrzení (SACK) - ACK nese "všechno před `kumulativni` mám"
+    a bitovou mapu datagramů za ní, které přišly mimo pořadí (celé okno).
+    Odesílatel tak přeposílá jen díry, ne všechno od první ztráty,
+  * přeposlání po timeoutu (RTO) odvozeném z měřeného RTT podle RFC 6298
+    (RTO = SRTT + 4 * RTTVAR) a rychlé přeposlání díry, za kterou už přišly
+    novější datagramy (nečeká se na celý timeout). ACK nese číslo datagramu,
+    který ho vyvolal, a RTT se měří jen na něm a jen když nebyl přeposlán
+    (Karnův algoritmus) - kumulativní potvrzení datagramu, který čekal za
+    dírou, by RTT nafouklo,
+  * dávkování - malé zprávy se skládají do jednoho datagramu (max_datagram B),
+    jeden sendto() tak nese desítky zpráv,
+  * okno - odesílatel posílá jen datagramy s seq < nejstarší nepotvrzený + okno
+    (stejné okno, jaké přijímá protistrana). Počet nepotvrzených nestačí:
+    po SACK pozdějších datagramů by odesílatel přeskočil za okno příjemce
+    a ten by datagramy zahazoval.
+
+Poškozené nebo zkrácené datagramy se zahodí (počítá je `neplatnych`).
+
+Formát datagramů:
+    DATA: b"D" | seq (4 B) | [délka zprávy (2 B) | zpráva] ...
+    ACK:  b"A" | kumulativní (4 B) | vyvolal (4 B) | bitmapa SACK (0 až okno/8 B)
+
+Zjednodušení: jedna protistrana na socket, bez navazování a ukončování
+spojení, pevné okno místo řízení zahlcení, zprávy do velikosti jednoho
+datagramu (bez fragmentace) a nejvýše 2**32 datagramů.
+
+Vkládání ztrát: ztratovost=0.05 zahodí 5 % odchozích datagramů (dat i ACK)
+těsně před sendto() - pro testy na localhostu, kde se skoro nic neztrácí.
+"""
+
+import random
+import selectors
+import socket
+import struct
+import time
+from collections import deque
+
+DATA = struct.Struct("!cI")    # druh, pořadové číslo
+ACK = struct.Struct("!cII")    # druh, kumulativní potvrzení, seq který ACK vyvolal; pak bitmapa SACK
+DELKA = struct.Struct("!H")    # délka jedné zprávy v dávce
+
+
+class SpolehliveUDP:
+    """
+    Spolehlivé a uspořádané doručování zpráv přes jeden UDP socket.
+
+    Odesílání:  posli(zprava) -> zpráva čeká v dávce; odesli_davku() ji pošle,
+                vyprazdni() počká, až protistrana potvrdí všechno odeslané.
+    Příjem:     prijmi(timeout) -> další zpráva v pořadí (TimeoutError).
+    Bez protistrany (server) se protistranou stane odesílatel prvního datagramu.
+
+    Vše běží v jednom vlákně: ACK a přeposílání se vyřizují uvnitř volání
+    posli/prijmi/vyprazdni (metoda _pumpa), žádné vlákno na pozadí.
+    """
+
+    def __init__(self, sock: socket.socket, protistrana=None, okno: int = 256,
+                 max_datagram: int = 1400, davkovani: bool = True,
+                 min_rto: float = 0.005, max_rto: float = 1.0, max_pokusu: int = 30,
+                 ztratovost: float = 0.0, seed: int | None = None):
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.protistrana = protistrana
+        self.okno = okno
+        self.max_datagram = max_datagram
+        self.max_zpravy = max_datagram - DATA.size - DELKA.size
+        self.davkovani = davkovani
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.max_pokusu = max_pokusu
+        self.ztratovost = ztratovost
+        self._nahoda = random.Random(seed)
+        self._selektor = selectors.DefaultSelector()
+        self._selektor.register(sock, selectors.EVENT_READ)
+
+        # Odesílání
+        self._dalsi_seq = 0
+        self._nepotvrzene = {}  # seq -> [datagram, čas odeslání, počet pokusů]; řazeno podle seq
+        self._davka = []
+        self._velikost_davky = DATA.size
+        self._casovac = float("inf")  # kdy vyprší RTO (jeden časovač na spojení)
+        self._nasobek_rto = 1          # exponential backoff po vypršení
+        self.srtt = None
+        self.rttvar = 0.0
+        self.rto = 0.2  # než změříme první RTT
+
+        # Příjem
+        self._ocekavane = 0
+        self._mimo_poradi = {}  # seq -> zprávy datagramu, který předběhl díru
+        self._prijate = deque()
+        self._dluzime_ack = False
+        self._posledni_prijaty = 0
+
+        # Statistiky
+        self.odeslano_datagramu = 0
+        self.preposlano = 0
+        self.zahozeno = 0
+        self.mimo_okno = 0   # přijaté datagramy za hranou okna (zahozené)
+        self.neplatnych = 0  # poškozené datagramy (zahozené)
+
+    # --- Odesílání -------------------------------------------------------
+
+    def posli(self, zprava: bytes) -> None:
+        if len(zprava) > self.max_zpravy:
+            raise ValueError(f"Zpráva má {len(zprava)} B, do datagramu se vejde nejvýše {self.max_zpravy} B")
+        if self._velikost_davky + DELKA.size + len(zprava) > self.max_datagram:
+            self.odesli_davku()
+        self._davka.append(zprava)
+        self._velikost_davky += DELKA.size + len(zprava)
+        if not self.davkovani:
+            self.odesli_davku()
+
+    def odesli_davku(self) -> None:
+        """Zabalí čekající zprávy do jednoho datagramu a odešle ho (při plném okně čeká na ACK)."""
+        if not self._davka:
+            return
+        # Okno je rozsah pořadových čísel od nejstaršího nepotvrzeného (slovník
+        # je řazený podle seq), ne počet nepotvrzených - viz docstring modulu
+        while self._nepotvrzene and self._dalsi_seq - next(iter(self._nepotvrzene)) >= self.okno:
+            self._pumpa(self._cekani())
+        casti = [DATA.pack(b"D", self._dalsi_seq)]
+        for zprava in self._davka:
+            casti.append(DELKA.pack(len(zprava)))
+            casti.append(zprava)
+        datagram = b"".join(casti)
+        self._davka.clear()
+        self._velikost_davky = DATA.size
+
+        ted = time.monotonic()
+        self._nepotvrzene[self._dalsi_seq] = [datagram, ted, 1]
+        self._dalsi_seq += 1
+        if self._casovac == float("inf"):
+            self._casovac = ted + self.rto
+        self._odesli(datagram)
+        self._pumpa(0)  # průběžně vyzvednout ACK, ať se okno uvolňuje
+
+    def vyprazdni(self, timeout: float | None = None) -> None:
+        """Odešle poslední dávku a počká, až protistrana potvrdí všechny datagramy."""
+        konec = None if timeout is None else time.monotonic() + timeout
+        self.odesli_davku()
+        while self._nepotvrzene:
+            self._pumpa(self._cekani(konec))
+
+    def _odesli(self, datagram: bytes) -> None:
+        if self.ztratovost and self._nahoda.random() < self.ztratovost:
+            self.zahozeno += 1  # simulovaná ztráta v síti
+            return
+        try:
+            self.sock.sendto(datagram, self.protistrana)
+        except BlockingIOError:
+            pass  # plný buffer OS = ztráta, kterou pokryje přeposlání
+        self.odeslano_datagramu += 1
+
+    def _preposli(self, seq: int, ted: float) -> None:
+        zaznam = self._nepotvrzene[seq]
+        if zaznam[2] >= self.max_pokusu:
+            raise ConnectionError(f"Datagram {seq} nepotvrzen ani po {self.max_pokusu} pokusech")
+        zaznam[1] = ted
+        zaznam[2] += 1
+        self.preposlano += 1
+        self._odesli(zaznam[0])
+
+    def _vyprsel_casovac(self) -> None:
+        """
+        RTO vypršelo: přepošleme jen nejstarší nepotvrzený datagram a timeout
+        zdvojnásobíme (jako TCP). Přeposlat celé okno by při přetíženém
+        příjemci jen přidalo další datagramy do už tak plné fronty.
+        """
+        ted = time.monotonic()
+        self._preposli(next(iter(self._nepotvrzene)), ted)
+        self._nasobek_rto *= 2
+        self._casovac = ted + min(self.max_rto, self.rto * self._nasobek_rto)
+
+    def _zmer_rtt(self, rtt: float) -> None:
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.rto = min(self.max_rto, max(self.min_rto, self.srtt + 4 * self.rttvar))
+
+    def _prijmi_ack(self, datagram: bytes) -> None:
+        _, kumulativni, vyvolal = ACK.unpack_from(datagram)
+        if kumulativni > self._dalsi_seq:
+            raise ValueError(f"ACK potvrzuje neodeslaný datagram {kumulativni}")
+        bitmapa = int.from_bytes(datagram[ACK.size:], "big")
+        ted = time.monotonic()
+        zaznam = self._nepotvrzene.get(vyvolal)
+        if zaznam is not None and zaznam[2] == 1:  # Karn: u přeposlaného nevíme, na který pokus ACK odpovídá
+            self._zmer_rtt(ted - zaznam[1])
+        pred = len(self._nepotvrzene)
+        # Kumulativní část: slovník je řazený podle seq, stačí brát zepředu
+        while self._nepotvrzene:
+            seq = next(iter(self._nepotvrzene))
+            if seq >= kumulativni:
+                break
+            del self._nepotvrzene[seq]
+        # Selektivní část: bit i = datagram kumulativni + 1 + i už dorazil
+        nejvyssi = None
+        while bitmapa:
+            nejnizsi_bit = bitmapa & -bitmapa
+            seq = kumulativni + nejnizsi_bit.bit_length()
+            self._nepotvrzene.pop(seq, None)
+            nejvyssi = seq
+            bitmapa ^= nejnizsi_bit
+        if len(self._nepotvrzene) < pred:  # protistrana žije - časovač znovu od plného RTO
+            self._nasobek_rto = 1
+            self._casovac = ted + self.rto if self._nepotvrzene else float("inf")
+        if nejvyssi is None:
+            return
+        # Rychlé přeposlání: novější datagram dorazil, starší ne - nejspíš se ztratil.
+        # Poprvé po SRTT (mohl se jen předběhnout), opakovaně nejdřív po RTO.
+        for seq, zaznam in list(self._nepotvrzene.items()):
+            if seq >= nejvyssi:
+                break
+            if ted - zaznam[1] > (self.srtt or self.rto if zaznam[2] == 1 else self.rto):
+                self._preposli(seq, ted)
+
+    # --- Příjem ----------------------------------------------------------
+
+    def prijmi(self, timeout: float | None = None) -> bytes:
+        """Další zpráva v pořadí; po `timeout` sekundách bez zprávy TimeoutError."""
+        konec = None if timeout is None else time.monotonic() + timeout
+        self.odesli_davku()  # na odpověď se nedočkáme, když dotaz zůstal v dávce
+        while not self._prijate:
+            self._pumpa(self._cekani(konec))
+        return self._prijate.popleft()
+
+    def dobeh(self, doba: float = 0.5) -> None:
+        """
+        Ještě chvíli odpovídá na přeposlané datagramy - poslední ACK se mohl
+        ztratit a protistrana by jinak čekala marně. Skončí po `doba` s ticha.
+        """
+        self.odesli_davku()
+        while self._nepotvrzene or self._selektor.select(doba):
+            self._pumpa(self._cekani())
+
+    def _prijmi_data(self, datagram: bytes) -> None:
+        _, seq = DATA.unpack_from(datagram)
+        # Nejdřív rozebrat celý datagram - poškozený nesmí změnit stav spojení
+        zpravy = []
+        pozice = DATA.size
+        while pozice < len(datagram):
+            (delka,) = DELKA.unpack_from(datagram, pozice)
+            pozice += DELKA.size
+            if pozice + delka > len(datagram):
+                raise ValueError(f"Zpráva v datagramu {seq} je zkrácená")
+            zpravy.append(datagram[pozice:pozice + delka])
+            pozice += delka
+        self._dluzime_ack = True  # i na duplikát - předchozí ACK se mohl ztratit
+        self._posledni_prijaty = seq
+        if seq >= self._ocekavane + self.okno:
+            self.mimo_okno += 1
+            return
+        if seq < self._ocekavane or seq in self._mimo_poradi:
+            return
+        if seq != self._ocekavane:
+            self._mimo_poradi[seq] = zpravy  # předběhl díru, počká
+            return
+        self._prijate.extend(zpravy)
+        self._ocekavane += 1
+        while self._ocekavane in self._mimo_poradi:
+            self._prijate.extend(self._mimo_poradi.pop(self._ocekavane))
+            self._ocekavane += 1
+
+    def _posli_ack(self) -> None:
+        bitmapa = 0
+        for seq in self._mimo_poradi:
+            bitmapa |= 1 << (seq - self._ocekavane - 1)
+        self._dluzime_ack = False
+        self._odesli(ACK.pack(b"A", self._ocekavane, self._posledni_prijaty)
+                     + bitmapa.to_bytes((bitmapa.bit_length() + 7) // 8, "big"))
+
+    # --- Smyčka ----------------------------------------------------------
+
+    def _cekani(self, konec: float | None = None) -> float:
+        """Jak dlouho smí _pumpa čekat: do vypršení RTO, nejdéle 50 ms."""
+        ted = time.monotonic()
+        if konec is not None and ted >= konec:
+            raise TimeoutError("Vypršel čas čekání")
+        cekani = min(0.05, max(0.0, self._casovac - ted))
+        return cekani if konec is None else min(cekani, konec - ted)
+
+    def _pumpa(self, timeout: float) -> None:
+        """Jedno kolo: počkat na datagramy, přečíst všechny, poslat ACK, přeposlat ztracené."""
+        if timeout > 0:
+            self._selektor.select(timeout)
+        while True:
+            try:
+                datagram, adresa = self.sock.recvfrom(65535)
+            except (BlockingIOError, ConnectionRefusedError):
+                break
+            if self.protistrana is None:
+                self.protistrana = adresa
+            elif adresa != self.protistrana:
+                continue
+            try:
+                if datagram[:1] == b"D":
+                    self._prijmi_data(datagram)
+                elif datagram[:1] == b"A":
+                    self._prijmi_ack(datagram)
+                else:
+                    self.neplatnych += 1
+            except (struct.error, ValueError):
+                self.neplatnych += 1  # poškozený datagram zahodíme, spojení běží dál
+        # Jeden ACK za celou přečtenou várku datagramů, ne za každý zvlášť
+        if self._dluzime_ack:
+            self._posli_ack()
+        if self._nepotvrzene and time.monotonic() >= self._casovac:
+            self._vyprsel_casovac()
+
+    def zavri(self) -> None:
+        self._selektor.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
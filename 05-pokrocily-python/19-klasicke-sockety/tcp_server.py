@@ -4,9 +4,12 @@ Tento server zvládne více klientů najednou díky vláknům.
 Je to přímý ekvivalent C++ serveru z předchozích lekcí.
 """
 
+import argparse
 import socket
 import threading
 
+from echo_servery import SelectorsEchoServer, VlaknovyEchoServer, zvys_limit_souboru
+
 HOST = '127.0.0.1'
 PORT = 65432
 
@@ -56,5 +59,35 @@ def start_server():
             # Vypíšeme počet aktivních vláken (minus hlavní vlákno)
             print(f"[Info] Počet klientů: {threading.active_count() - 1}")
 
+def start_selectors_server():
+    """Alternativa: jedno vlákno pro všechny klienty (viz echo_servery.py)."""
+    print(f"--- START SELECTORS SERVERU ({HOST}:{PORT}) ---")
+    zvys_limit_souboru()  # každý klient = jeden soubor, výchozí limit bývá 1024
+    server = SelectorsEchoServer(HOST, PORT)
+    print("Jedno vlákno obsluhuje všechny klienty, zprávy vrací beze změny.")
+    try:
+        server.spust()
+    except KeyboardInterrupt:
+        pass
+
+def start_echo_server():
+    """Vlákno na klienta jako start_server, ale bez výpisů a zprávy vrací beze změny (pro zatezovy_klient.py)."""
+    print(f"--- START ECHO SERVERU ({HOST}:{PORT}) ---")
+    server = VlaknovyEchoServer(HOST, PORT)
+    try:
+        server.spust()
+    except KeyboardInterrupt:
+        pass
+
 if __name__ == "__main__":
-    start_server()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    rezim = parser.add_mutually_exclusive_group()
+    rezim.add_argument("--selectors", action="store_true", help="Jednovláknový server nad selectors")
+    rezim.add_argument("--echo", action="store_true", help="Vlákno na klienta, tiché čisté echo")
+    args = parser.parse_args()
+    if args.selectors:
+        start_selectors_server()
+    elif args.echo:
+        start_echo_server()
+    else:
+        start_server()
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""
+ZÁTĚŽOVÝ KLIENT pro echo server (neinteraktivní).
+
+Na rozdíl od tcp_klient.py nečeká na odpověď před odesláním další zprávy:
+otevře N spojení a na každém drží M zpráv "ve vzduchu" (pipelining).
+Jakmile se jedna zpráva vrátí, hned pošle další.
+
+Rámcování (framing): TCP je proud bajtů, hranice zpráv nezachovává.
+Každá zpráva proto začíná 4bajtovou délkou:
+    [délka: 4 B big-endian][čas odeslání: 8 B (ns)][výplň ...]
+Server zprávu vrátí beze změny a z času odeslání spočítáme latenci.
+
+Výstup: propustnost (zpráv/s, MB/s) a percentily latence.
+
+Použití:
+    python tcp_server.py --selectors   (nebo --echo)     # v jiném terminálu
+    python zatezovy_klient.py --spojeni 100 --ve-vzduchu 8 --doba 5
+    python zatezovy_klient.py --server selectors          # spustí si server sám
+"""
+
+import argparse
+import multiprocessing
+import queue
+import selectors
+import socket
+import struct
+import sys
+import time
+
+from benchmark_serveru import beh_serveru
+from echo_servery import SERVERY, zvys_limit_souboru
+
+HOST = '127.0.0.1'
+PORT = 65432
+
+HLAVICKA = struct.Struct("!IQ")  # délka obsahu, čas odeslání v ns
+DELKA = struct.Struct("!I")
+
+
+class Spojeni:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.vstup = bytearray()
+        self.vystup = bytearray()
+
+
+def zprava(velikost: int) -> bytes:
+    """Rámec celkem `velikost` bajtů (minimum je hlavička 12 B)."""
+    obsah = max(velikost - DELKA.size, HLAVICKA.size - DELKA.size)
+    return HLAVICKA.pack(obsah, time.perf_counter_ns()) + bytes(obsah - 8)
+
+
+def percentil(serazene: list, p: float) -> float:
+    return serazene[min(len(serazene) - 1, int(p / 100 * len(serazene)))]
+
+
+def zatez(adresa, pocet_spojeni: int, ve_vzduchu: int, velikost: int, doba: float) -> list[int]:
+    """Vrátí seznam latencí (ns) všech zpráv, které se vrátily během `doba` s."""
+    selektor = selectors.DefaultSelector()
+    spojeni = []
+    for _ in range(pocet_spojeni):
+        sock = socket.create_connection(adresa)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setblocking(False)
+        s = Spojeni(sock)
+        for _ in range(ve_vzduchu):
+            s.vystup += zprava(velikost)
+        selektor.register(sock, selectors.EVENT_READ | selectors.EVENT_WRITE, s)
+        spojeni.append(s)
+
+    latence = []
+    konec = time.perf_counter() + doba
+    while time.perf_counter() < konec:
+        for klic, udalost in selektor.select(timeout=0.1):
+            s = klic.data
+            if udalost & selectors.EVENT_READ:
+                try:
+                    data = s.sock.recv(65536)
+                except BlockingIOError:
+                    data = None
+                if data == b"":
+                    raise ConnectionError("Server ukončil spojení")
+                if data:
+                    s.vstup += data
+                    latence.extend(zpracuj_prijate(s, velikost))
+            if s.vystup:
+                try:
+                    del s.vystup[:s.sock.send(s.vystup)]
+                except BlockingIOError:
+                    pass
+            # Na zápis čekáme jen, když je co posílat
+            udalosti = selectors.EVENT_READ | (selectors.EVENT_WRITE if s.vystup else 0)
+            if udalosti != klic.events:
+                selektor.modify(s.sock, udalosti, s)
+
+    selektor.close()
+    for s in spojeni:
+        s.sock.close()
+    return latence
+
+
+def zpracuj_prijate(s: Spojeni, velikost: int) -> list[int]:
+    """Vyřízne z bufferu celé rámce, vrátí jejich latence a za každý zařadí nový."""
+    latence = []
+    ted = time.perf_counter_ns()
+    pozice = 0
+    while len(s.vstup) - pozice >= HLAVICKA.size:
+        delka, odeslano = HLAVICKA.unpack_from(s.vstup, pozice)
+        if len(s.vstup) - pozice < DELKA.size + delka:
+            break  # rámec ještě není celý
+        pozice += DELKA.size + delka
+        latence.append(ted - odeslano)
+        s.vystup += zprava(velikost)
+    del s.vstup[:pozice]
+    return latence
+
+
+def beh_klienta(adresa, pocet_spojeni, ve_vzduchu, velikost, doba, vysledky) -> None:
+    """Do fronty pošle seznam latencí, nebo při chybě její popis (str)."""
+    zvys_limit_souboru()
+    try:
+        vysledky.put(zatez(adresa, pocet_spojeni, ve_vzduchu, velikost, doba))
+    except Exception as e:
+        vysledky.put(f"{type(e).__name__}: {e}")
+
+
+def posbirej_vysledky(fronta, procesy) -> tuple[list[int], list[str]]:
+    """Latence ze všech procesů a seznam chyb; nečeká věčně na proces, který spadl."""
+    latence, chyby = [], []
+    zbyva = len(procesy)
+    while zbyva:
+        try:
+            vysledek = fronta.get(timeout=1)
+        except queue.Empty:
+            if all(p.exitcode is not None for p in procesy):
+                chyby += ["klientský proces skončil bez výsledku"] * zbyva
+                break
+            continue
+        zbyva -= 1
+        if isinstance(vysledek, str):
+            chyby.append(vysledek)
+        else:
+            latence.extend(vysledek)
+    return sorted(latence), chyby
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zátěžový klient pro echo server.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--server", choices=SERVERY, help="Spustit vlastní echo server v procesu")
+    parser.add_argument("-n", "--spojeni", type=int, default=10, help="Počet spojení")
+    parser.add_argument("-m", "--ve-vzduchu", type=int, default=1, help="Zpráv na spojení najednou")
+    parser.add_argument("--velikost", type=int, default=64, help="Velikost zprávy v bajtech (vč. hlavičky)")
+    parser.add_argument("--doba", type=float, default=5.0, help="Délka měření v sekundách")
+    parser.add_argument("--procesu", type=int, default=1, help="Počet klientských procesů")
+    args = parser.parse_args()
+    zvys_limit_souboru()
+
+    adresa = (args.host, args.port)
+    server = None
+    if args.server:
+        prijem, odesilatel = multiprocessing.Pipe(duplex=False)
+        server = multiprocessing.Process(target=beh_serveru, args=(args.server, odesilatel), daemon=True)
+        server.start()
+        adresa = prijem.recv()
+
+    try:
+        fronta = multiprocessing.Queue()
+        podily = [args.spojeni * (i + 1) // args.procesu - args.spojeni * i // args.procesu
+                  for i in range(args.procesu)]
+        procesy = [multiprocessing.Process(target=beh_klienta, args=(adresa, n, args.ve_vzduchu,
+                                                                      args.velikost, args.doba, fronta))
+                   for n in podily if n]
+        for p in procesy:
+            p.start()
+        latence, chyby = posbirej_vysledky(fronta, procesy)
+        for p in procesy:
+            p.join()
+    finally:
+        if server is not None:
+            server.kill()
+
+    if chyby:
+        for chyba in chyby:
+            print(f"Chyba klienta: {chyba}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Cíl {adresa[0]}:{adresa[1]}, {args.spojeni} spojení x {args.ve_vzduchu} zpráv ve vzduchu, "
+          f"zpráva {args.velikost} B, {args.doba} s")
+    if not latence:
+        print("Žádná odpověď - běží server a vrací zprávy beze změny?")
+        return
+    print(f"Propustnost: {len(latence) / args.doba:,.0f} zpráv/s, "
+          f"{len(latence) * args.velikost / args.doba / 1e6:.1f} MB/s")
+    print("Latence [ms]: " + ", ".join(
+        f"p{p}={percentil(latence, p) / 1e6:.3f}" for p in (50, 90, 99, 99.9))
+        + f", max={latence[-1] / 1e6:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: třída Lod (main.py) vs. přeložená pole vs. NumPy.
+
+Použití:  python benchmark.py [pocet_prikazu] [pocet_lodi]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from main import Lod
+import navigace
+
+
+def nahodne_prikazy(pocet: int, seed: int = 42) -> list[str]:
+    nahoda = random.Random(seed)
+    prikazy = []
+    for _ in range(pocet):
+        druh = nahoda.random()
+        if druh < 0.4:
+            prikazy.append(f"{nahoda.choice('NESW')}{nahoda.randint(1, 100)}")
+        elif druh < 0.6:
+            prikazy.append(f"{nahoda.choice('LR')}{nahoda.choice((90, 180, 270))}")
+        else:
+            prikazy.append(f"F{nahoda.randint(1, 100)}")
+    return prikazy
+
+
+def zmer(nazev: str, funkce):
+    start = time.perf_counter()
+    vysledek = funkce()
+    print(f"{nazev:<36} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+    return vysledek
+
+
+def main():
+    pocet_prikazu = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pocet_lodi = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as adresar:
+        cesta = os.path.join(adresar, "data.txt")
+        with open(cesta, "w", encoding="utf-8") as f:
+            f.write("\n".join(nahodne_prikazy(pocet_prikazu)))
+
+        print(f"--- Jedna loď, {pocet_prikazu} příkazů ---")
+        lod = Lod(cesta)
+        zmer("Lod.navigate (část 1)", lod.navigate)
+        kody, hodnoty = zmer("preloz_soubor", lambda: navigace.preloz_soubor(cesta))
+        if navigace.np is not None:
+            kody_np, hodnoty_np = zmer("preloz_soubor_numpy", lambda: navigace.preloz_soubor_numpy(cesta))
+            if kody_np.tolist() != kody.tolist() or hodnoty_np.tolist() != hodnoty.tolist():
+                print("CHYBA: Překlady se neshodují!")
+
+    vysledky_1 = [
+        (lod.x, lod.y),
+        zmer("cast1 (Python, přeložená pole)", lambda: navigace.cast1(kody, hodnoty)),
+    ]
+    vysledky_2 = [zmer("cast2 (Python, přeložená pole)", lambda: navigace.cast2(kody, hodnoty))]
+    if navigace.np is not None:
+        vysledky_1.append(tuple(map(int, zmer("cast1_numpy", lambda: navigace.cast1_numpy(kody, hodnoty)))))
+        vysledky_2.append(tuple(map(int, zmer("cast2_numpy", lambda: navigace.cast2_numpy(kody, hodnoty)))))
+    if len(set(vysledky_1)) != 1 or len(set(vysledky_2)) != 1:
+        print("CHYBA: Výsledky se neshodují!", vysledky_1, vysledky_2)
+
+    if navigace.np is None:
+        print("Pro dávkový režim nainstalujte numpy.")
+        return
+
+    np = navigace.np
+    delka = max(1, pocet_prikazu // pocet_lodi)
+    print(f"\n--- Flotila: {pocet_lodi} lodí po {delka} příkazech ---")
+    programy = [navigace.preloz(nahodne_prikazy(delka, seed=i)) for i in range(pocet_lodi)]
+    kody_2d = np.array([k for k, _ in programy], dtype=np.int8)
+    hodnoty_2d = np.array([h for _, h in programy], dtype=np.int64)
+    python = zmer("cast2 ve smyčce přes lodě", lambda: [navigace.cast2(k, h) for k, h in programy])
+    x, y = zmer("cast2_numpy (2D pole najednou)", lambda: navigace.cast2_numpy(kody_2d, hodnoty_2d))
+    if python != list(zip(x.tolist(), y.tolist())):
+        print("CHYBA: Výsledky flotily se neshodují!")
+
+
+if __name__ == "__main__":
+    main()
@@ -62,6 +62,11 @@ def main():
     lod.navigate();
     lod.vypis_pozici();
 
+    # Část 2 (waypoint) - přeložené příkazy z navigace.py
+    from navigace import preloz_soubor, cast2, manhattan
+    x, y = cast2(*preloz_soubor(join(dirname(realpath(__file__)), "data.txt")))
+    print(f"Část 2 - pozice x: {x}, pozice y: {y}, manhatnovska vzdalenost: {manhattan(x, y)}")
+
 if __name__ == "__main__":
     main()
     
\ No newline at end of file
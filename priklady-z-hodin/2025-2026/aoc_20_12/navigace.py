@@ -0,0 +1,204 @@
+"""
+Zkompilovaná navigace lodi (AoC 2020, den 12).
+
+Vstup se nejdřív jednou přeloží do dvou polí - operačních kódů a hodnot
+(array modul, tj. souvislá paměť místo seznamu řetězců). Simulace pak
+pracuje jen s celými čísly: směr je index do tabulky vektorů SMERY
+a otočení je posun indexu o hodnota // 90.
+
+  * cast1 / cast2            - čistý Python nad přeloženými poli
+  * cast1_numpy / cast2_numpy - vektorizovaně přes NumPy (kumulativní součty),
+    funguje i pro 2D pole (řádky = různé lodě / různé programy)
+
+Trik pro NumPy: otočení o násobky 90° spolu komutují, takže směr po
+k-tém příkazu je jen kumulativní součet otočení mod 4. U části 2 se
+waypoint přepočítá do otočené soustavy, kde ho mění jen posuny - pak je
+to opět kumulativní součet.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Operační kódy: N, E, S, W mají stejné číslo jako index směru v SMERY
+OPKODY = {"N": 0, "E": 1, "S": 2, "W": 3, "L": 4, "R": 5, "F": 6}
+SMERY = ((0, 1), (1, 0), (0, -1), (-1, 0))  # N, E, S, W jako (dx, dy)
+L, R, F = OPKODY["L"], OPKODY["R"], OPKODY["F"]
+
+
+# Tabulka pro bajtové řádky: ord('N') -> 0 atd.
+_KOD_BAJTU = {ord(znak): kod for znak, kod in OPKODY.items()}
+
+
+def preloz(radky) -> tuple[array, array]:
+    """Přeloží řádky typu 'F10' na pole (kódy, hodnoty). Přijímá i bajtové řádky."""
+    kody = array("b")
+    hodnoty = array("i")
+    for radek in radky:
+        radek = radek.strip()
+        if not radek:
+            continue
+        # int() umí i bajty, u bajtů je radek[0] přímo číslo znaku
+        kody.append(_KOD_BAJTU[radek[0]] if isinstance(radek, bytes) else OPKODY[radek[0]])
+        hodnoty.append(int(radek[1:]))
+    return kody, hodnoty
+
+
+def preloz_soubor(cesta: str) -> tuple[array, array]:
+    """Čte soubor po řádcích (proudově), celý text se nedrží v paměti."""
+    with open(cesta, "rb") as f:
+        return preloz(f)
+
+
+def _preloz_blok_numpy(data: bytes):
+    """Přeloží blok celých řádků bez Python smyčky přes řádky."""
+    pole = np.frombuffer(data, dtype=np.uint8)
+    konce = np.flatnonzero(pole == ord("\n"))
+    if len(pole) and pole[-1] != ord("\n"):
+        konce = np.append(konce, len(pole))
+    zacatky = np.concatenate(([0], konce[:-1] + 1))
+    # Windows konce řádků a prázdné řádky
+    konce = konce - (pole[np.minimum(konce, len(pole)) - 1] == ord("\r"))
+    neprazdne = konce > zacatky
+    zacatky, konce = zacatky[neprazdne], konce[neprazdne]
+
+    tabulka = np.full(256, -1, dtype=np.int8)
+    for znak, kod in OPKODY.items():
+        tabulka[ord(znak)] = kod
+    kody = tabulka[pole[zacatky]]
+
+    # Číslo skládáme od poslední číslice: hodnota += číslice * 10^k
+    hodnoty = np.zeros(len(zacatky), dtype=np.int64)
+    rad = 1
+    for k in range(int((konce - zacatky).max(initial=1)) - 1):
+        pozice = konce - 1 - k
+        platne = pozice > zacatky
+        hodnoty += np.where(platne, pole[np.where(platne, pozice, 0)].astype(np.int64) - ord("0"), 0) * rad
+        rad *= 10
+    return kody, hodnoty
+
+
+def preloz_soubor_numpy(cesta: str, velikost_bloku: int = 16 * 1024 * 1024):
+    """
+    Vektorizovaný překlad po blocích (proudově, po velikost_bloku bajtech).
+    Blok se vždy ořízne na poslední celý řádek, zbytek jde do dalšího bloku.
+    """
+    if np is None:
+        raise ImportError("Vektorizovaný překlad vyžaduje numpy (pip install numpy)")
+    casti_kodu, casti_hodnot = [], []
+    zbytek = b""
+    with open(cesta, "rb") as f:
+        while blok := f.read(velikost_bloku):
+            blok = zbytek + blok
+            konec = blok.rfind(b"\n") + 1
+            blok, zbytek = blok[:konec], blok[konec:]
+            if blok:
+                kody, hodnoty = _preloz_blok_numpy(blok)
+                casti_kodu.append(kody)
+                casti_hodnot.append(hodnoty)
+    if zbytek:
+        kody, hodnoty = _preloz_blok_numpy(zbytek)
+        casti_kodu.append(kody)
+        casti_hodnot.append(hodnoty)
+    if not casti_kodu:
+        return np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int64)
+    return np.concatenate(casti_kodu), np.concatenate(casti_hodnot)
+
+
+def cast1(kody, hodnoty) -> tuple[int, int]:
+    x = y = 0
+    smer = 1  # začínáme na východ
+    for kod, hodnota in zip(kody, hodnoty):
+        if kod == F:
+            dx, dy = SMERY[smer]
+            x += dx * hodnota
+            y += dy * hodnota
+        elif kod == R:
+            smer = (smer + hodnota // 90) % 4
+        elif kod == L:
+            smer = (smer - hodnota // 90) % 4
+        else:
+            dx, dy = SMERY[kod]
+            x += dx * hodnota
+            y += dy * hodnota
+    return x, y
+
+
+def _otoc(wx: int, wy: int, kroky: int) -> tuple[int, int]:
+    """Otočí vektor o kroky * 90° po směru hodinových ručiček."""
+    for _ in range(kroky % 4):
+        wx, wy = wy, -wx
+    return wx, wy
+
+
+def cast2(kody, hodnoty, waypoint=(10, 1)) -> tuple[int, int]:
+    x = y = 0
+    wx, wy = waypoint
+    for kod, hodnota in zip(kody, hodnoty):
+        if kod == F:
+            x += wx * hodnota
+            y += wy * hodnota
+        elif kod == R:
+            wx, wy = _otoc(wx, wy, hodnota // 90)
+        elif kod == L:
+            wx, wy = _otoc(wx, wy, -(hodnota // 90))
+        else:
+            dx, dy = SMERY[kod]
+            wx += dx * hodnota
+            wy += dy * hodnota
+    return x, y
+
+
+def _numpy_pole(kody, hodnoty):
+    if np is None:
+        raise ImportError("Vektorizovaná simulace vyžaduje numpy (pip install numpy)")
+    return np.asarray(kody, dtype=np.int8), np.asarray(hodnoty, dtype=np.int64)
+
+
+def _otoceni(kody, hodnoty):
+    """Kumulativní otočení (v krocích po 90°) po každém příkazu."""
+    kroky = np.where(kody == R, hodnoty // 90, 0) - np.where(kody == L, hodnoty // 90, 0)
+    return np.cumsum(kroky, axis=-1)
+
+
+def cast1_numpy(kody, hodnoty):
+    """Vrací (x, y); pro 2D vstup pole souřadnic všech lodí."""
+    kody, hodnoty = _numpy_pole(kody, hodnoty)
+    vektory = np.array(SMERY, dtype=np.int64)
+    smer = (1 + _otoceni(kody, hodnoty)) % 4
+    # Pohyb N/E/S/W jde podle kódu, F podle aktuálního směru lodi
+    index = np.where(kody == F, smer, np.minimum(kody, 3))
+    pohyb = np.where((kody <= 3) | (kody == F), hodnoty, 0)
+    x = (vektory[index, 0] * pohyb).sum(axis=-1)
+    y = (vektory[index, 1] * pohyb).sum(axis=-1)
+    return x, y
+
+
+def cast2_numpy(kody, hodnoty, waypoint=(10, 1)):
+    """
+    Waypoint v otočené soustavě (u = Q^-1 w) mění jen posuny N/E/S/W,
+    takže u je kumulativní součet; skutečný waypoint je w = Q u.
+    """
+    kody, hodnoty = _numpy_pole(kody, hodnoty)
+    q = _otoceni(kody, hodnoty) % 4
+    posun = np.where(kody <= 3, hodnoty, 0)
+    smer = np.minimum(kody, 3)
+    # Posun N/E/S/W otočený o -q (do otočené soustavy) je směr (smer - q) mod 4
+    vektory = np.array(SMERY, dtype=np.int64)
+    otoceny = (smer - q) % 4
+    ux = waypoint[0] + np.cumsum(vektory[otoceny, 0] * posun, axis=-1)
+    uy = waypoint[1] + np.cumsum(vektory[otoceny, 1] * posun, axis=-1)
+    # Otočení u zpět o q kroků: (x, y) -> (y, -x) opakovaně
+    cos = np.array([1, 0, -1, 0], dtype=np.int64)[q]
+    sin = np.array([0, 1, 0, -1], dtype=np.int64)[q]
+    wx = cos * ux + sin * uy
+    wy = -sin * ux + cos * uy
+    dopredu = np.where(kody == F, hodnoty, 0)
+    return (wx * dopredu).sum(axis=-1), (wy * dopredu).sum(axis=-1)
+
+
+def manhattan(x, y):
+    return abs(x) + abs(y)
@@ -0,0 +1,15 @@
+"""Rozhraní pro aoc_runner: parsuj(data) -> vstup, cast1(vstup), cast2(vstup)."""
+
+from .navigace import preloz, cast1 as _cast1, cast2 as _cast2, manhattan
+
+
+def parsuj(data: bytes):
+    return preloz(data.splitlines())
+
+
+def cast1(vstup) -> int:
+    return manhattan(*_cast1(*vstup))
+
+
+def cast2(vstup) -> int:
+    return manhattan(*_cast2(*vstup))
@@ -0,0 +1,64 @@
+"""
+Benchmark: rekurze s lru_cache (main.py) vs. počty dvojic vs. maticové umocňování.
+
+Použití:  python benchmark.py [kroky ...]     (výchozí 10 40 1000)
+Vstup se čte stejně jako v main.py (test.txt vedle skriptu).
+"""
+
+import sys
+import time
+
+import main
+from polymer import polymerizace_pary, polymerizace_matice
+
+# Rekurze jde do hloubky ~2 rámce na krok
+sys.setrecursionlimit(100_000)
+
+
+def rekurzivne(polymer, pravidla, pocet_kroku):
+    main.polymerizace_recursive.cache_clear()
+    return main.polymerizace_recursive(polymer, pocet_kroku)
+
+
+METODY = {
+    "rekurze (lru_cache 100)": rekurzivne,
+    "počty dvojic": polymerizace_pary,
+    "matice M^n": polymerizace_matice,
+}
+
+
+def zmer(funkce, pocet_kroku: int):
+    start = time.perf_counter()
+    try:
+        vysledek = funkce(main.vychozi_polymer, main.pravidla, pocet_kroku)
+    except RecursionError:
+        return None, float("nan")
+    return vysledek, time.perf_counter() - start
+
+
+def main_benchmark():
+    kroky = [int(k) for k in sys.argv[1:]] or [10, 40, 1000]
+    print(f"{'Kroky':>8}  " + "".join(f"{nazev:>26}" for nazev in METODY))
+    for pocet_kroku in kroky:
+        vysledky = []
+        radek = f"{pocet_kroku:>8}  "
+        for nazev, funkce in METODY.items():
+            # Rekurze na velkém počtu kroků nemá smysl čekat
+            if funkce is rekurzivne and pocet_kroku > 1000:
+                radek += f"{'-':>26}"
+                continue
+            if funkce is polymerizace_pary and pocet_kroku > 100_000:
+                radek += f"{'-':>26}"
+                continue
+            vysledek, doba = zmer(funkce, pocet_kroku)
+            radek += f"{doba * 1000:>23.2f} ms" if vysledek is not None else f"{'RecursionError':>26}"
+            if vysledek is not None:
+                vysledky.append(vysledek)
+        print(radek)
+        # Všechny metody přeskočené -> není co porovnávat
+        if vysledky and any(v != vysledky[0] for v in vysledky[1:]):
+            print("CHYBA: Metody se neshodují!")
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -1,19 +1,15 @@
 from os.path import join, dirname, realpath
 from functools import lru_cache
 
+from polymer import nacti_vstup, polymerizace_pary, rozdil_extremu
+
 
 def load_file(cesta: str = join(dirname(realpath(__file__)), "test.txt")) -> str:
     with open(cesta, "r", encoding="utf-8") as f:
         return f.read()
 
 
-vystup = load_file().split('\n\n')
-vystup[1] = {
-    radek.split('->')[0].strip(): radek.split('->')[1].strip()
-    for radek in vystup[1].split('\n')
-}
-vychozi_polymer = vystup[0]
-pravidla = vystup[1]
+vychozi_polymer, pravidla = nacti_vstup(load_file())
 
 @lru_cache(maxsize=100)
 def polymerizace_recursive(polymer: str, pocet_cyklu) -> dict:
@@ -49,9 +45,10 @@ def polymerizace_recursive(polymer: str, pocet_cyklu) -> dict:
 
 
 def main():
-    vysledky = polymerizace_recursive(vychozi_polymer, 40)
-    serazene_vysledky =sorted(vysledky.values())
-    print(serazene_vysledky[-1]-serazene_vysledky[0])
+    # Původní rekurzivní řešení: polymerizace_recursive(vychozi_polymer, 40)
+    # Počty dvojic (polymer.py) dávají stejný výsledek a zvládnou i miliony kroků.
+    print(rozdil_extremu(polymerizace_pary(vychozi_polymer, pravidla, 10)))
+    print(rozdil_extremu(polymerizace_pary(vychozi_polymer, pravidla, 40)))
 
 
 if __name__ == "__main__":
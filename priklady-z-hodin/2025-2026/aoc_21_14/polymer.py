@@ -0,0 +1,135 @@
+"""
+Polymerizace pomocí počtů dvojic (AoC 2021, den 14).
+
+Místo řetězce (nebo rekurze přes jeho části) si pamatujeme jen, kolikrát
+se v polymeru vyskytuje každá dvojice prvků. Pravidlo AB -> C udělá
+z každé dvojice AB dvojice AC a CB, takže jeden krok je lineární
+zobrazení: vektor počtů dvojic krát přechodová matice M.
+
+  * polymerizace_pary   - krok po kroku, O(kroky * počet dvojic)
+  * polymerizace_matice - M^n umocňováním (O(log n) násobení matic),
+                          vhodné pro obrovské počty kroků (10^6+)
+
+Výsledky jsou vždy přesná celá čísla (Python int). Matice se násobí přes
+NumPy s dtype=object, pokud je NumPy k dispozici, jinak čistým Pythonem.
+"""
+
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def nacti_vstup(text: str) -> tuple[str, dict[str, str]]:
+    """Rozparsuje zadání na výchozí polymer a pravidla {"AB": "C"}."""
+    polymer, blok_pravidel = text.strip().split("\n\n")
+    pravidla = {}
+    for radek in blok_pravidel.splitlines():
+        dvojice, prvek = radek.split("->")
+        pravidla[dvojice.strip()] = prvek.strip()
+    return polymer.strip(), pravidla
+
+
+def pocty_prvku(pocty_dvojic: dict[str, int], polymer: str) -> dict[str, int]:
+    """
+    Z počtů dvojic spočítá počty prvků. Každý prvek je prvním znakem
+    nějaké dvojice - kromě posledního znaku polymeru, ten se nikdy nemění.
+    """
+    pocty = Counter({polymer[-1]: 1})
+    for dvojice, pocet in pocty_dvojic.items():
+        pocty[dvojice[0]] += pocet
+    return dict(pocty)
+
+
+def polymerizace_pary(polymer: str, pravidla: dict[str, str], pocet_kroku: int) -> dict[str, int]:
+    pocty_dvojic = Counter(a + b for a, b in zip(polymer, polymer[1:]))
+    for _ in range(pocet_kroku):
+        nove = Counter()
+        for dvojice, pocet in pocty_dvojic.items():
+            prvek = pravidla.get(dvojice)
+            if prvek is None:
+                nove[dvojice] += pocet
+            else:
+                nove[dvojice[0] + prvek] += pocet
+                nove[prvek + dvojice[1]] += pocet
+        pocty_dvojic = nove
+    return pocty_prvku(pocty_dvojic, polymer)
+
+
+def dosazitelne_dvojice(polymer: str, pravidla: dict[str, str]) -> list[str]:
+    """Jen dvojice, které mohou vzniknout - zmenší matici."""
+    fronta = [a + b for a, b in zip(polymer, polymer[1:])]
+    videne = set(fronta)
+    while fronta:
+        dvojice = fronta.pop()
+        prvek = pravidla.get(dvojice)
+        if prvek is None:
+            continue
+        for nova in (dvojice[0] + prvek, prvek + dvojice[1]):
+            if nova not in videne:
+                videne.add(nova)
+                fronta.append(nova)
+    return sorted(videne)
+
+
+def prechodova_matice(dvojice: list[str], pravidla: dict[str, str]) -> list[list[int]]:
+    """M[j][i] = kolik dvojic j vznikne z jedné dvojice i za jeden krok."""
+    index = {d: i for i, d in enumerate(dvojice)}
+    matice = [[0] * len(dvojice) for _ in dvojice]
+    for i, d in enumerate(dvojice):
+        prvek = pravidla.get(d)
+        if prvek is None:
+            matice[i][i] += 1
+        else:
+            matice[index[d[0] + prvek]][i] += 1
+            matice[index[prvek + d[1]]][i] += 1
+    return matice
+
+
+def _nasob(a, b):
+    """Součin matic (nebo matice a sloupcového vektoru)."""
+    if np is not None:
+        return a.dot(b)
+    sloupce_b = list(zip(*b))
+    return [[sum(x * y for x, y in zip(radek, sloupec) if x and y) for sloupec in sloupce_b]
+            for radek in a]
+
+
+def umocni_na_vektor(matice, vektor: list[int], n: int) -> list[int]:
+    """
+    Spočítá M^n · v binárním umocňováním. Matici jen umocňujeme na druhou,
+    na vektor ji aplikujeme, když má n v daném bitu jedničku - výsledek
+    je tak jen O(log n) násobení matic.
+    """
+    if np is not None:
+        zaklad = np.array(matice, dtype=object)
+        vysledek = np.array([[v] for v in vektor], dtype=object)
+    else:
+        zaklad, vysledek = matice, [[v] for v in vektor]
+    while n:
+        if n & 1:
+            vysledek = _nasob(zaklad, vysledek)
+        n >>= 1
+        if n:
+            zaklad = _nasob(zaklad, zaklad)
+    return [int(radek[0]) for radek in vysledek]
+
+
+def polymerizace_matice(polymer: str, pravidla: dict[str, str], pocet_kroku: int) -> dict[str, int]:
+    dvojice = dosazitelne_dvojice(polymer, pravidla)
+    index = {d: i for i, d in enumerate(dvojice)}
+    vektor = [0] * len(dvojice)
+    for a, b in zip(polymer, polymer[1:]):
+        vektor[index[a + b]] += 1
+
+    vektor = umocni_na_vektor(prechodova_matice(dvojice, pravidla), vektor, pocet_kroku)
+    pocty_dvojic = {d: pocet for d, pocet in zip(dvojice, vektor) if pocet}
+    return pocty_prvku(pocty_dvojic, polymer)
+
+
+def rozdil_extremu(pocty: dict[str, int]) -> int:
+    """Odpověď úlohy: nejčastější minus nejméně častý prvek."""
+    serazene = sorted(pocty.values())
+    return serazene[-1] - serazene[0]
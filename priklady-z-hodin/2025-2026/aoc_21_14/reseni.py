@@ -0,0 +1,17 @@
+"""Rozhraní pro aoc_runner: parsuj(data) -> vstup, cast1(vstup), cast2(vstup)."""
+
+from .polymer import nacti_vstup, polymerizace_pary, rozdil_extremu
+
+VSTUP = "test.txt"  # plný vstup v repozitáři není
+
+
+def parsuj(data: bytes):
+    return nacti_vstup(data.decode("utf-8"))
+
+
+def cast1(vstup) -> int:
+    return rozdil_extremu(polymerizace_pary(*vstup, 10))
+
+
+def cast2(vstup) -> int:
+    return rozdil_extremu(polymerizace_pary(*vstup, 40))
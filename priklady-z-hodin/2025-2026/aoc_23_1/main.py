@@ -1,21 +1,20 @@
 from os.path import join, realpath, dirname
 
-numbers = ("one", "two", "three", "four", "five",
-           "six", "seven", "eight", "nine")
+from skener import cislicovy_automat
 
 cesta = join(dirname(realpath(__file__)), "data.txt")
 
+# Původně: pro každou pozici radek.startswith(numbers, i) a pak znovu
+# radek[i:].startswith(number) pro všech devět slov. Aho-Corasick automat
+# ze skener.py projde řádek jednou a najde i překrývající se slova.
+automat = cislicovy_automat()
+
 suma = 0
 
-with open(cesta, "r", encoding="utf-8") as f:
+with open(cesta, "rb") as f:
     for radek in f:
-        cisla = [
-            int(znak) if znak.isdigit() else
-            [idx+1 
-             for idx, number in enumerate(numbers)
-             if radek[i:].startswith(number)][0]
-            for i, znak in enumerate(radek)
-            if radek.startswith(numbers, i) or znak.isdigit()]
-        suma += cisla[0]*10+cisla[-1]
-        print(cisla)
+        prvni, posledni = automat.prvni_a_posledni(radek)
+        if prvni is not None:
+            suma += prvni*10+posledni
 print(suma)
+# Pro velké soubory: soucet_souboru(cesta) - jeden průchod přes mmap bez dělení na řádky
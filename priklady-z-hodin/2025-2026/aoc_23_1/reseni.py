@@ -0,0 +1,18 @@
+"""Rozhraní pro aoc_runner: parsuj(data) -> vstup, cast1(vstup), cast2(vstup)."""
+
+from .skener import cislicovy_automat
+
+_JEN_CISLICE = cislicovy_automat(se_slovy=False)
+_CISLICE_A_SLOVA = cislicovy_automat()
+
+
+def parsuj(data: bytes):
+    return data
+
+
+def cast1(vstup) -> int:
+    return _JEN_CISLICE.soucet_kalibraci(vstup)
+
+
+def cast2(vstup) -> int:
+    return _CISLICE_A_SLOVA.soucet_kalibraci(vstup)
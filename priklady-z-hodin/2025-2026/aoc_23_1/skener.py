@@ -0,0 +1,126 @@
+"""
+Aho-Corasick skener číslic (AoC 2023, den 1).
+
+Automat se postaví jednou ze všech vzorů (číslice i slova) a pak každý
+řádek projde znak po znaku: jeden přechod v tabulce na znak, bez
+startswith pro každé slovo a bez kopií radek[i:]. Najde i překrývající
+se výskyty ("oneight" -> 1, 8).
+
+Automat je úplný DFA: přechody přes selhání (fail) jsou předpočítané,
+takže stav je jen index do tabulky delta[stav][bajt].
+"""
+
+import mmap
+from collections import deque
+
+SLOVA = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+class AhoCorasick:
+    def __init__(self, vzory: dict):
+        """vzory: {vzor (str nebo bytes): hodnota}"""
+        self.delta = [[0] * 256]
+        # Pro každý stav seznam (délka vzoru, hodnota) vzorů, které v něm končí
+        self.vystupy = [()]
+        for vzor, hodnota in vzory.items():
+            if isinstance(vzor, str):
+                vzor = vzor.encode("utf-8")
+            stav = 0
+            for znak in vzor:
+                if self.delta[stav][znak] == 0:
+                    self.delta.append([0] * 256)
+                    self.vystupy.append(())
+                    self.delta[stav][znak] = len(self.delta) - 1
+                stav = self.delta[stav][znak]
+            self.vystupy[stav] += ((len(vzor), hodnota),)
+        self._dopocitej_selhani()
+
+    def _dopocitej_selhani(self) -> None:
+        """BFS přes trii; chybějící přechody doplní podle fail odkazu."""
+        selhani = [0] * len(self.delta)
+        fronta = deque(s for s in self.delta[0] if s)
+        while fronta:
+            stav = fronta.popleft()
+            self.vystupy[stav] += self.vystupy[selhani[stav]]
+            for znak in range(256):
+                dalsi = self.delta[stav][znak]
+                if dalsi:
+                    selhani[dalsi] = self.delta[selhani[stav]][znak]
+                    fronta.append(dalsi)
+                else:
+                    self.delta[stav][znak] = self.delta[selhani[stav]][znak]
+
+    def najdi(self, text: bytes):
+        """Generuje (začátek, hodnota) pro všechny výskyty včetně překryvů."""
+        delta, vystupy = self.delta, self.vystupy
+        stav = 0
+        for i, znak in enumerate(text):
+            stav = delta[stav][znak]
+            for delka, hodnota in vystupy[stav]:
+                yield i - delka + 1, hodnota
+
+    def prvni_a_posledni(self, text: bytes):
+        """(hodnota prvního, hodnota posledního výskytu) podle začátku, jedním průchodem."""
+        delta, vystupy = self.delta, self.vystupy
+        stav = 0
+        prvni = posledni = None
+        prvni_zacatek = len(text)
+        posledni_zacatek = -1
+        for i, znak in enumerate(text):
+            stav = delta[stav][znak]
+            for delka, hodnota in vystupy[stav]:
+                zacatek = i - delka + 1
+                if zacatek < prvni_zacatek:
+                    prvni_zacatek, prvni = zacatek, hodnota
+                if zacatek > posledni_zacatek:
+                    posledni_zacatek, posledni = zacatek, hodnota
+        return prvni, posledni
+
+    def soucet_kalibraci(self, data) -> int:
+        """
+        Součet 10 * první + poslední přes všechny řádky bufferu (bytes, mmap).
+        Celý buffer projde jedna smyčka, řádky se nekopírují - na '\\n'
+        se jen uzavře aktuální řádek a automat se vrátí do počátečního stavu.
+        """
+        delta, vystupy = self.delta, self.vystupy
+        nova_radka = ord("\n")
+        suma = 0
+        stav = 0
+        prvni = posledni = None
+        prvni_zacatek = posledni_zacatek = 0
+        for i, znak in enumerate(memoryview(data)):
+            if znak == nova_radka:
+                if prvni is not None:
+                    suma += 10 * prvni + posledni
+                stav = 0
+                prvni = posledni = None
+                continue
+            stav = delta[stav][znak]
+            for delka, hodnota in vystupy[stav]:
+                zacatek = i - delka + 1
+                if prvni is None or zacatek < prvni_zacatek:
+                    prvni_zacatek, prvni = zacatek, hodnota
+                if posledni is None or zacatek > posledni_zacatek:
+                    posledni_zacatek, posledni = zacatek, hodnota
+        if prvni is not None:
+            suma += 10 * prvni + posledni
+        return suma
+
+
+def cislicovy_automat(se_slovy: bool = True) -> AhoCorasick:
+    vzory = {str(c): c for c in range(10)}
+    if se_slovy:
+        vzory.update({slovo: i + 1 for i, slovo in enumerate(SLOVA)})
+    return AhoCorasick(vzory)
+
+
+def soucet_souboru(cesta: str, se_slovy: bool = True) -> int:
+    """Hromadné zpracování velkého souboru přes mmap (soubor se nenačítá do paměti celý)."""
+    automat = cislicovy_automat(se_slovy)
+    with open(cesta, "rb") as f:
+        try:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # prázdný soubor nejde namapovat
+            return 0
+        with mapa:
+            return automat.soucet_kalibraci(mapa)
@@ -0,0 +1,73 @@
+"""
+Benchmark na vygenerovaném vstupu: původní řešení vs. vyber_cislic.py
+(postupně po blocích a v poolu procesů; hledání i zásobník pro k=2 a k=12).
+
+Použití:  python benchmark.py [velikost_MB] [pocet_procesu]     (výchozí 1024 MB)
+Vstup se vygeneruje do dočasného souboru a po skončení se smaže.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from main import puvodni_soucet
+from vyber_cislic import soucet_souboru
+
+DELKA_RADKU = 100
+# Náhodné bajty -> číslice 1-9 (jako v zadání AoC)
+PREKLAD = bytes.maketrans(bytes(range(256)), bytes(ord("1") + i % 9 for i in range(256)))
+
+
+def vygeneruj_vstup(cesta: str, velikost: int) -> None:
+    radku_v_bloku = 10_000
+    with open(cesta, "wb") as f:
+        zapsano = 0
+        while zapsano < velikost:
+            cislice = os.urandom(radku_v_bloku * DELKA_RADKU).translate(PREKLAD)
+            blok = b"\n".join(cislice[i:i + DELKA_RADKU]
+                              for i in range(0, len(cislice), DELKA_RADKU)) + b"\n"
+            f.write(blok)
+            zapsano += len(blok)
+
+
+def zmer(nazev: str, funkce):
+    start = time.perf_counter()
+    vysledek = funkce()
+    doba = time.perf_counter() - start
+    print(f"{nazev:<42} {doba:>8.2f} s  (výsledek {vysledek})")
+    return vysledek
+
+
+def main():
+    velikost_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    pocet_procesu = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    with tempfile.TemporaryDirectory() as adresar:
+        cesta = os.path.join(adresar, "data.txt")
+        print(f"Generuji {velikost_mb} MB vstupu...")
+        vygeneruj_vstup(cesta, velikost_mb * 1024 * 1024)
+
+        vysledky = [
+            zmer("původní main.py (k=2)", lambda: puvodni_soucet(cesta)),
+            zmer("vyber_cislic hledáním, po blocích (k=2)",
+                 lambda: soucet_souboru(cesta, 2, metoda="hledani")),
+            zmer("vyber_cislic zásobníkem, po blocích (k=2)",
+                 lambda: soucet_souboru(cesta, 2, metoda="zasobnik")),
+            zmer(f"vyber_cislic, {pocet_procesu} procesů (k=2)",
+                 lambda: soucet_souboru(cesta, 2, pocet_procesu=pocet_procesu)),
+        ]
+        vysledky_12 = [
+            zmer("vyber_cislic hledáním, po blocích (k=12)",
+                 lambda: soucet_souboru(cesta, 12, metoda="hledani")),
+            zmer("vyber_cislic zásobníkem, po blocích (k=12)",
+                 lambda: soucet_souboru(cesta, 12, metoda="zasobnik")),
+            zmer(f"vyber_cislic, {pocet_procesu} procesů (k=12)",
+                 lambda: soucet_souboru(cesta, 12, pocet_procesu=pocet_procesu)),
+        ]
+        if len(set(vysledky)) != 1 or len(set(vysledky_12)) != 1:
+            print("CHYBA: Výsledky se neshodují!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,29 @@
 from os.path import join, realpath, dirname
 
+from vyber_cislic import soucet_souboru
+
 cesta = join(dirname(realpath(__file__)), "data.txt")
 
-suma = 0
-
-with open(cesta, "r", encoding="utf-8") as f:
-    for radek in f:
-        radek = radek.strip()
-        nejvetsi_cislo = max(radek[:-1])
-        for i,ch in enumerate(radek):
-            if ch == nejvetsi_cislo:
-                druhe_nejvetsi_cislo = max(radek[i+1:])
-                break
-            else:
-                pass
-        suma+=int(nejvetsi_cislo+druhe_nejvetsi_cislo)
-        
-print(suma)
-        
+
+def puvodni_soucet(cesta):
+    """Původní řešení pro 2 číslice (max přes řezy řádku) - pro srovnání v benchmark.py."""
+    suma = 0
+
+    with open(cesta, "r", encoding="utf-8") as f:
+        for radek in f:
+            radek = radek.strip()
+            nejvetsi_cislo = max(radek[:-1])
+            for i,ch in enumerate(radek):
+                if ch == nejvetsi_cislo:
+                    druhe_nejvetsi_cislo = max(radek[i+1:])
+                    break
+                else:
+                    pass
+            suma+=int(nejvetsi_cislo+druhe_nejvetsi_cislo)
+
+    return suma
+
+
+if __name__ == "__main__":
+    print(soucet_souboru(cesta, 2))
+    print(soucet_souboru(cesta, 12))
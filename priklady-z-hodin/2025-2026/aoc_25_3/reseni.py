@@ -0,0 +1,15 @@
+"""Rozhraní pro aoc_runner: parsuj(data) -> vstup, cast1(vstup), cast2(vstup)."""
+
+from .vyber_cislic import soucet_radku
+
+
+def parsuj(data: bytes):
+    return data.splitlines()
+
+
+def cast1(vstup) -> int:
+    return soucet_radku(vstup, 2)
+
+
+def cast2(vstup) -> int:
+    return soucet_radku(vstup, 12)
@@ -0,0 +1,144 @@
+"""
+Společný spouštěč AoC řešení s měřením času.
+
+Najde všechny adresáře aoc_* vedle sebe, které obsahují reseni.py s funkcemi
+    parsuj(data: bytes) -> vstup
+    cast1(vstup) -> výsledek
+    cast2(vstup) -> výsledek
+(volitelně VSTUP = "jmeno_souboru.txt", výchozí je data.txt). Adresář dne
+se načte jako balíček, takže reseni.py importuje sousední moduly relativně
+(from .polymer import ...) a stejně pojmenované moduly různých dnů se
+nepomíchají.
+
+Vstup se načte jednou a naparsuje jednou; stejný naparsovaný
+vstup pak dostanou všechna opakování obou částí. Časy se měří pomocí
+time.perf_counter, s --repeat se vypíše nejlepší čas a medián.
+Dny lze spouštět paralelně v procesech (--procesy) a výsledky připisovat
+do JSON-lines souboru (--json), aby šlo sledovat vývoj v čase.
+
+Použití:
+    python main.py                      # všechny dny
+    python main.py aoc_20_12 aoc_23_1 --repeat 20 --procesy 4 --json vysledky.jsonl
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from os.path import basename, dirname, exists, isdir, join, realpath
+from glob import glob
+
+KOREN = dirname(dirname(realpath(__file__)))
+
+
+def najdi_dny(filtry: list[str]) -> list[str]:
+    dny = sorted(basename(cesta) for cesta in glob(join(KOREN, "aoc_*"))
+                 if isdir(cesta) and exists(join(cesta, "reseni.py")))
+    if filtry:
+        dny = [den for den in dny if any(f in den for f in filtry)]
+    return dny
+
+
+def nacti_modul(den: str):
+    """Načte aoc_*/reseni.py jako modul balíčku `den` (adresář dne, bez __init__.py)."""
+    adresar = join(KOREN, den)
+    if den not in sys.modules:
+        balicek = importlib.util.module_from_spec(importlib.util.spec_from_loader(den, None, is_package=True))
+        balicek.__path__ = [adresar]  # tady hledá relativní importy (from .polymer import ...)
+        sys.modules[den] = balicek
+    spec = importlib.util.spec_from_file_location(f"{den}.reseni", join(adresar, "reseni.py"))
+    modul = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = modul
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def nacti_data(cesta: str) -> bytes:
+    with open(cesta, "rb") as f:
+        return f.read()
+
+
+def zmer(funkce, vstup, opakovani: int):
+    casy = []
+    vysledek = None
+    for _ in range(opakovani):
+        start = time.perf_counter()
+        vysledek = funkce(vstup)
+        casy.append(time.perf_counter() - start)
+    return {"vysledek": vysledek, "min_ms": min(casy) * 1000, "median_ms": statistics.median(casy) * 1000}
+
+
+def spust_den(den: str, nazev_vstupu: str | None, opakovani: int) -> dict:
+    zaznam = {"den": den}
+    try:
+        modul = nacti_modul(den)
+        cesta = join(KOREN, den, nazev_vstupu or getattr(modul, "VSTUP", "data.txt"))
+        if not exists(cesta):
+            zaznam["chyba"] = f"chybí vstup {basename(cesta)}"
+            return zaznam
+        data = nacti_data(cesta)
+        start = time.perf_counter()
+        vstup = modul.parsuj(data)
+        zaznam["parsovani_ms"] = (time.perf_counter() - start) * 1000
+        for cast in ("cast1", "cast2"):
+            if hasattr(modul, cast):
+                zaznam[cast] = zmer(getattr(modul, cast), vstup, opakovani)
+    except Exception as e:
+        zaznam["chyba"] = f"{type(e).__name__}: {e}"
+    return zaznam
+
+
+def vypis_tabulku(zaznamy: list[dict]) -> None:
+    print(f"{'Den':<12} {'Parsování':>10} {'Část 1':>10} {'Část 2':>10}   Výsledky")
+    for z in zaznamy:
+        if "chyba" in z:
+            print(f"{z['den']:<12} {'-':>10} {'-':>10} {'-':>10}   {z['chyba']}")
+            continue
+        casy = [f"{z[c]['min_ms']:>8.2f}ms" if c in z else f"{'-':>10}" for c in ("cast1", "cast2")]
+        vysledky = " / ".join(str(z[c]["vysledek"]) for c in ("cast1", "cast2") if c in z)
+        print(f"{z['den']:<12} {z['parsovani_ms']:>8.2f}ms {casy[0]} {casy[1]}   {vysledky}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Spustí AoC řešení a změří jejich čas.")
+    parser.add_argument("dny", nargs="*", help="Filtr dnů (např. aoc_20_12 nebo 23_1)")
+    parser.add_argument("--vstup", help="Jméno vstupního souboru v adresáři dne (výchozí podle reseni.VSTUP)")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Počet opakování každé části")
+    parser.add_argument("-j", "--procesy", type=int, default=1, help="Kolik dnů spouštět paralelně")
+    parser.add_argument("--json", metavar="SOUBOR", help="Připsat výsledky jako řádek JSON do souboru")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat musí být alespoň 1")
+
+    dny = najdi_dny(args.dny)
+    if not dny:
+        print("Nenalezen žádný den s reseni.py.")
+        return
+
+    argumenty = (dny, [args.vstup] * len(dny), [args.repeat] * len(dny))
+    if args.procesy > 1:
+        with ProcessPoolExecutor(args.procesy) as pool:
+            zaznamy = list(pool.map(spust_den, *argumenty))
+    else:
+        zaznamy = list(map(spust_den, *argumenty))
+
+    vypis_tabulku(zaznamy)
+
+    if args.json:
+        radek = {
+            "cas": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "opakovani": args.repeat,
+            "dny": zaznamy,
+        }
+        with open(args.json, "a", encoding="utf-8") as f:
+            f.write(json.dumps(radek, ensure_ascii=False, default=str) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Asyncio režim crawleru.
+
+Místo N vláken s blokujícím requests.get běží N korutin v jednom vlákně.
+Všechny sdílí jednu aiohttp.ClientSession s poolem keep-alive spojení,
+takže se TCP spojení nenavazuje pro každou stránku znovu.
+
+Backpressure: korutiny si URL z fronty berou samy, až mají volno (pull model),
+takže na síti nikdy není víc než `soubeznost` požadavků a na jeden host
+nejvýš `max_na_host` požadavků současně.
+
+Parsování HTML blokuje smyčku událostí; s parametrem `executor`
+(např. parsovani.vytvor_pool()) běží v jiných procesech přes run_in_executor.
+
+S parametrem `cache` (cache.HttpCache) posílá podmíněné požadavky
+stejně jako Crawler.
+
+Sémantika je stejná jako u worker() v main.py: jen stejná doména
+jako start_url a nejvýš max_stranek stažených stránek.
+
+POZOR: Vyžaduje instalaci aiohttp (pip install aiohttp)
+"""
+
+import asyncio
+import time
+
+from crawler import normalizuj_url, netloc_url, get_links
+
+
+class AsyncCrawler:
+    def __init__(self, start_url: str, soubeznost: int = 100, max_na_host: int = 10,
+                 max_stranek: int = 50, timeout: float = 5.0,
+                 extrahuj_odkazy=get_links, executor=None, cache=None,
+                 vypisuj: bool = False):
+        self.start_url = normalizuj_url(start_url)
+        self.domena = netloc_url(self.start_url)
+        self.soubeznost = soubeznost
+        self.max_na_host = max_na_host
+        self.max_stranek = max_stranek
+        self.timeout = timeout
+        self.extrahuj_odkazy = extrahuj_odkazy
+        self.executor = executor
+        self.cache = cache
+        self.vypisuj = vypisuj
+
+        # V jednom vlákně stačí obyčejná množina - mezi dvěma await nás nikdo nepřeruší
+        self.navstivene: set[str] = set()
+        self.stazeno = 0
+        self.chyby = 0
+        self.doba = 0.0
+        self._poradi = 0
+        self._hosty: dict[str, asyncio.Semaphore] = {}
+
+    def _vloz(self, fronta: asyncio.PriorityQueue, url: str, hloubka: int) -> None:
+        self._poradi += 1
+        fronta.put_nowait((hloubka, self._poradi, url))
+
+    def _semafor(self, url: str) -> asyncio.Semaphore:
+        host = netloc_url(url)
+        semafor = self._hosty.get(host)
+        if semafor is None:
+            semafor = self._hosty[host] = asyncio.Semaphore(self.max_na_host)
+        return semafor
+
+    async def stahni(self, session, url: str, hlavicky: dict = None):
+        """Stáhne stránku. Vrací (status, hlavičky odpovědi, surové bajty)."""
+        async with self._semafor(url):
+            async with session.get(url, headers=hlavicky) as response:
+                return response.status, response.headers, await response.read()
+
+    async def stahni_odkazy(self, session, url: str):
+        """Stáhne stránku a vrátí odkazy na ní, nebo None při chybě."""
+        hlavicky = self.cache.hlavicky(url) if self.cache is not None else None
+        status, hlavicky_odpovedi, data = await self.stahni(session, url, hlavicky)
+        if self.cache is not None:
+            odkazy = self.cache.odkazy_beze_zmeny(url, status, hlavicky_odpovedi, data)
+            if odkazy is not None:
+                return odkazy
+        if status != 200:
+            return None
+        odkazy = await self.najdi_odkazy(data, url)
+        if self.cache is not None:
+            self.cache.uloz(url, hlavicky_odpovedi, data, odkazy)
+        return odkazy
+
+    async def najdi_odkazy(self, html, url: str) -> list:
+        if self.executor is None:
+            return self.extrahuj_odkazy(html, url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.extrahuj_odkazy, html, url)
+
+    def pridej_odkazy(self, fronta, odkazy: list, hloubka: int) -> int:
+        pocet_novych = 0
+        for odkaz in odkazy:
+            if not odkaz.startswith(("http://", "https://")):
+                continue
+            try:
+                odkaz = normalizuj_url(odkaz)
+            except ValueError:
+                continue  # neplatný odkaz (např. port 99999) - ostatní odkazy stránky platí
+            if netloc_url(odkaz) == self.domena and odkaz not in self.navstivene:
+                self.navstivene.add(odkaz)
+                self._vloz(fronta, odkaz, hloubka + 1)
+                pocet_novych += 1
+        return pocet_novych
+
+    async def worker(self, worker_id: int, session, fronta, volno: asyncio.Semaphore,
+                     hotovo: asyncio.Event) -> None:
+        while True:
+            # Místo pro jednu stránku z max_stranek: úspěch ho spotřebuje, chyba vrátí.
+            # Rozpracovaných stránek tak nikdy není víc, než kolik jich ještě chybí.
+            await volno.acquire()
+            hloubka, _, url = await fronta.get()
+            uspech = False
+            try:
+                odkazy = await self.stahni_odkazy(session, url)
+                if odkazy is None:
+                    self.chyby += 1
+                    continue
+                uspech = True
+                self.stazeno += 1
+                if self.stazeno >= self.max_stranek:
+                    hotovo.set()
+                pocet_novych = self.pridej_odkazy(fronta, odkazy, hloubka)
+                if self.vypisuj:
+                    print(f"[Korutina {worker_id}] {url}: {pocet_novych} nových odkazů")
+            except Exception as e:
+                self.chyby += 1
+                if self.vypisuj:
+                    print(f"[Korutina {worker_id}] Chyba při zpracování {url}: {e!r}")
+            finally:
+                if not uspech:
+                    volno.release()
+                fronta.task_done()
+
+    async def crawluj(self) -> "AsyncCrawler":
+        import aiohttp
+
+        fronta: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        hotovo = asyncio.Event()
+        volno = asyncio.Semaphore(self.max_stranek)
+        self.navstivene.add(self.start_url)
+        self._vloz(fronta, self.start_url, 0)
+
+        # Jeden pool spojení pro celý crawl; limity odpovídají počtu korutin
+        connector = aiohttp.TCPConnector(limit=self.soubeznost, limit_per_host=self.max_na_host)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        start = time.perf_counter()
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            workeri = [asyncio.create_task(self.worker(i, session, fronta, volno, hotovo))
+                       for i in range(self.soubeznost)]
+            # Konec nastane, když je fronta zpracovaná, nebo když je staženo max_stranek.
+            # V tu chvíli už žádná stránka není rozpracovaná (všechna místa jsou spotřebovaná),
+            # takže zrušení korutin nic nezahodí.
+            cekani_fronta = asyncio.create_task(fronta.join())
+            cekani_limit = asyncio.create_task(hotovo.wait())
+            await asyncio.wait([cekani_fronta, cekani_limit], return_when=asyncio.FIRST_COMPLETED)
+            for uloha in workeri + [cekani_fronta, cekani_limit]:
+                uloha.cancel()
+            await asyncio.gather(*workeri, cekani_fronta, cekani_limit, return_exceptions=True)
+        self.doba = time.perf_counter() - start
+        return self
+
+    def spust(self) -> "AsyncCrawler":
+        try:
+            return asyncio.run(self.crawluj())
+        except KeyboardInterrupt:
+            print("Ukončování...")
+            return self
+
+    @property
+    def stranek_za_sekundu(self) -> float:
+        return self.stazeno / self.doba if self.doba else 0.0
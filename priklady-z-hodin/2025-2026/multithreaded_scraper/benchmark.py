@@ -0,0 +1,70 @@
+"""
+Benchmark crawleru proti lokálnímu syntetickému webu.
+
+Porovnává režim s vlákny (crawler.Crawler) a asyncio režim
+(async_crawler.AsyncCrawler) při různé souběžnosti.
+
+Použití:
+    python benchmark.py --stranek 100000 --rezim vlakna async --soubeznost 10 100 1000
+    python benchmark.py --stranek 20000 --parser regex --procesy 4
+"""
+
+import argparse
+
+from crawler import Crawler
+from async_crawler import AsyncCrawler
+from parsovani import EXTRAKTORY, vytvor_pool
+from testovaci_server import SyntetickyWeb, spust_server_v_procesu
+
+
+def vytvor_crawler(rezim: str, start_url: str, soubeznost: int, max_stranek: int,
+                   extrahuj_odkazy, executor):
+    if rezim == "vlakna":
+        return Crawler(start_url, pocet_vlaken=soubeznost, max_stranek=max_stranek,
+                       extrahuj_odkazy=extrahuj_odkazy, executor=executor)
+    return AsyncCrawler(start_url, soubeznost=soubeznost, max_na_host=soubeznost,
+                        max_stranek=max_stranek, extrahuj_odkazy=extrahuj_odkazy,
+                        executor=executor)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark crawleru (stránky za sekundu).")
+    parser.add_argument("--stranek", type=int, default=100_000, help="Velikost syntetického webu")
+    parser.add_argument("--max-stranek", type=int, default=None,
+                        help="Kolik stránek stáhnout (výchozí: celý web)")
+    parser.add_argument("--rezim", nargs="+", choices=["vlakna", "async"], default=["vlakna", "async"])
+    parser.add_argument("--soubeznost", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--parser", choices=list(EXTRAKTORY), default="bs4",
+                        help="Extraktor odkazů (viz parsovani.py)")
+    parser.add_argument("--procesy", type=int, default=0,
+                        help="Počet procesů pro parsování (0 = parsovat ve stahovacím vlákně)")
+    args = parser.parse_args()
+    max_stranek = args.max_stranek or args.stranek
+
+    proces, start_url = spust_server_v_procesu(SyntetickyWeb(args.stranek))
+    executor = vytvor_pool(args.procesy) if args.procesy else None
+    vysledky = []
+    try:
+        for soubeznost in args.soubeznost:
+            for rezim in args.rezim:
+                print(f"Crawluji {max_stranek} stránek, režim {rezim}, souběžnost {soubeznost}...")
+                crawler = vytvor_crawler(rezim, start_url, soubeznost, max_stranek,
+                                         EXTRAKTORY[args.parser], executor).spust()
+                vysledky.append((rezim, soubeznost, crawler))
+                if len(crawler.navstivene) < min(max_stranek, args.stranek):
+                    print("CHYBA: Crawler nenašel všechny stránky webu!")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        proces.terminate()
+        proces.join()
+
+    print()
+    print(f"{'Režim':<8} {'Souběžnost':>10} {'Staženo':>9} {'Chyby':>6} {'Čas [s]':>8} {'Stránek/s':>10}")
+    for rezim, soubeznost, crawler in vysledky:
+        print(f"{rezim:<8} {soubeznost:>10} {crawler.stazeno:>9} {crawler.chyby:>6} "
+              f"{crawler.doba:>8.2f} {crawler.stranek_za_sekundu:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark HTTP cache: první crawl se studenou cache vs. opakovaný crawl.
+
+Mezi crawly se server restartuje s novou verzí webu, ve které se změnilo
+`podil_zmenenych` stránek a část stránek neposílá ETag/Last-Modified
+(u nich cache pozná beze změny podle otisku obsahu).
+
+Použití:  python benchmark_cache.py [pocet_stranek] [podil_zmenenych] [podil_bez_validatoru]
+"""
+
+import os
+import sys
+import tempfile
+
+from cache import HttpCache
+from crawler import Crawler
+from testovaci_server import SyntetickyWeb, spust_server_v_procesu
+
+
+def crawl(web: SyntetickyWeb, port: int, cesta_cache: str, popis: str):
+    proces, start_url = spust_server_v_procesu(web, port)
+    try:
+        with HttpCache(cesta_cache) as cache:
+            crawler = Crawler(start_url, pocet_vlaken=8, max_stranek=web.pocet_stranek,
+                              cache=cache).spust()
+    finally:
+        proces.terminate()
+        proces.join()
+    print(f"{popis:<22} {crawler.stazeno:>8} {crawler.doba:>8.2f} {cache.prijato_bajtu / 1e6:>10.2f} "
+          f"{cache.odpovedi_304:>6} {cache.stejny_otisk:>8} {cache.parsovano:>10}")
+    return crawler
+
+
+def main():
+    pocet_stranek = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    podil_zmenenych = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    podil_bez_validatoru = float(sys.argv[3]) if len(sys.argv) > 3 else 0.2
+
+    port = 8765
+    with tempfile.TemporaryDirectory() as adresar:
+        cesta_cache = os.path.join(adresar, "cache.db")
+        print(f"{'Crawl':<22} {'Stránek':>8} {'Čas [s]':>8} {'Staženo MB':>10} "
+              f"{'304':>6} {'Otisk':>8} {'Parsováno':>10}")
+        crawl(SyntetickyWeb(pocet_stranek, vypln=50, podil_bez_validatoru=podil_bez_validatoru),
+              port, cesta_cache, "1. studená cache")
+        crawl(SyntetickyWeb(pocet_stranek, vypln=50, verze=1, podil_zmenenych=podil_zmenenych,
+                            podil_bez_validatoru=podil_bez_validatoru),
+              port, cesta_cache, "2. opakovaný crawl")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark extrakce odkazů na lokálním korpusu stránek.
+
+Porovnává BeautifulSoup, html.parser po událostech a regex,
+každý jednou v hlavním procesu a jednou v ProcessPoolExecutor.
+
+Použití:  python benchmark_parsovani.py [pocet_stranek] [velikost_vyplne] [pocet_procesu]
+"""
+
+import os
+import sys
+import time
+
+from parsovani import EXTRAKTORY, vytvor_pool
+from testovaci_server import SyntetickyWeb
+
+HOST = "127.0.0.1:8000"
+
+
+def vytvor_korpus(pocet_stranek: int, vypln: int):
+    web = SyntetickyWeb(pocet_stranek, vypln=vypln)
+    return [(web.html(i, HOST).encode("utf-8"), f"http://{HOST}/stranka/{i}")
+            for i in range(pocet_stranek)]
+
+
+def zmer(nazev: str, funkce, korpus, pool=None):
+    data = [html for html, _ in korpus]
+    urls = [url for _, url in korpus]
+    start = time.perf_counter()
+    if pool is None:
+        vysledky = list(map(funkce, data, urls))
+    else:
+        vysledky = list(pool.map(funkce, data, urls, chunksize=16))
+    doba = time.perf_counter() - start
+    megabajty = sum(map(len, data)) / 1e6
+    print(f"{nazev:<22} {doba:>8.2f} s {len(korpus) / doba:>10.0f} stránek/s {megabajty / doba:>8.1f} MB/s")
+    return vysledky
+
+
+def main():
+    pocet_stranek = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    vypln = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    pocet_procesu = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+
+    korpus = vytvor_korpus(pocet_stranek, vypln)
+    print(f"Korpus: {pocet_stranek} stránek, {sum(len(h) for h, _ in korpus) / 1e6:.1f} MB, "
+          f"{pocet_procesu} procesů")
+
+    reference = None
+    with vytvor_pool(pocet_procesu) as pool:
+        for nazev, funkce in EXTRAKTORY.items():
+            for pool_nebo_nic, popis in ((None, "serial"), (pool, "procesy")):
+                vysledky = zmer(f"{nazev} ({popis})", funkce, korpus, pool_nebo_nic)
+                if reference is None:
+                    reference = vysledky
+                elif vysledky != reference:
+                    print(f"CHYBA: {nazev} vrací jiné odkazy než bs4!")
+
+
+if __name__ == "__main__":
+    main()
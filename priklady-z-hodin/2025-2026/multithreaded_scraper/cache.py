@@ -0,0 +1,105 @@
+"""
+HTTP cache pro opakované crawly.
+
+Pro každou URL si pamatuje ETag, Last-Modified, otisk obsahu (BLAKE2b)
+a odkazy, které na stránce byly. Při dalším crawlu:
+  * pošle podmíněný požadavek (If-None-Match / If-Modified-Since)
+    a na odpověď 304 Not Modified rovnou vrátí odkazy z cache,
+  * když server validátory nepodporuje a vrátí 200, porovná otisk obsahu
+    a při shodě přeskočí parsování.
+
+Opakovaný crawl převážně statického webu tak stojí zlomek dat i CPU.
+Cache je v SQLite, takže přežije mezi běhy.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    otisk BLOB NOT NULL,
+    odkazy TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def otisk_obsahu(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class HttpCache:
+    def __init__(self, cesta: str = ":memory:"):
+        self._spojeni = sqlite3.connect(cesta, check_same_thread=False)
+        self._spojeni.executescript(SCHEMA)
+        self._zamek = threading.Lock()
+        # Statistiky pro benchmark
+        self.prijato_bajtu = 0
+        self.odpovedi_304 = 0
+        self.stejny_otisk = 0
+        self.parsovano = 0
+
+    def _zaznam(self, url: str):
+        return self._spojeni.execute(
+            "SELECT etag, last_modified, otisk, odkazy FROM cache WHERE url = ?", (url,)).fetchone()
+
+    def hlavicky(self, url: str) -> dict:
+        """Hlavičky podmíněného požadavku pro URL (prázdné, pokud ji neznáme)."""
+        with self._zamek:
+            zaznam = self._zaznam(url)
+        hlavicky = {}
+        if zaznam is not None:
+            etag, last_modified, _, _ = zaznam
+            if etag:
+                hlavicky["If-None-Match"] = etag
+            if last_modified:
+                hlavicky["If-Modified-Since"] = last_modified
+        return hlavicky
+
+    def odkazy_beze_zmeny(self, url: str, status: int, hlavicky, data: bytes):
+        """
+        Vrátí odkazy z cache, pokud se stránka nezměnila (304, nebo 200 se
+        stejným otiskem). Jinak None - stránku je potřeba naparsovat.
+        """
+        with self._zamek:
+            self.prijato_bajtu += len(data)
+            zaznam = self._zaznam(url)
+            if zaznam is None:
+                return None
+            if status == 304:
+                self.odpovedi_304 += 1
+                return json.loads(zaznam[3])
+            if status == 200 and zaznam[2] == otisk_obsahu(data):
+                self.stejny_otisk += 1
+                self._spojeni.execute(
+                    "UPDATE cache SET etag = ?, last_modified = ? WHERE url = ?",
+                    (hlavicky.get("ETag"), hlavicky.get("Last-Modified"), url))
+                return json.loads(zaznam[3])
+            return None
+
+    def uloz(self, url: str, hlavicky, data: bytes, odkazy: list) -> None:
+        """Uloží nově naparsovanou stránku."""
+        with self._zamek:
+            self.parsovano += 1
+            self._spojeni.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (url, hlavicky.get("ETag"), hlavicky.get("Last-Modified"),
+                 otisk_obsahu(data), json.dumps(odkazy)))
+
+    def uloz_na_disk(self) -> None:
+        with self._zamek:
+            self._spojeni.commit()
+
+    def zavri(self) -> None:
+        self.uloz_na_disk()
+        self._spojeni.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
@@ -0,0 +1,355 @@
+"""
+Crawler engine pro multithreaded_scraper.
+
+Oproti main.py řeší tři úzká hrdla:
+  * navštívené URL jsou v "lock-striped" množině - N shardů, každý s vlastním
+    zámkem, takže vlákna na sebe nečekají u jednoho globálního zámku,
+  * URL se před kontrolou normalizují (kanonický tvar), takže
+    "HTTP://Web.cz:80/a/../b#x" a "http://web.cz/b" jsou jedna stránka,
+  * fronta je prioritní (menší hloubka = dřív) a hlídá zdvořilost
+    (minimální rozestup mezi dvěma požadavky na stejný host).
+"""
+
+import heapq
+import itertools
+import re
+import threading
+import time
+from urllib.parse import urljoin, urlsplit, urlunsplit, quote
+
+VYCHOZI_PORTY = {"http": 80, "https": 443}
+BEZPECNE_ZNAKY_CESTY = "/:@!$&'()*+,;=-._~%"
+BEZPECNE_ZNAKY_DOTAZU = BEZPECNE_ZNAKY_CESTY + "?"
+NEREZERVOVANE = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+PROCENTA = re.compile(r"%([0-9A-Fa-f]{2})")
+
+
+def _odstran_tecky(cesta: str) -> str:
+    """Odstraní segmenty '.' a '..' z cesty (RFC 3986, sekce 5.2.4)."""
+    vystup = []
+    for segment in cesta.split("/"):
+        if segment == "..":
+            if len(vystup) > 1:
+                vystup.pop()
+        elif segment != ".":
+            vystup.append(segment)
+    if cesta.endswith(("/.", "/..")):
+        vystup.append("")
+    vysledek = "/".join(vystup)
+    return vysledek if vysledek.startswith("/") else "/" + vysledek
+
+
+def _normalizuj_procenta(text: str, bezpecne: str) -> str:
+    """
+    Procentové kódování podle RFC 3986, sekce 6.2.2: %XX nerezervovaných znaků
+    dekóduje (%7E -> ~), ostatní jen převede na velká písmena (%2f -> %2F)
+    a nepovolené znaky (mezera, diakritika) zakóduje. Rezervované znaky se
+    nedekódují - "/a%2Fb" a "/a/b" jsou dvě různé adresy.
+    """
+    def dekoduj(shoda: re.Match) -> str:
+        znak = chr(int(shoda.group(1), 16))
+        return znak if znak in NEREZERVOVANE else shoda.group(0).upper()
+    return quote(PROCENTA.sub(dekoduj, text), safe=bezpecne)
+
+
+def normalizuj_url(url: str) -> str:
+    """Vrátí kanonický tvar URL (malé schéma a host, bez výchozího portu,
+    bez fragmentu, bez '.'/'..', seřazené parametry dotazu).
+    Neplatná URL (např. port mimo rozsah) vyhodí ValueError."""
+    casti = urlsplit(url)
+    schema = casti.scheme.lower()
+    host = (casti.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 adresa - hostname vrací bez hranatých závorek
+    port = casti.port  # ValueError pro port mimo 0-65535 nebo nečíselný
+    netloc = host if port is None or VYCHOZI_PORTY.get(schema) == port else f"{host}:{port}"
+    # Nejdřív procenta (%2E je "."), pak tečkové segmenty - pořadí podle RFC 3986
+    cesta = _odstran_tecky(_normalizuj_procenta(casti.path or "/", BEZPECNE_ZNAKY_CESTY))
+    # Parametry řadíme jako celé řetězce - "?flag" zůstane "flag", ne "flag="
+    parametry = [_normalizuj_procenta(p, BEZPECNE_ZNAKY_DOTAZU) for p in casti.query.split("&") if p]
+    return urlunsplit((schema, netloc, cesta, "&".join(sorted(parametry)), ""))
+
+
+def netloc_url(url: str) -> str:
+    """Host (a případně port) z již normalizované URL."""
+    return urlsplit(url).netloc
+
+
+class ShardovanaMnozina:
+    """Množina rozdělená na shardy, každý shard má vlastní zámek."""
+
+    def __init__(self, pocet_shardu: int = 64):
+        self._shardy = [set() for _ in range(pocet_shardu)]
+        self._zamky = [threading.Lock() for _ in range(pocet_shardu)]
+
+    def pridej(self, prvek: str) -> bool:
+        """Atomicky přidá prvek. Vrací True, pokud v množině ještě nebyl."""
+        i = hash(prvek) % len(self._shardy)
+        with self._zamky[i]:
+            if prvek in self._shardy[i]:
+                return False
+            self._shardy[i].add(prvek)
+            return True
+
+    def __contains__(self, prvek: str) -> bool:
+        i = hash(prvek) % len(self._shardy)
+        with self._zamky[i]:
+            return prvek in self._shardy[i]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shardy)
+
+    def __iter__(self):
+        for i, shard in enumerate(self._shardy):
+            with self._zamky[i]:
+                kopie = list(shard)
+            yield from kopie
+
+
+class Fronta:
+    """
+    Prioritní fronta URL se zdvořilostí vůči hostům.
+
+    Každý host má vlastní haldu (priorita, pořadí, url). Hosty, které mají
+    co nabídnout, jsou v haldě `_pripravene` seřazené podle času, kdy na ně
+    smíme znovu poslat požadavek.
+    """
+
+    def __init__(self, zpozdeni_na_host: float = 0.0):
+        self.zpozdeni_na_host = zpozdeni_na_host
+        self._podminka = threading.Condition()
+        self._hosty: dict[str, list] = {}
+        self._pripravene: list = []
+        # Hosty s prázdnou haldou: kdy na ně smíme znovu (když se vrátí nová URL)
+        self._dalsi_povoleny: dict[str, float] = {}
+        self._poradi = itertools.count()
+        self._nevyrizeno = 0
+        self._zavreno = False
+
+    def vloz(self, url: str, priorita: int = 0) -> None:
+        host = netloc_url(url)
+        with self._podminka:
+            if self._zavreno:
+                return
+            halda = self._hosty.get(host)
+            if halda is None:
+                halda = self._hosty[host] = []
+            if not halda:
+                povoleno_od = max(time.monotonic(), self._dalsi_povoleny.pop(host, 0.0))
+                heapq.heappush(self._pripravene, (povoleno_od, priorita, next(self._poradi), host))
+            heapq.heappush(halda, (priorita, next(self._poradi), url))
+            self._nevyrizeno += 1
+            self._podminka.notify()
+
+    def vezmi(self):
+        """
+        Vrátí (url, priorita), nebo None, když je fronta zavřená
+        nebo už není co zpracovat (fronta prázdná a nikdo nepracuje).
+        """
+        with self._podminka:
+            while True:
+                if self._zavreno or self._nevyrizeno == 0:
+                    return None
+                if not self._pripravene:
+                    self._podminka.wait()
+                    continue
+                povoleno_od = self._pripravene[0][0]
+                ted = time.monotonic()
+                if povoleno_od > ted:
+                    self._podminka.wait(povoleno_od - ted)
+                    continue
+                _, _, _, host = heapq.heappop(self._pripravene)
+                halda = self._hosty[host]
+                priorita, _, url = heapq.heappop(halda)
+                if halda:
+                    heapq.heappush(self._pripravene,
+                                   (ted + self.zpozdeni_na_host, halda[0][0], next(self._poradi), host))
+                else:
+                    del self._hosty[host]
+                    if len(self._dalsi_povoleny) > 1024:  # hosty s vypršelou pauzou zapomeneme
+                        self._dalsi_povoleny = {h: cas for h, cas in self._dalsi_povoleny.items() if cas > ted}
+                    self._dalsi_povoleny[host] = ted + self.zpozdeni_na_host
+                return url, priorita
+
+    def hotovo(self, url: str = None, stazeno: bool = True) -> None:
+        """Označí jednu URL vrácenou z vezmi() za zpracovanou.
+        (Parametry využívá jen perzistentní fronta v uloziste.py.)"""
+        with self._podminka:
+            self._nevyrizeno -= 1
+            if self._nevyrizeno == 0:
+                self._podminka.notify_all()
+
+    def zavri(self) -> None:
+        with self._podminka:
+            self._zavreno = True
+            self._podminka.notify_all()
+
+    def __len__(self) -> int:
+        with self._podminka:
+            return sum(len(halda) for halda in self._hosty.values())
+
+
+def get_links(html, base_url):
+    """Parsuje HTML (BeautifulSoup) a vrací seznam absolutních URL.
+    Přijímá str i surové bajty (kódování pozná BeautifulSoup sám)."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    return [urljoin(base_url, a_tag['href']) for a_tag in soup.find_all('a', href=True)]
+
+
+class Crawler:
+    """
+    Vícevláknový BFS crawler. Stahuje jen stránky ze stejné domény
+    jako start_url a skončí po max_stranek stažených stránkách.
+
+    Pokud je zadán `executor` (např. parsovani.vytvor_pool()), odkazy se
+    z HTML extrahují v něm a stahovací vlákna mezitím nedrží GIL.
+
+    Pokud je zadáno `uloziste` (uloziste.UlozisteCrawlu), navštívené URL
+    i fronta jsou na disku a přerušený crawl lze znovu spustit a dokončit.
+
+    Pokud je zadána `cache` (cache.HttpCache), posílají se podmíněné
+    požadavky a nezměněné stránky se znovu neparsují.
+    """
+
+    def __init__(self, start_url: str, pocet_vlaken: int = 4, max_stranek: int = 50,
+                 zpozdeni_na_host: float = 0.0, timeout: float = 5.0,
+                 extrahuj_odkazy=get_links, executor=None, uloziste=None,
+                 cache=None, vypisuj: bool = False):
+        self.start_url = normalizuj_url(start_url)
+        self.domena = netloc_url(self.start_url)
+        self.pocet_vlaken = pocet_vlaken
+        self.max_stranek = max_stranek
+        self.timeout = timeout
+        self.extrahuj_odkazy = extrahuj_odkazy
+        self.executor = executor
+        self.cache = cache
+        self.vypisuj = vypisuj
+
+        self.uloziste = uloziste
+        if uloziste is None:
+            self.navstivene = ShardovanaMnozina()
+            self.fronta = Fronta(zpozdeni_na_host)
+            self.stazeno = 0
+        else:
+            self.navstivene = uloziste.navstivene
+            self.fronta = uloziste.fronta
+            self.stazeno = uloziste.stazeno
+        self.chyby = 0
+        self.doba = 0.0
+        self._zamek_pocitadel = threading.Lock()
+        self._lokalni = threading.local()
+
+    def _session(self):
+        # Každé vlákno má vlastní Session => znovupoužití TCP spojení (keep-alive)
+        session = getattr(self._lokalni, "session", None)
+        if session is None:
+            import requests
+            session = self._lokalni.session = requests.Session()
+        return session
+
+    def stahni(self, url: str, hlavicky: dict = None):
+        """Stáhne stránku. Vrací (status, hlavičky odpovědi, surové bajty)."""
+        response = self._session().get(url, timeout=self.timeout, headers=hlavicky)
+        return response.status_code, response.headers, response.content
+
+    def stahni_odkazy(self, url: str):
+        """Stáhne stránku a vrátí odkazy na ní, nebo None při chybě."""
+        hlavicky = self.cache.hlavicky(url) if self.cache is not None else None
+        status, hlavicky_odpovedi, data = self.stahni(url, hlavicky)
+        if self.cache is not None:
+            odkazy = self.cache.odkazy_beze_zmeny(url, status, hlavicky_odpovedi, data)
+            if odkazy is not None:
+                return odkazy
+        if status != 200:
+            return None
+        odkazy = self.najdi_odkazy(data, url)
+        if self.cache is not None:
+            self.cache.uloz(url, hlavicky_odpovedi, data, odkazy)
+        return odkazy
+
+    def najdi_odkazy(self, html, url: str) -> list:
+        if self.executor is None:
+            return self.extrahuj_odkazy(html, url)
+        return self.executor.submit(self.extrahuj_odkazy, html, url).result()
+
+    def pridej_odkazy(self, odkazy: list, hloubka: int) -> int:
+        """Přidá nové odkazy ze stránky do fronty. Vrací počet nových."""
+        pocet_novych = 0
+        for odkaz in odkazy:
+            if not odkaz.startswith(("http://", "https://")):
+                continue
+            try:
+                odkaz = normalizuj_url(odkaz)
+            except ValueError:
+                continue  # neplatný odkaz (např. port 99999) - ostatní odkazy stránky platí
+            if netloc_url(odkaz) == self.domena and self.navstivene.pridej(odkaz):
+                self.fronta.vloz(odkaz, hloubka + 1)
+                pocet_novych += 1
+        return pocet_novych
+
+    def _rezervuj_stranku(self) -> bool:
+        with self._zamek_pocitadel:
+            if self.stazeno >= self.max_stranek:
+                return False
+            self.stazeno += 1
+            return True
+
+    def worker(self, thread_id: int) -> None:
+        while True:
+            polozka = self.fronta.vezmi()
+            if polozka is None:
+                return
+            url, hloubka = polozka
+            stazeno = True
+            try:
+                if not self._rezervuj_stranku():
+                    self.fronta.zavri()
+                    stazeno = False
+                    continue
+                odkazy = self.stahni_odkazy(url)
+                if odkazy is None:
+                    with self._zamek_pocitadel:
+                        self.chyby += 1
+                    continue
+                pocet_novych = self.pridej_odkazy(odkazy, hloubka)
+                if self.vypisuj:
+                    print(f"[Vlákno {thread_id}] {url}: {pocet_novych} nových odkazů")
+            except Exception as e:
+                with self._zamek_pocitadel:
+                    self.chyby += 1
+                if self.vypisuj:
+                    print(f"[Vlákno {thread_id}] Chyba při zpracování {url}: {e}")
+            finally:
+                self.fronta.hotovo(url, stazeno)
+
+    def spust(self) -> "Crawler":
+        if self.uloziste is None or self.uloziste.je_nove():
+            self.navstivene.pridej(self.start_url)
+            self.fronta.vloz(self.start_url, 0)
+        elif self.vypisuj:
+            print(f"Pokračuji v crawlu: {self.stazeno} stránek hotovo, {len(self.fronta)} ve frontě.")
+
+        start = time.perf_counter()
+        vlakna = [threading.Thread(target=self.worker, args=(i,), daemon=True)
+                  for i in range(self.pocet_vlaken)]
+        for t in vlakna:
+            t.start()
+        try:
+            for t in vlakna:
+                while t.is_alive():
+                    t.join(0.5)
+        except KeyboardInterrupt:
+            print("Ukončování...")
+            self.fronta.zavri()
+            for t in vlakna:
+                t.join()
+        if self.uloziste is not None:
+            self.uloziste.checkpoint()
+        self.doba = time.perf_counter() - start
+        return self
+
+    @property
+    def stranek_za_sekundu(self) -> float:
+        return self.stazeno / self.doba if self.doba else 0.0
@@ -1,3 +1,4 @@
+import argparse
 import threading
 import queue
 import requests
@@ -8,6 +9,7 @@ import time
 START_URL = "https://www.scrapethissite.com/pages/"
 NUM_THREADS = 4
 MAX_PAGES = 50
+START_NETLOC = urlparse(START_URL).netloc
 
 url_queue = queue.Queue()
 visited_urls = set()
@@ -70,7 +72,7 @@ def worker(thread_id):
                 count_new = 0
                 with visited_lock:
                     for link in links:
-                        if link not in visited_urls and urlparse(link).netloc == urlparse(START_URL).netloc:
+                        if link not in visited_urls and urlparse(link).netloc == START_NETLOC:
                             url_queue.put(link)
                             count_new += 1
 
@@ -89,7 +91,7 @@ def worker(thread_id):
             url_queue.task_done()
 
 
-if __name__ == "__main__":
+def main():
     url_queue.put(START_URL)
 
     threads = []
@@ -116,3 +118,26 @@ if __name__ == "__main__":
     print(f"Hotovo. Navštíveno {len(visited_urls)} stránek.")
     for url in visited_urls:
         print(url)
+
+
+def main_s_ulozistem(cesta):
+    """Stejný crawl pomocí enginu z crawler.py se stavem na disku.
+    Po přerušení (Ctrl+C, pád) stačí spustit znovu se stejným souborem."""
+    from crawler import Crawler
+    from uloziste import UlozisteCrawlu
+
+    with UlozisteCrawlu(cesta) as uloziste:
+        crawler = Crawler(START_URL, pocet_vlaken=NUM_THREADS, max_stranek=MAX_PAGES,
+                          uloziste=uloziste, vypisuj=True).spust()
+        print(f"Hotovo. Staženo {crawler.stazeno} stránek, {len(uloziste.fronta)} URL čeká ve frontě.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vícevláknový scraper.")
+    parser.add_argument("--stav", metavar="SOUBOR",
+                        help="SQLite soubor se stavem crawlu (umožní navázat na přerušený crawl)")
+    args = parser.parse_args()
+    if args.stav:
+        main_s_ulozistem(args.stav)
+    else:
+        main()
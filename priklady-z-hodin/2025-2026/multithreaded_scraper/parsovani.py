@@ -0,0 +1,73 @@
+"""
+Extrakce odkazů z HTML.
+
+Parsování HTML je CPU bound. Ve vláknech kvůli GIL neběží paralelně,
+takže při velkých stránkách brzdí celý crawler. Řešení:
+  * rychlé extraktory, které nestaví strom dokumentu (regex, html.parser po událostech),
+  * parsování v ProcessPoolExecutor - stahovací vlákna/korutiny předají
+    surové bajty procesům a zpátky dostanou jen seznam odkazů.
+
+Všechny funkce mají stejný podpis (data, base_url) -> list[str],
+kde data jsou bajty (nebo str) stránky. Jsou definované na úrovni modulu,
+aby šly předat do jiného procesu (pickle).
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from crawler import get_links
+
+HREF_VZOR = re.compile(rb"""<a\s[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+
+def _text(data) -> str:
+    return data.decode("utf-8", errors="replace") if isinstance(data, (bytes, bytearray)) else data
+
+
+def regex_odkazy(data, base_url):
+    """Nejrychlejší varianta: jeden regulární výraz přes bajty, bez parsování."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    odkazy = []
+    for shoda in HREF_VZOR.finditer(data):
+        href = shoda.group(1) or shoda.group(2) or shoda.group(3) or b""
+        odkazy.append(urljoin(base_url, href.decode("utf-8", errors="replace")))
+    return odkazy
+
+
+class OdkazyParser(HTMLParser):
+    """Parser řízený událostmi - jen si zapamatuje href u každého <a>."""
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=False)
+        self.base_url = base_url
+        self.odkazy = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            for nazev, hodnota in attrs:
+                if nazev == "href" and hodnota is not None:
+                    self.odkazy.append(urljoin(self.base_url, hodnota))
+                    break
+
+
+def htmlparser_odkazy(data, base_url):
+    """Robustnější než regex (entity, komentáře), pořád bez stromu dokumentu."""
+    parser = OdkazyParser(base_url)
+    parser.feed(_text(data))
+    parser.close()
+    return parser.odkazy
+
+
+EXTRAKTORY = {
+    "bs4": get_links,
+    "htmlparser": htmlparser_odkazy,
+    "regex": regex_odkazy,
+}
+
+
+def vytvor_pool(pocet_procesu: int | None = None) -> ProcessPoolExecutor:
+    """Pool procesů pro parsování. Předejte ho crawleru jako `executor`."""
+    return ProcessPoolExecutor(max_workers=pocet_procesu)
@@ -0,0 +1,152 @@
+"""
+Lokální HTTP server se syntetickým webem pro testování crawleru.
+
+Stránka /stranka/<i> odkazuje na své "děti" i*V+1 .. i*V+V (strom s větvením V),
+zpět na rodiče a na úvodní stránku. Některé odkazy jsou schválně zapsané
+různě (fragment, velká písmena v hostu, relativní cesta s '..'), aby se
+ověřila normalizace URL - web má tedy přesně `pocet_stranek` unikátních stránek.
+
+Server podporuje podmíněné požadavky (ETag, Last-Modified -> 304 Not Modified).
+Parametrem `verze` a `podil_zmenenych` lze nasimulovat, že se část stránek
+změnila, a `podil_bez_validatoru` určuje stránky, které validátory neposílají.
+
+Spuštění samostatně:  python testovaci_server.py 100000
+"""
+
+import multiprocessing
+import sys
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ZAKLADNI_CAS = 1_700_000_000  # "datum vydání" webu (Unix time)
+
+
+class SyntetickyWeb:
+    def __init__(self, pocet_stranek: int = 100_000, vetveni: int = 10, vypln: int = 0,
+                 verze: int = 0, podil_zmenenych: float = 0.0, podil_bez_validatoru: float = 0.0):
+        self.pocet_stranek = pocet_stranek
+        self.vetveni = vetveni
+        self.verze = verze
+        self.podil_zmenenych = podil_zmenenych
+        self.podil_bez_validatoru = podil_bez_validatoru
+        # Volitelný text navíc, aby šlo simulovat větší stránky
+        self.vypln = "<p>" + "Lorem ipsum dolor sit amet. " * vypln + "</p>" if vypln else ""
+
+    def verze_stranky(self, i: int) -> int:
+        return self.verze if i % 100 < self.podil_zmenenych * 100 else 0
+
+    def validatory(self, i: int):
+        """Vrátí (ETag, Last-Modified) stránky, nebo None, pokud je neposílá."""
+        if (i * 7) % 100 < self.podil_bez_validatoru * 100:
+            return None
+        verze = self.verze_stranky(i)
+        return f'"{i}-{verze}"', formatdate(ZAKLADNI_CAS + verze * 3600, usegmt=True)
+
+    def html(self, i: int, host: str) -> str:
+        odkazy = [f'<a href="/stranka/{i}#obsah">Tato stránka</a>',
+                  '<a href="/stranka/0">Úvod</a>']
+        if i > 0:
+            rodic = (i - 1) // self.vetveni
+            odkazy.append(f'<a href="http://{host.upper()}/stranka/{rodic}">Rodič</a>')
+        for dite in range(i * self.vetveni + 1, min((i + 1) * self.vetveni + 1, self.pocet_stranek)):
+            odkazy.append(f'<a href="../stranka/./{dite}">Stránka {dite}</a>')
+        odkazy.append('<a href="mailto:info@example.com">Kontakt</a>')
+        return (f"<html><head><title>Stránka {i}</title></head><body>"
+                f"<h1>Stránka {i}</h1><p>Verze {self.verze_stranky(i)}</p>{self.vypln}<ul><li>"
+                + "</li><li>".join(odkazy) + "</li></ul></body></html>")
+
+
+def vytvor_handler(web: SyntetickyWeb):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        disable_nagle_algorithm = True  # hlavička a tělo jdou zvlášť, bez toho čeká ~40 ms
+
+        def do_GET(self):
+            cesta = self.path.split("?", 1)[0]
+            try:
+                prefix, cislo = cesta.rsplit("/", 1)
+                i = int(cislo) if prefix == "/stranka" else -1
+            except ValueError:
+                i = -1
+            if cesta == "/":
+                i = 0
+            if not 0 <= i < web.pocet_stranek:
+                self.posli(404, b"Nenalezeno")
+                return
+            validatory = web.validatory(i)
+            if validatory is not None and self.nezmeneno(*validatory):
+                self.send_response(304)
+                self.send_header("ETag", validatory[0])
+                self.send_header("Last-Modified", validatory[1])
+                self.end_headers()
+                return
+            self.posli(200, web.html(i, self.headers.get("Host", "")).encode("utf-8"), validatory)
+
+        def nezmeneno(self, etag: str, last_modified: str) -> bool:
+            if "If-None-Match" in self.headers:
+                return self.headers["If-None-Match"] == etag
+            if "If-Modified-Since" in self.headers:
+                try:
+                    return parsedate_to_datetime(self.headers["If-Modified-Since"]) >= \
+                        parsedate_to_datetime(last_modified)
+                except (TypeError, ValueError):
+                    return False
+            return False
+
+        def posli(self, kod: int, telo: bytes, validatory=None):
+            self.send_response(kod)
+            if validatory is not None:
+                self.send_header("ETag", validatory[0])
+                self.send_header("Last-Modified", validatory[1])
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(telo)))
+            self.end_headers()
+            self.wfile.write(telo)
+
+        def log_message(self, format, *args):
+            pass  # Bez výpisu každého požadavku
+
+    return Handler
+
+
+class TestovaciServer(ThreadingHTTPServer):
+    # Výchozí fronta příchozích spojení (5) nestačí pro stovky souběžných klientů
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def spust_server(web: SyntetickyWeb, port: int = 0):
+    """Spustí server ve vlákně na pozadí. Vrací (server, url úvodní stránky)."""
+    server = TestovaciServer(("127.0.0.1", port), vytvor_handler(web))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/stranka/0"
+
+
+
+def _beh_serveru(web: SyntetickyWeb, spojeni, port: int) -> None:
+    server = TestovaciServer(("127.0.0.1", port), vytvor_handler(web))
+    spojeni.send(server.server_address[1])
+    server.serve_forever()
+
+
+def spust_server_v_procesu(web: SyntetickyWeb, port: int = 0):
+    """
+    Spustí server v samostatném procesu, aby se s crawlerem nepřetahoval o GIL.
+    Vrací (proces, url úvodní stránky); proces ukončete pomocí terminate().
+    """
+    rodic, potomek = multiprocessing.Pipe()
+    proces = multiprocessing.Process(target=_beh_serveru, args=(web, potomek, port), daemon=True)
+    proces.start()
+    port = rodic.recv()
+    return proces, f"http://127.0.0.1:{port}/stranka/0"
+
+
+if __name__ == "__main__":
+    pocet = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    server = TestovaciServer(("127.0.0.1", 8000), vytvor_handler(SyntetickyWeb(pocet)))
+    print(f"Syntetický web ({pocet} stránek) běží na http://127.0.0.1:8000/stranka/0")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,217 @@
+"""
+Perzistentní stav crawlu v SQLite.
+
+V main.py žijí visited_urls a url_queue jen v paměti - pád nebo Ctrl+C
+znamená začít znovu a crawl větší než RAM není možný. Tady je:
+  * tabulka `navstivene` - append-only log navštívených URL (jen INSERT,
+    nikdy UPDATE/DELETE), duplicity hlídá primární klíč,
+  * tabulka `fronta` - frontier na disku, rozpracované URL mají stav=1,
+  * tabulka `meta` - počítadla (kolik stránek je hotovo).
+
+Zápisy se dávkují do transakcí a potvrzují se při checkpointu (každých
+N operací nebo T sekund), navštívené URL i fronta vždy ve stejné transakci,
+takže po pádu je stav konzistentní. V paměti je jen rozpracovaná transakce,
+takže crawl zvládne i miliony URL.
+
+Po obnovení se rozpracované URL (stav=1) vrátí zpět do fronty a stáhnou
+se znovu - raději dvakrát než vůbec.
+"""
+
+import sqlite3
+import threading
+import time
+
+from crawler import netloc_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS navstivene (url TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fronta (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    priorita INTEGER NOT NULL,
+    host TEXT NOT NULL,
+    url TEXT NOT NULL,
+    stav INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS fronta_poradi ON fronta (stav, priorita, id);
+CREATE TABLE IF NOT EXISTS meta (klic TEXT PRIMARY KEY, hodnota INTEGER NOT NULL);
+"""
+
+
+class UlozisteCrawlu:
+    def __init__(self, cesta: str, zpozdeni_na_host: float = 0.0,
+                 checkpoint_operaci: int = 1000, checkpoint_sekund: float = 5.0):
+        self.cesta = cesta
+        self.checkpoint_operaci = checkpoint_operaci
+        self.checkpoint_sekund = checkpoint_sekund
+        self._spojeni = sqlite3.connect(cesta, check_same_thread=False, isolation_level=None)
+        self._spojeni.execute("PRAGMA journal_mode=WAL")
+        self._spojeni.execute("PRAGMA synchronous=NORMAL")
+        self._spojeni.executescript(SCHEMA)
+        self._podminka = threading.Condition()
+        self._operaci = 0
+        self._posledni_checkpoint = time.monotonic()
+
+        # Rozpracované URL z minulého běhu vrátíme do fronty
+        self._spojeni.execute("UPDATE fronta SET stav = 0 WHERE stav = 1")
+        self.stazeno = self._nacti_meta("stazeno")
+        self._spojeni.execute("BEGIN")
+
+        self.navstivene = NavstiveneLog(self)
+        self.fronta = DiskovaFronta(self, zpozdeni_na_host)
+
+    def _nacti_meta(self, klic: str) -> int:
+        radek = self._spojeni.execute("SELECT hodnota FROM meta WHERE klic = ?", (klic,)).fetchone()
+        return radek[0] if radek else 0
+
+    def je_nove(self) -> bool:
+        """True, pokud úložiště ještě neobsahuje žádný crawl."""
+        with self._podminka:
+            return self._spojeni.execute("SELECT 1 FROM navstivene LIMIT 1").fetchone() is None
+
+    def _zapsano(self) -> None:
+        """Volá se pod zámkem po každé zápisové operaci."""
+        self._operaci += 1
+        if (self._operaci >= self.checkpoint_operaci
+                or time.monotonic() - self._posledni_checkpoint >= self.checkpoint_sekund):
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        self._spojeni.execute("INSERT OR REPLACE INTO meta VALUES ('stazeno', ?)", (self.stazeno,))
+        self._spojeni.execute("COMMIT")
+        self._spojeni.execute("BEGIN")
+        self._operaci = 0
+        self._posledni_checkpoint = time.monotonic()
+
+    def checkpoint(self) -> None:
+        """Potvrdí všechny dosavadní změny na disk."""
+        with self._podminka:
+            self._checkpoint()
+
+    def zavri(self) -> None:
+        with self._podminka:
+            self._checkpoint()
+            self._spojeni.execute("COMMIT")
+            self._spojeni.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.zavri()
+
+
+class NavstiveneLog:
+    """Append-only množina navštívených URL (stejné rozhraní jako ShardovanaMnozina)."""
+
+    def __init__(self, uloziste: UlozisteCrawlu):
+        self._u = uloziste
+
+    def pridej(self, url: str) -> bool:
+        with self._u._podminka:
+            kurzor = self._u._spojeni.execute("INSERT OR IGNORE INTO navstivene VALUES (?)", (url,))
+            if kurzor.rowcount == 0:
+                return False
+            self._u._zapsano()
+            return True
+
+    def __contains__(self, url: str) -> bool:
+        with self._u._podminka:
+            return self._u._spojeni.execute(
+                "SELECT 1 FROM navstivene WHERE url = ?", (url,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._u._podminka:
+            return self._u._spojeni.execute("SELECT COUNT(*) FROM navstivene").fetchone()[0]
+
+    def __iter__(self):
+        # Vlastní spojení, aby iterace neblokovala crawler
+        spojeni = sqlite3.connect(self._u.cesta)
+        try:
+            for (url,) in spojeni.execute("SELECT url FROM navstivene"):
+                yield url
+        finally:
+            spojeni.close()
+
+
+class DiskovaFronta:
+    """
+    Frontier na disku (stejné rozhraní jako crawler.Fronta).
+    Zdvořilost: host, na který jsme nedávno poslali požadavek, se přeskočí.
+    """
+
+    def __init__(self, uloziste: UlozisteCrawlu, zpozdeni_na_host: float = 0.0):
+        self._u = uloziste
+        self.zpozdeni_na_host = zpozdeni_na_host
+        self._dalsi_povoleny: dict[str, float] = {}
+        self._rozpracovane: dict[str, int] = {}  # url -> id řádku ve frontě
+        self._zavreno = False
+
+    def vloz(self, url: str, priorita: int = 0) -> None:
+        with self._u._podminka:
+            if self._zavreno:
+                return
+            self._u._spojeni.execute("INSERT INTO fronta (priorita, host, url) VALUES (?, ?, ?)",
+                                     (priorita, netloc_url(url), url))
+            self._u._zapsano()
+            self._u._podminka.notify()
+
+    def _vyber(self, ted: float):
+        # Hosty, kterým už zdvořilostní pauza vypršela, zapomeneme
+        self._dalsi_povoleny = {host: cas for host, cas in self._dalsi_povoleny.items() if cas > ted}
+        blokovane = list(self._dalsi_povoleny)
+        dotaz = "SELECT id, url, priorita, host FROM fronta WHERE stav = 0"
+        if blokovane:
+            dotaz += f" AND host NOT IN ({', '.join('?' * len(blokovane))})"
+        return self._u._spojeni.execute(dotaz + " ORDER BY priorita, id LIMIT 1", blokovane).fetchone()
+
+    def _ma_cekajici(self) -> bool:
+        return self._u._spojeni.execute("SELECT 1 FROM fronta WHERE stav = 0 LIMIT 1").fetchone() is not None
+
+    def vezmi(self):
+        """Vrátí (url, priorita), nebo None, když je fronta zavřená či vyčerpaná."""
+        spojeni = self._u._spojeni
+        with self._u._podminka:
+            while True:
+                if self._zavreno:
+                    return None
+                ted = time.monotonic()
+                radek = self._vyber(ted)
+                if radek is None:
+                    if not self._ma_cekajici():
+                        if not self._rozpracovane:
+                            self._u._podminka.notify_all()
+                            return None
+                        self._u._podminka.wait()
+                    else:
+                        self._u._podminka.wait(max(0.0, min(self._dalsi_povoleny.values()) - ted))
+                    continue
+                id_, url, priorita, host = radek
+                spojeni.execute("UPDATE fronta SET stav = 1 WHERE id = ?", (id_,))
+                self._dalsi_povoleny[host] = ted + self.zpozdeni_na_host
+                self._rozpracovane[url] = id_
+                self._u._zapsano()
+                return url, priorita
+
+    def hotovo(self, url: str = None, stazeno: bool = True) -> None:
+        """
+        Označí URL vrácenou z vezmi() za zpracovanou. Pokud stazeno=False
+        (crawl byl mezitím zastaven), URL zůstane ve frontě pro příští běh.
+        """
+        with self._u._podminka:
+            id_ = self._rozpracovane.pop(url)
+            if stazeno:
+                self._u._spojeni.execute("DELETE FROM fronta WHERE id = ?", (id_,))
+                self._u.stazeno += 1
+            else:
+                self._u._spojeni.execute("UPDATE fronta SET stav = 0 WHERE id = ?", (id_,))
+            self._u._zapsano()
+            self._u._podminka.notify_all()
+
+    def zavri(self) -> None:
+        with self._u._podminka:
+            self._zavreno = True
+            self._u._podminka.notify_all()
+
+    def __len__(self) -> int:
+        with self._u._podminka:
+            return self._u._spojeni.execute("SELECT COUNT(*) FROM fronta WHERE stav = 0").fetchone()[0]